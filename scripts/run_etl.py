@@ -2,27 +2,67 @@
 ETL pipeline runner script.
 Extracts data from CSV, transforms it, and loads into database.
 """
+import argparse
 import sys
 import os
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.etl.extract import extract_csv
+from src.etl.extract import extract_csv_chunks
 from src.etl.transform import clean_sales_data
-from src.etl.load import load_to_database
+from src.etl.load import (
+    load_to_database_parallel,
+    load_csv_server_side,
+    deferred_sales_indexes,
+    refresh_materialized_views
+)
+from src.database.connection import get_connection
+from src.utils.cache import clear_all_caches
+from src.config.constants import DB_COPY_WORKERS
 from src.config.settings import PathConfig
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger(__name__)
 
 
-def run_etl(csv_path):
+def load_csv_in_chunks(csv_path):
+    """
+    Extract, clean and load a CSV one chunk at a time.
+
+    The COPY connections are opened once and reused for every chunk, so
+    memory stays bounded by the chunk size rather than the file size. A
+    connection that drops mid-load (e.g. Neon closing an idle session) is
+    replaced and its share of the chunk retried once.
+
+    Args:
+        csv_path (str): Path to the CSV file
+
+    Returns:
+        int: Number of rows loaded
+    """
+    connections = [get_connection() for _ in range(DB_COPY_WORKERS)]
+    rows_inserted = 0
+
+    try:
+        for df in extract_csv_chunks(csv_path):
+            df_clean = clean_sales_data(df)
+            rows_inserted += load_to_database_parallel(df_clean, connections=connections)
+    finally:
+        for conn in connections:
+            conn.close()
+
+    return rows_inserted
+
+
+def run_etl(csv_path, server_side=False):
     """
     Run the complete ETL pipeline.
 
     Args:
         csv_path (str): Path to the CSV file
+        server_side (bool): Copy the raw CSV and clean it inside PostgreSQL
+            instead of cleaning with pandas first
 
     Returns:
         int: Number of rows loaded
@@ -35,14 +75,18 @@ def run_etl(csv_path):
     logger.info("=" * 70)
 
     try:
-        # Extract
-        df = extract_csv(csv_path)
-
-        # Transform
-        df_clean = clean_sales_data(df)
-
-        # Load
-        rows_inserted = load_to_database(df_clean)
+        if server_side:
+            # Extract, transform and load in one pass on the database server
+            with deferred_sales_indexes():
+                rows_inserted = load_csv_server_side(csv_path)
+        else:
+            # Extract, transform and load chunk by chunk
+            with deferred_sales_indexes():
+                rows_inserted = load_csv_in_chunks(csv_path)
+
+        # Refresh precomputed analytics
+        refresh_materialized_views()
+        clear_all_caches()
 
         logger.info("=" * 70)
         logger.info(f"ETL PIPELINE COMPLETE - {rows_inserted} rows loaded")
@@ -56,7 +100,12 @@ def run_etl(csv_path):
 
 
 if __name__ == "__main__":
-    csv_file = sys.argv[1] if len(sys.argv) > 1 else PathConfig.DEFAULT_CSV_FILE
-
-    logger.info(f"Using CSV file: {csv_file}")
-    run_etl(csv_file)
+    parser = argparse.ArgumentParser(description="Run the sales ETL pipeline")
+    parser.add_argument('csv_file', nargs='?', default=PathConfig.DEFAULT_CSV_FILE,
+                        help="Path to the CSV file")
+    parser.add_argument('--server-side', action='store_true',
+                        help="Clean the raw CSV inside PostgreSQL via a staging table")
+    args = parser.parse_args()
+
+    logger.info(f"Using CSV file: {args.csv_file}")
+    run_etl(args.csv_file, server_side=args.server_side)
@@ -20,10 +20,19 @@ CREATE TABLE IF NOT EXISTS users (
 );
 
 -- Create indexes for faster lookups
-CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
-CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
-CREATE INDEX IF NOT EXISTS idx_users_verification_token ON users(verification_token);
-CREATE INDEX IF NOT EXISTS idx_users_reset_token ON users(reset_password_token);
+-- email and username are already indexed by their UNIQUE constraints, so the
+-- earlier duplicate indexes on them are dropped
+DROP INDEX IF EXISTS idx_users_email;
+DROP INDEX IF EXISTS idx_users_username;
+
+-- Tokens are only set while a verification or reset is pending, so partial
+-- indexes cover just those rows
+DROP INDEX IF EXISTS idx_users_verification_token;
+DROP INDEX IF EXISTS idx_users_reset_token;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_pending_verification
+    ON users(verification_token) WHERE verification_token IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_pending_reset
+    ON users(reset_password_token) WHERE reset_password_token IS NOT NULL;
 
 -- Create trigger to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -52,14 +52,50 @@ FROM sales_transactions
 GROUP BY DATE_TRUNC('month', invoice_date)
 ORDER BY month;
 
--- Create index on materialized view
-CREATE INDEX IF NOT EXISTS idx_mv_monthly_month ON mv_monthly_sales(month);
+-- Create index on materialized view (unique, required for concurrent refresh)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_monthly_month ON mv_monthly_sales(month);
+
+-- Create a materialized view for per-customer totals used by customer analytics
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_customer_totals AS
+SELECT
+    customer_id,
+    SUM(total_amount) as total_spent,
+    COUNT(DISTINCT invoice_no) as order_count,
+    COUNT(*) as transaction_count
+FROM sales_transactions
+WHERE customer_id IS NOT NULL
+GROUP BY customer_id;
+
+-- Create indexes on customer totals view
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_customer_totals_customer ON mv_customer_totals(customer_id);
+CREATE INDEX IF NOT EXISTS idx_mv_customer_totals_spent ON mv_customer_totals(total_spent);
+CREATE INDEX IF NOT EXISTS idx_mv_customer_totals_bucket
+    ON mv_customer_totals(width_bucket(total_spent, ARRAY[500.0, 2000.0, 5000.0]));
+
+-- Create a materialized view for daily totals per country and product used by forecasting
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_sales AS
+SELECT
+    DATE(invoice_date) as sale_date,
+    country,
+    stock_code,
+    SUM(total_amount) as revenue,
+    SUM(quantity) as units,
+    COUNT(*) as transactions
+FROM sales_transactions
+GROUP BY DATE(invoice_date), country, stock_code;
+
+-- Create indexes on daily totals view
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_sales_key ON mv_daily_sales(sale_date, country, stock_code);
+CREATE INDEX IF NOT EXISTS idx_mv_daily_sales_product ON mv_daily_sales(stock_code, sale_date);
+CREATE INDEX IF NOT EXISTS idx_mv_daily_sales_country ON mv_daily_sales(country, sale_date);
 
 -- Function to refresh materialized views
 CREATE OR REPLACE FUNCTION refresh_materialized_views()
 RETURNS void AS $$
 BEGIN
     REFRESH MATERIALIZED VIEW CONCURRENTLY mv_monthly_sales;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_customer_totals;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_sales;
 END;
 $$ LANGUAGE plpgsql;
 
@@ -73,6 +109,6 @@ DO $$
 BEGIN
     RAISE NOTICE 'Sales Analytics Database initialized successfully';
     RAISE NOTICE 'Tables created: sales_transactions';
-    RAISE NOTICE 'Views created: v_sales_kpis, mv_monthly_sales';
+    RAISE NOTICE 'Views created: v_sales_kpis, mv_monthly_sales, mv_customer_totals, mv_daily_sales';
     RAISE NOTICE 'Indexes created for optimal query performance';
 END $$;
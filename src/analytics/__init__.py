@@ -5,6 +5,7 @@ from src.analytics.revenue import get_monthly_revenue, get_revenue_trend, get_mo
 from src.analytics.forecasting import (
     get_revenue_forecast,
     get_product_forecast,
+    get_multi_product_forecast,
     get_country_forecast,
     get_forecast_comparison,
     get_daily_revenue
@@ -17,6 +18,7 @@ __all__ = [
     'get_monthly_growth',
     'get_revenue_forecast',
     'get_product_forecast',
+    'get_multi_product_forecast',
     'get_country_forecast',
     'get_forecast_comparison',
     'get_daily_revenue'
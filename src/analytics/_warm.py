@@ -0,0 +1,83 @@
+"""
+Shared in-memory copy of the sales fact table for the dashboard views.
+
+The KPI, revenue, geographic and product views all aggregate the same rows,
+so they are computed with pandas from one cached frame rather than each
+scanning sales_transactions. The views cache their own results for the same
+FACT_CACHE_TTL, so clients polling them reuse the aggregates too.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+import pyarrow as pa
+from src.config.constants import FACT_CACHE_TTL
+from src.database.connection import fetch_arrow
+from src.utils.cache import ttl_cache
+
+# Text columns are dictionary-encoded so they arrive as categoricals, which
+# saves memory and speeds up groupby
+FACT_COLUMN_TYPES = {
+    'invoice_date': pa.timestamp('ns'),
+    'invoice_no': pa.dictionary(pa.int32(), pa.string()),
+    'customer_id': pa.int32(),
+    'description': pa.dictionary(pa.int32(), pa.string()),
+    'country': pa.dictionary(pa.int32(), pa.string()),
+    'stock_code': pa.dictionary(pa.int32(), pa.string()),
+    'quantity': pa.int64(),
+    'total_amount': pa.float64()
+}
+
+
+@ttl_cache(seconds=FACT_CACHE_TTL, copy=False)
+def load_fact():
+    """
+    Load the sales fact table with derived calendar columns.
+
+    The returned frame is shared by every caller until the cache expires and
+    must not be modified in place.
+
+    Returns:
+        pd.DataFrame: Fact rows sorted by invoice_date, with extra columns
+        'date' (day), 'month' (monthly period), 'hour' and 'dow' (0=Sunday,
+        matching PostgreSQL's EXTRACT(DOW))
+    """
+    table = fetch_arrow("""
+        SELECT invoice_date, invoice_no, customer_id, description,
+               country, stock_code, quantity, total_amount::float8
+        FROM sales_transactions
+    """, None, FACT_COLUMN_TYPES)
+
+    df = table.to_pandas()
+    df['customer_id'] = df['customer_id'].astype('Int32')
+
+    df = df.sort_values('invoice_date', ignore_index=True)
+
+    invoice_date = df['invoice_date'].dt
+    df['date'] = invoice_date.normalize()
+    df['month'] = invoice_date.to_period('M')
+    df['hour'] = invoice_date.hour.astype('int32')
+    df['dow'] = ((invoice_date.dayofweek + 1) % 7).astype('int32')
+    return df
+
+
+def round_like_numeric(values, decimals=2):
+    """
+    Round the way PostgreSQL's ROUND(x::numeric, n) does.
+
+    Halves round away from zero (12.625 -> 12.63, where np.round gives
+    12.62). Values are first taken to 15 significant digits, as the float8
+    to numeric cast does, so float noise does not decide the rounding.
+
+    Args:
+        values (np.ndarray): Values to round; NaN and inf pass through
+        decimals (int): Digits to keep after the decimal point
+
+    Returns:
+        np.ndarray: Rounded float64 values
+    """
+    quantum = Decimal(1).scaleb(-decimals)
+    return np.array([
+        float(Decimal(f"{value:.15g}").quantize(quantum, rounding=ROUND_HALF_UP))
+        if np.isfinite(value) else value
+        for value in np.asarray(values, dtype=np.float64)
+    ], dtype=np.float64)
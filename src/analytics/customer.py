@@ -2,9 +2,41 @@
 Customer analytics module for segmentation, CLV, and customer insights.
 """
 import pandas as pd
-from src.database.connection import get_connection
+from src.config.constants import DB_FETCH_SIZE, SPEND_SEGMENT_LABELS, SPEND_SEGMENT_NAMES
+from src.database.connection import pooled_connection
+from src.utils.cache import ttl_cache
 
 
+@ttl_cache(copy=False)
+def _segment_totals():
+    """
+    Aggregate customers per spend bucket in a single query.
+
+    The segment and lifetime value views both group mv_customer_totals by
+    the same buckets, so they share this result instead of each running a
+    query. The returned frame is shared and must not be modified in place.
+
+    Returns:
+        pd.DataFrame: DataFrame with columns ['bucket', 'customer_count', 'avg_clv', 'avg_orders', 'avg_order_value'], ordered by bucket
+    """
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        # Bucket expression matches idx_mv_customer_totals_bucket
+        cursor.execute("""
+            SELECT
+                width_bucket(total_spent, ARRAY[500.0, 2000.0, 5000.0]) as bucket,
+                COUNT(*) as customer_count,
+                ROUND(AVG(total_spent)::numeric, 2) as avg_clv,
+                ROUND(AVG(order_count)::numeric, 2) as avg_orders,
+                ROUND(AVG(total_spent / order_count)::numeric, 2) as avg_order_value
+            FROM mv_customer_totals
+            GROUP BY bucket
+            ORDER BY bucket
+        """)
+
+        return pd.DataFrame.from_records(cursor, columns=['bucket', 'customer_count', 'avg_clv', 'avg_orders', 'avg_order_value'], coerce_float=True)
+
+
+@ttl_cache()
 def get_customer_segments():
     """
     Get customer segmentation based on spending levels.
@@ -12,35 +44,15 @@ def get_customer_segments():
     Returns:
         pd.DataFrame: DataFrame with columns ['segment', 'customers']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            CASE
-                WHEN total_spent > 5000 THEN 'VIP (>$5K)'
-                WHEN total_spent > 2000 THEN 'High Value ($2K-$5K)'
-                WHEN total_spent > 500 THEN 'Medium Value ($500-$2K)'
-                ELSE 'Low Value (<$500)'
-            END as segment,
-            COUNT(*) as customers
-        FROM (
-            SELECT customer_id, SUM(total_amount) as total_spent
-            FROM sales_transactions
-            WHERE customer_id IS NOT NULL
-            GROUP BY customer_id
-        ) as customer_totals
-        GROUP BY segment
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['segment', 'customers'])
-
-    cursor.close()
-    conn.close()
-    return df
+    totals = _segment_totals()
+
+    return pd.DataFrame({
+        'segment': totals['bucket'].map(SPEND_SEGMENT_LABELS),
+        'customers': totals['customer_count']
+    })
 
 
+@ttl_cache()
 def get_customer_lifetime_value():
     """
     Calculate average customer lifetime value by segment.
@@ -48,42 +60,13 @@ def get_customer_lifetime_value():
     Returns:
         pd.DataFrame: DataFrame with columns ['segment', 'customer_count', 'avg_clv', 'avg_orders', 'avg_order_value']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            CASE
-                WHEN total_spent > 5000 THEN 'VIP'
-                WHEN total_spent > 2000 THEN 'High Value'
-                WHEN total_spent > 500 THEN 'Medium Value'
-                ELSE 'Low Value'
-            END as segment,
-            COUNT(*) as customer_count,
-            ROUND(AVG(total_spent)::numeric, 2) as avg_clv,
-            ROUND(AVG(order_count)::numeric, 2) as avg_orders,
-            ROUND(AVG(total_spent / order_count)::numeric, 2) as avg_order_value
-        FROM (
-            SELECT
-                customer_id,
-                SUM(total_amount) as total_spent,
-                COUNT(DISTINCT invoice_no) as order_count
-            FROM sales_transactions
-            WHERE customer_id IS NOT NULL
-            GROUP BY customer_id
-        ) as customer_stats
-        GROUP BY segment
-        ORDER BY avg_clv DESC
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['segment', 'customer_count', 'avg_clv', 'avg_orders', 'avg_order_value'])
-
-    cursor.close()
-    conn.close()
+    df = _segment_totals().sort_values('avg_clv', ascending=False, ignore_index=True)
+
+    df.insert(0, 'segment', df.pop('bucket').map(SPEND_SEGMENT_NAMES))
     return df
 
 
+@ttl_cache()
 def get_top_customers(limit=10):
     """
     Get top customers by spending.
@@ -94,25 +77,20 @@ def get_top_customers(limit=10):
     Returns:
         pd.DataFrame: DataFrame with columns ['customer_id', 'total_spent', 'orders', 'avg_transaction']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(f"""
-        SELECT
-            customer_id,
-            SUM(total_amount) as total_spent,
-            COUNT(DISTINCT invoice_no) as orders,
-            AVG(total_amount) as avg_transaction
-        FROM sales_transactions
-        WHERE customer_id IS NOT NULL
-        GROUP BY customer_id
-        ORDER BY total_spent DESC
-        LIMIT {limit}
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['customer_id', 'total_spent', 'orders', 'avg_transaction'])
-
-    cursor.close()
-    conn.close()
+    # Server-side cursor streams large result sets in DB_FETCH_SIZE batches
+    with pooled_connection() as conn, conn.cursor(name='top_customers') as cursor:
+        cursor.itersize = DB_FETCH_SIZE
+        cursor.execute("""
+            SELECT
+                customer_id,
+                total_spent,
+                order_count as orders,
+                total_spent / transaction_count as avg_transaction
+            FROM mv_customer_totals
+            ORDER BY total_spent DESC
+            LIMIT %s
+        """, (limit,))
+
+        df = pd.DataFrame.from_records(cursor, columns=['customer_id', 'total_spent', 'orders', 'avg_transaction'], coerce_float=True)
+
     return df
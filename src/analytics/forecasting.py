@@ -1,64 +1,90 @@
 """Forecasting analytics module for sales predictions."""
 
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import logging
-from typing import Dict, Any, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 
-from src.database.connection import get_connection
-from src.ml.forecasting import SalesForecaster
+from src.config.constants import MIN_FORECAST_HISTORY_DAYS
+from src.config.settings import AppConfig
+from src.database.connection import fetch_arrow
+from src.ml.forecasting import LinearSeasonalForecaster, SalesForecaster, get_trained_forecaster, warm_up_prophet
+from src.utils.cache import ttl_cache
 # from src.ml.ensemble_forecasting import EnsembleForecaster  # Ensemble disabled (didn't improve accuracy)
 
 logger = logging.getLogger(__name__)
 
 
+def _fetch_daily_series(query: str, params: tuple, value_col: str) -> pd.DataFrame:
+    """
+    Run a per-day aggregate query and return typed columns.
+
+    Rows are exported with COPY and parsed by pyarrow, so numeric aggregates
+    arrive as float64 and dates as datetime64 without a Python object per
+    value.
+
+    Args:
+        query: SQL returning (date, value) rows
+        params: Query parameters
+        value_col: Name for the value column
+
+    Returns:
+        DataFrame with columns: date, value_col
+    """
+    table = fetch_arrow(query, params, {'date': pa.timestamp('ns'), value_col: pa.float64()})
+    return table.to_pandas()
+
+
+@ttl_cache()
 def get_daily_revenue(start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
     """
     Get daily revenue data from the database.
 
+    Results are cached per date range so back-to-back forecasts reuse one
+    aggregate query. Callers receive a copy they are free to modify.
+
     Args:
         start_date: Optional start date filter (format: 'YYYY-MM-DD')
-        end_date: Optional end date filter (format: 'YYYY-MM-DD')
+        end_date: Optional end date filter, inclusive (format: 'YYYY-MM-DD')
 
     Returns:
         DataFrame with columns: date, revenue
     """
-    conn = get_connection()
-
     query = """
         SELECT
-            DATE(invoice_date) as date,
-            SUM(total_amount) as revenue
-        FROM sales_transactions
+            sale_date as date,
+            SUM(revenue)::float8 as revenue
+        FROM mv_daily_sales
     """
 
     conditions = []
+    params = []
     if start_date:
-        conditions.append(f"invoice_date >= '{start_date}'")
+        conditions.append("sale_date >= %s")
+        params.append(start_date)
     if end_date:
-        conditions.append(f"invoice_date <= '{end_date}'")
+        conditions.append("sale_date <= %s")
+        params.append(end_date)
 
     if conditions:
         query += " WHERE " + " AND ".join(conditions)
 
     query += """
-        GROUP BY DATE(invoice_date)
+        GROUP BY sale_date
         ORDER BY date
     """
 
     try:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        data = cursor.fetchall()
-        df = pd.DataFrame(data, columns=['date', 'revenue'])
-        cursor.close()
+        df = _fetch_daily_series(query, tuple(params), 'revenue')
         logger.info(f"Retrieved {len(df)} days of revenue data")
         return df
     except Exception as e:
         logger.error(f"Error fetching daily revenue: {e}")
         raise
-    finally:
-        conn.close()
 
 
 def get_revenue_forecast(
@@ -89,8 +115,8 @@ def get_revenue_forecast(
     # Get historical revenue data
     revenue_df = get_daily_revenue()
 
-    if len(revenue_df) < 30:
-        logger.warning("Insufficient historical data for accurate forecasting (minimum 30 days recommended)")
+    if len(revenue_df) < MIN_FORECAST_HISTORY_DAYS:
+        logger.warning(f"Insufficient historical data for accurate forecasting (minimum {MIN_FORECAST_HISTORY_DAYS} days recommended)")
 
     if use_ensemble:
         # DISABLED: Ensemble didn't improve accuracy (62.33% vs 79.7% for Prophet alone)
@@ -111,16 +137,22 @@ def get_revenue_forecast(
             detect_spikes=False      # Disable spike detection
         )
 
-        # Train model with PRODUCTION-TUNED parameters for Neon dataset
-        # Note: 31% MAPE is realistic for volatile retail sales forecasting
-        forecaster.train(
-            prophet_df,
-            seasonality_mode=seasonality_mode,
-            changepoint_prior_scale=0.25,  # Best performing value
-            seasonality_prior_scale=15.0,  # Best performing value
-            add_country_holidays='UK'       # UK holidays
-        )
-        logger.info("Model training completed with optimized parameters")
+        if AppConfig.FORECAST_ENGINE == 'fast' and freq == 'D':
+            # Closed-form fit in milliseconds; cheap enough to refit every call
+            forecaster = LinearSeasonalForecaster()
+            forecaster.train(prophet_df)
+        else:
+            # Train model with PRODUCTION-TUNED parameters for Neon dataset
+            # Note: 31% MAPE is realistic for volatile retail sales forecasting
+            forecaster = get_trained_forecaster(
+                'revenue',
+                prophet_df,
+                seasonality_mode=seasonality_mode,
+                changepoint_prior_scale=0.25,  # Best performing value
+                seasonality_prior_scale=15.0,  # Best performing value
+                add_country_holidays='UK'       # UK holidays
+            )
+            logger.info("Model training completed with optimized parameters")
 
         # Generate predictions
         forecast_df = forecaster.predict(periods=periods, freq=freq)
@@ -160,27 +192,27 @@ def get_product_forecast(
     """
     logger.info(f"Generating forecast for product: {product_code}")
 
-    conn = get_connection()
-
+    # Short histories are dropped in the database, so nothing is fetched for them
     query = """
-        SELECT
-            DATE(invoice_date) as date,
-            SUM(quantity) as quantity
-        FROM sales_transactions
-        WHERE stock_code = %s
-        GROUP BY DATE(invoice_date)
+        SELECT date, quantity
+        FROM (
+            SELECT
+                sale_date as date,
+                SUM(units)::float8 as quantity,
+                COUNT(*) OVER () as days
+            FROM mv_daily_sales
+            WHERE stock_code = %s
+            GROUP BY sale_date
+        ) daily
+        WHERE days >= %s
         ORDER BY date
     """
 
     try:
-        cursor = conn.cursor()
-        cursor.execute(query, (product_code,))
-        data = cursor.fetchall()
-        df = pd.DataFrame(data, columns=['date', 'quantity'])
-        cursor.close()
-
-        if len(df) < 30:
-            logger.warning(f"Insufficient data for product {product_code} (minimum 30 days recommended)")
+        df = _fetch_daily_series(query, (product_code, MIN_FORECAST_HISTORY_DAYS), 'quantity')
+
+        if df.empty:
+            logger.warning(f"Insufficient data for product {product_code} (minimum {MIN_FORECAST_HISTORY_DAYS} days recommended)")
             return pd.DataFrame(), {'error': 'Insufficient historical data'}
 
         # Initialize forecaster
@@ -188,16 +220,12 @@ def get_product_forecast(
 
         # Prepare and train
         prophet_df = forecaster.prepare_data(df, date_col='date', value_col='quantity')
-        forecaster.train(prophet_df)
+        forecaster = get_trained_forecaster(f'product:{product_code}', prophet_df)
 
-        # Generate predictions
-        forecast_df = forecaster.predict(periods=periods, freq=freq)
+        # Generate predictions for future dates only
+        forecast_df = forecaster.predict(periods=periods, freq=freq, include_history=False)
         summary = forecaster.get_forecast_summary()
 
-        # Filter to future only
-        last_date = prophet_df['ds'].max()
-        forecast_df = forecast_df[forecast_df['ds'] > last_date]
-
         logger.info(f"Product forecast completed for {product_code}")
 
         return forecast_df, summary
@@ -205,8 +233,115 @@ def get_product_forecast(
     except Exception as e:
         logger.error(f"Error generating product forecast: {e}")
         raise
-    finally:
-        conn.close()
+
+
+def _fit_and_predict(
+    df: pd.DataFrame,
+    value_col: str,
+    periods: int,
+    freq: str
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Fit a fresh Prophet model on one history and forecast future periods.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        df: History with columns: date, value_col
+        value_col: Name of the value column
+        periods: Number of periods to forecast
+        freq: Forecast frequency
+
+    Returns:
+        Tuple of (future forecast_df, summary_dict)
+    """
+    forecaster = SalesForecaster()
+    prophet_df = forecaster.prepare_data(df, date_col='date', value_col=value_col)
+    forecaster.train(prophet_df)
+
+    forecast_df = forecaster.predict(periods=periods, freq=freq, include_history=False)
+    return forecast_df, forecaster.get_forecast_summary()
+
+
+def get_multi_product_forecast(
+    product_codes: List[str],
+    periods: int = 30,
+    freq: str = 'D'
+) -> Dict[str, Tuple[pd.DataFrame, Dict[str, Any]]]:
+    """
+    Generate forecasts for several products at once.
+
+    All histories come from one grouped query, and the Prophet fits run in
+    a process pool so each product uses its own CPU core.
+
+    Args:
+        product_codes: Stock codes of the products
+        periods: Number of periods to forecast
+        freq: Forecast frequency
+
+    Returns:
+        Dict mapping each stock code to (forecast_df, summary_dict). Codes
+        with too little history map to an empty frame and an error summary.
+    """
+    logger.info(f"Generating forecasts for {len(product_codes)} products")
+
+    # Only products with enough history come back from the database
+    query = """
+        SELECT stock_code, date, quantity
+        FROM (
+            SELECT
+                stock_code,
+                sale_date as date,
+                SUM(units)::float8 as quantity,
+                COUNT(*) OVER (PARTITION BY stock_code) as days
+            FROM mv_daily_sales
+            WHERE stock_code = ANY(%s)
+            GROUP BY stock_code, sale_date
+        ) daily
+        WHERE days >= %s
+        ORDER BY stock_code, date
+    """
+
+    try:
+        history = fetch_arrow(
+            query,
+            (list(product_codes), MIN_FORECAST_HISTORY_DAYS),
+            {'stock_code': pa.string(), 'date': pa.timestamp('ns'), 'quantity': pa.float64()}
+        ).to_pandas()
+    except Exception as e:
+        logger.error(f"Error fetching product histories: {e}")
+        raise
+
+    histories = {
+        code: group[['date', 'quantity']].reset_index(drop=True)
+        for code, group in history.groupby('stock_code', sort=False)
+    }
+
+    results = {}
+    trainable = []
+    for code in product_codes:
+        df = histories.get(code)
+        if df is None:
+            logger.warning(f"Insufficient data for product {code} (minimum {MIN_FORECAST_HISTORY_DAYS} days recommended)")
+            results[code] = (pd.DataFrame(), {'error': 'Insufficient historical data'})
+        else:
+            trainable.append(code)
+
+    if trainable:
+        workers = min(len(trainable), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            forecasts = executor.map(
+                _fit_and_predict,
+                [histories[code] for code in trainable],
+                ['quantity'] * len(trainable),
+                [periods] * len(trainable),
+                [freq] * len(trainable)
+            )
+            for code, forecast in zip(trainable, forecasts):
+                results[code] = forecast
+
+    logger.info(f"Multi-product forecast completed for {len(trainable)} products")
+    return {code: results[code] for code in product_codes}
 
 
 def get_country_forecast(
@@ -227,26 +362,25 @@ def get_country_forecast(
     """
     logger.info(f"Generating forecast for country: {country}")
 
-    conn = get_connection()
-
     query = """
-        SELECT
-            DATE(invoice_date) as date,
-            SUM(total_amount) as revenue
-        FROM sales_transactions
-        WHERE country = %s
-        GROUP BY DATE(invoice_date)
+        SELECT date, revenue
+        FROM (
+            SELECT
+                sale_date as date,
+                SUM(revenue)::float8 as revenue,
+                COUNT(*) OVER () as days
+            FROM mv_daily_sales
+            WHERE country = %s
+            GROUP BY sale_date
+        ) daily
+        WHERE days >= %s
         ORDER BY date
     """
 
     try:
-        cursor = conn.cursor()
-        cursor.execute(query, (country,))
-        data = cursor.fetchall()
-        df = pd.DataFrame(data, columns=['date', 'revenue'])
-        cursor.close()
+        df = _fetch_daily_series(query, (country, MIN_FORECAST_HISTORY_DAYS), 'revenue')
 
-        if len(df) < 30:
+        if df.empty:
             logger.warning(f"Insufficient data for country {country}")
             return pd.DataFrame(), {'error': 'Insufficient historical data'}
 
@@ -255,16 +389,12 @@ def get_country_forecast(
 
         # Prepare and train
         prophet_df = forecaster.prepare_data(df, date_col='date', value_col='revenue')
-        forecaster.train(prophet_df)
+        forecaster = get_trained_forecaster(f'country:{country}', prophet_df)
 
-        # Generate predictions
-        forecast_df = forecaster.predict(periods=periods, freq=freq)
+        # Generate predictions for future dates only
+        forecast_df = forecaster.predict(periods=periods, freq=freq, include_history=False)
         summary = forecaster.get_forecast_summary()
 
-        # Filter to future only
-        last_date = prophet_df['ds'].max()
-        forecast_df = forecast_df[forecast_df['ds'] > last_date]
-
         logger.info(f"Country forecast completed for {country}")
 
         return forecast_df, summary
@@ -272,8 +402,6 @@ def get_country_forecast(
     except Exception as e:
         logger.error(f"Error generating country forecast: {e}")
         raise
-    finally:
-        conn.close()
 
 
 def get_forecast_comparison(use_ensemble: bool = True) -> pd.DataFrame:
@@ -320,7 +448,8 @@ def get_forecast_comparison(use_ensemble: bool = True) -> pd.DataFrame:
         )
 
         # Train model with optimized parameters
-        forecaster.train(
+        forecaster = get_trained_forecaster(
+            'comparison',
             prophet_train,
             seasonality_mode='multiplicative',
             changepoint_prior_scale=0.30,  # High flexibility (tuned)
@@ -328,29 +457,20 @@ def get_forecast_comparison(use_ensemble: bool = True) -> pd.DataFrame:
             add_country_holidays='UK'
         )
 
-        # Generate predictions
-        forecast_df = forecaster.predict(periods=30, freq='D')
-
-        # Merge actual and predicted
-        last_train_date = prophet_train['ds'].max()
-        forecast_future = forecast_df[forecast_df['ds'] > last_train_date][['ds', 'yhat']].copy()
-
-    # Convert test_df date to datetime for proper merging
-    test_df['date'] = pd.to_datetime(test_df['date'])
+        # Generate predictions for the held-out dates only
+        forecast_df = forecaster.predict(periods=30, freq='D', include_history=False)
+        predicted_revenue = forecast_df.set_index('ds')['yhat']
 
-    comparison = test_df.merge(
-        forecast_future,
-        left_on='date',
-        right_on='ds',
-        how='inner'
-    )
+    # Both sides are sorted by date, so the join aligns indexes without hashing
+    comparison = test_df.set_index('date').join(predicted_revenue, how='inner').reset_index()
 
-    # Convert revenue to float to avoid Decimal/float type issues
-    comparison['revenue'] = comparison['revenue'].astype(float)
-    comparison['yhat'] = comparison['yhat'].astype(float)
-
-    comparison['difference'] = comparison['revenue'] - comparison['yhat']
-    comparison['difference_pct'] = (comparison['difference'] / comparison['revenue']) * 100
+    actual = comparison['revenue'].to_numpy(dtype=np.float64)
+    predicted = comparison['yhat'].to_numpy(dtype=np.float64)
+    difference = actual - predicted
+    comparison['difference'] = difference
+    # Zero-revenue days give inf/NaN like the Series division did
+    with np.errstate(divide='ignore', invalid='ignore'):
+        comparison['difference_pct'] = difference / actual * 100.0
 
     comparison = comparison.rename(columns={
         'revenue': 'actual_revenue',
@@ -362,3 +482,7 @@ def get_forecast_comparison(use_ensemble: bool = True) -> pd.DataFrame:
     logger.info("Forecast comparison completed")
 
     return comparison
+
+
+if AppConfig.WARMUP_PROPHET:
+    warm_up_prophet()
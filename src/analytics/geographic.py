@@ -1,10 +1,17 @@
 """
 Geographic analytics module for country and regional performance analysis.
 """
-import pandas as pd
-from src.database.connection import get_connection
+from src.analytics._warm import load_fact, round_like_numeric
+from src.config.constants import FACT_CACHE_TTL
+from src.utils.cache import ttl_cache
 
 
+def _by_country(df):
+    """Group fact rows by country, leaving out countries with no rows."""
+    return df.groupby('country', observed=True)
+
+
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_revenue_by_country():
     """
     Get revenue by country (top 10).
@@ -12,25 +19,13 @@ def get_revenue_by_country():
     Returns:
         pd.DataFrame: DataFrame with columns ['country', 'revenue']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT country, SUM(total_amount) as revenue
-        FROM sales_transactions
-        GROUP BY country
-        ORDER BY revenue DESC
-        LIMIT 10
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['country', 'revenue'])
+    revenue = _by_country(load_fact())['total_amount'].sum().nlargest(10)
 
-    cursor.close()
-    conn.close()
-    return df
+    revenue.index = revenue.index.astype(object)
+    return revenue.rename('revenue').reset_index()
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_country_performance_detailed():
     """
     Get detailed country performance metrics.
@@ -38,26 +33,15 @@ def get_country_performance_detailed():
     Returns:
         pd.DataFrame: DataFrame with columns ['country', 'orders', 'customers', 'revenue', 'avg_transaction', 'units_sold']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            country,
-            COUNT(DISTINCT invoice_no) as orders,
-            COUNT(DISTINCT customer_id) as customers,
-            SUM(total_amount) as revenue,
-            ROUND(AVG(total_amount)::numeric, 2) as avg_transaction,
-            SUM(quantity) as units_sold
-        FROM sales_transactions
-        GROUP BY country
-        ORDER BY revenue DESC
-        LIMIT 15
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['country', 'orders', 'customers', 'revenue', 'avg_transaction', 'units_sold'])
-
-    cursor.close()
-    conn.close()
-    return df
+    countries = _by_country(load_fact()).agg(
+        orders=('invoice_no', 'nunique'),
+        customers=('customer_id', 'nunique'),
+        revenue=('total_amount', 'sum'),
+        avg_transaction=('total_amount', 'mean'),
+        units_sold=('quantity', 'sum')
+    )
+
+    countries = countries.nlargest(15, 'revenue')
+    countries['avg_transaction'] = round_like_numeric(countries['avg_transaction'].to_numpy())
+    countries.index = countries.index.astype(object)
+    return countries.reset_index()
@@ -1,9 +1,12 @@
 """
 Key Performance Indicators (KPIs) calculation module.
 """
-from src.database.connection import get_connection
+from src.analytics._warm import load_fact
+from src.config.constants import FACT_CACHE_TTL
+from src.utils.cache import ttl_cache
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_kpis():
     """
     Get main KPIs: revenue, orders, customers, average order value.
@@ -11,29 +14,20 @@ def get_kpis():
     Returns:
         dict: KPI metrics including revenue, orders, customers, and avg_order
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    df = load_fact()
 
-    cursor.execute("""
-        SELECT
-            SUM(total_amount) as revenue,
-            COUNT(DISTINCT invoice_no) as orders,
-            COUNT(DISTINCT customer_id) as customers
-        FROM sales_transactions
-    """)
-
-    data = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    revenue = float(df['total_amount'].sum())
+    orders = int(df['invoice_no'].nunique())
 
     return {
-        'revenue': data[0],
-        'orders': data[1],
-        'customers': data[2],
-        'avg_order': data[0] / data[1]
+        'revenue': revenue,
+        'orders': orders,
+        'customers': int(df['customer_id'].nunique()),
+        'avg_order': revenue / orders
     }
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_sales_summary():
     """
     Get comprehensive sales summary with all key metrics.
@@ -41,38 +35,35 @@ def get_sales_summary():
     Returns:
         dict: Complete sales summary including transactions, products, countries, etc.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total_transactions,
-            COUNT(DISTINCT invoice_no) as total_orders,
-            COUNT(DISTINCT customer_id) as total_customers,
-            COUNT(DISTINCT description) as total_products,
-            COUNT(DISTINCT country) as total_countries,
-            SUM(total_amount) as total_revenue,
-            AVG(total_amount) as avg_transaction,
-            MAX(total_amount) as max_transaction,
-            MIN(invoice_date) as first_sale,
-            MAX(invoice_date) as last_sale
-        FROM sales_transactions
-    """)
-
-    data = cursor.fetchone()
+    df = load_fact()
+    if df.empty:
+        # Nothing loaded yet, e.g. before the first ETL run: the SQL aggregates
+        # of no rows are zero counts and NULL sums, averages and dates
+        return {
+            'total_transactions': 0,
+            'total_orders': 0,
+            'total_customers': 0,
+            'total_products': 0,
+            'total_countries': 0,
+            'total_revenue': None,
+            'avg_transaction': None,
+            'max_transaction': None,
+            'first_sale': None,
+            'last_sale': None
+        }
 
-    cursor.close()
-    conn.close()
+    amounts = df['total_amount']
 
     return {
-        'total_transactions': data[0],
-        'total_orders': data[1],
-        'total_customers': data[2],
-        'total_products': data[3],
-        'total_countries': data[4],
-        'total_revenue': data[5],
-        'avg_transaction': data[6],
-        'max_transaction': data[7],
-        'first_sale': data[8],
-        'last_sale': data[9]
+        'total_transactions': len(df),
+        'total_orders': int(df['invoice_no'].nunique()),
+        'total_customers': int(df['customer_id'].nunique()),
+        'total_products': int(df['description'].nunique()),
+        'total_countries': int(df['country'].nunique()),
+        'total_revenue': float(amounts.sum()),
+        'avg_transaction': float(amounts.mean()),
+        'max_transaction': float(amounts.max()),
+        # Rows are sorted by invoice_date
+        'first_sale': df['invoice_date'].iloc[0].to_pydatetime(),
+        'last_sale': df['invoice_date'].iloc[-1].to_pydatetime()
     }
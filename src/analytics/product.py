@@ -1,10 +1,12 @@
 """
 Product analytics module for product performance analysis.
 """
-import pandas as pd
-from src.database.connection import get_connection
+from src.analytics._warm import load_fact
+from src.config.constants import FACT_CACHE_TTL
+from src.utils.cache import ttl_cache
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_top_products(limit=10):
     """
     Get top products by revenue.
@@ -15,23 +17,18 @@ def get_top_products(limit=10):
     Returns:
         pd.DataFrame: DataFrame with columns ['product', 'revenue', 'units_sold', 'orders']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    df = load_fact()
 
-    cursor.execute(f"""
-        SELECT description as product,
-               SUM(total_amount) as revenue,
-               SUM(quantity) as units_sold,
-               COUNT(DISTINCT invoice_no) as orders
-        FROM sales_transactions
-        GROUP BY description
-        ORDER BY revenue DESC
-        LIMIT {limit}
-    """)
+    products = df.groupby('description', observed=True, dropna=False).agg(
+        revenue=('total_amount', 'sum'),
+        units_sold=('quantity', 'sum')
+    )
+    products = products.nlargest(limit, 'revenue')
 
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['product', 'revenue', 'units_sold', 'orders'])
+    # Count distinct invoices only for the selected products, not the whole fact table
+    top_rows = df[df['description'].isin(products.index)]
+    orders = top_rows.groupby('description', observed=True, dropna=False)['invoice_no'].nunique()
+    products['orders'] = orders.reindex(products.index)
 
-    cursor.close()
-    conn.close()
-    return df
+    products.index = products.index.astype(object)
+    return products.rename_axis('product').reset_index()
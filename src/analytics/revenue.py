@@ -1,10 +1,13 @@
 """
 Revenue analytics module for trend analysis and growth calculations.
 """
-import pandas as pd
-from src.database.connection import get_connection
+import numpy as np
+from src.analytics._warm import load_fact, round_like_numeric
+from src.config.constants import DAYS_OF_WEEK, FACT_CACHE_TTL
+from src.utils.cache import ttl_cache
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_revenue_trend():
     """
     Get daily revenue trend.
@@ -12,24 +15,14 @@ def get_revenue_trend():
     Returns:
         pd.DataFrame: DataFrame with columns ['date', 'revenue']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    daily = load_fact().groupby('date')['total_amount'].sum()
 
-    cursor.execute("""
-        SELECT DATE(invoice_date) as date, SUM(total_amount) as revenue
-        FROM sales_transactions
-        GROUP BY DATE(invoice_date)
-        ORDER BY date
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['date', 'revenue'])
-
-    cursor.close()
-    conn.close()
+    df = daily.rename('revenue').reset_index()
+    df['date'] = df['date'].dt.date
     return df
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_monthly_revenue():
     """
     Get monthly revenue and order counts.
@@ -37,27 +30,34 @@ def get_monthly_revenue():
     Returns:
         pd.DataFrame: DataFrame with columns ['month', 'revenue', 'orders']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            TO_CHAR(invoice_date, 'YYYY-MM') as month,
-            SUM(total_amount) as revenue,
-            COUNT(DISTINCT invoice_no) as orders
-        FROM sales_transactions
-        GROUP BY TO_CHAR(invoice_date, 'YYYY-MM')
-        ORDER BY month
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['month', 'revenue', 'orders'])
-
-    cursor.close()
-    conn.close()
+    monthly = load_fact().groupby('month').agg(
+        revenue=('total_amount', 'sum'),
+        orders=('invoice_no', 'nunique')
+    )
+
+    df = monthly.reset_index()
+    df['month'] = df['month'].astype(str)
     return df
 
 
+def _growth_rate(revenue):
+    """
+    Percentage change of each value over the previous one.
+
+    Args:
+        revenue (np.ndarray): Revenue per period in chronological order
+
+    Returns:
+        np.ndarray: Growth rates in percent; the first period is NaN
+    """
+    growth = np.full(revenue.shape[0], np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(revenue[1:] - revenue[:-1], revenue[:-1], out=growth[1:])
+    growth *= 100.0
+    return growth
+
+
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_monthly_growth():
     """
     Calculate month-over-month growth rate.
@@ -65,37 +65,18 @@ def get_monthly_growth():
     Returns:
         pd.DataFrame: DataFrame with columns ['month', 'revenue', 'prev_month_revenue', 'growth_rate']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            month,
-            revenue,
-            LAG(revenue) OVER (ORDER BY month) as prev_month_revenue,
-            ROUND(
-                ((revenue - LAG(revenue) OVER (ORDER BY month)) /
-                LAG(revenue) OVER (ORDER BY month) * 100)::numeric,
-                2
-            ) as growth_rate
-        FROM (
-            SELECT
-                TO_CHAR(invoice_date, 'YYYY-MM') as month,
-                SUM(total_amount) as revenue
-            FROM sales_transactions
-            GROUP BY month
-        ) monthly_data
-        ORDER BY month
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['month', 'revenue', 'prev_month_revenue', 'growth_rate'])
-
-    cursor.close()
-    conn.close()
+    df = get_monthly_revenue().drop(columns='orders')
+
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    prev_month_revenue = np.full_like(revenue, np.nan)
+    prev_month_revenue[1:] = revenue[:-1]
+
+    df['prev_month_revenue'] = prev_month_revenue
+    df['growth_rate'] = round_like_numeric(_growth_rate(revenue))
     return df
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_sales_by_hour():
     """
     Get sales pattern by hour of day.
@@ -103,27 +84,15 @@ def get_sales_by_hour():
     Returns:
         pd.DataFrame: DataFrame with columns ['hour', 'revenue', 'transactions']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            EXTRACT(HOUR FROM invoice_date) as hour,
-            SUM(total_amount) as revenue,
-            COUNT(*) as transactions
-        FROM sales_transactions
-        GROUP BY hour
-        ORDER BY hour
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['hour', 'revenue', 'transactions'])
-
-    cursor.close()
-    conn.close()
-    return df
+    hourly = load_fact().groupby('hour').agg(
+        revenue=('total_amount', 'sum'),
+        transactions=('total_amount', 'size')
+    )
+
+    return hourly.reset_index()
 
 
+@ttl_cache(seconds=FACT_CACHE_TTL)
 def get_sales_by_day_of_week():
     """
     Get sales pattern by day of week.
@@ -131,23 +100,14 @@ def get_sales_by_day_of_week():
     Returns:
         pd.DataFrame: DataFrame with columns ['day_name', 'day_num', 'revenue', 'orders']
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            TO_CHAR(invoice_date, 'Day') as day_name,
-            EXTRACT(DOW FROM invoice_date) as day_num,
-            SUM(total_amount) as revenue,
-            COUNT(DISTINCT invoice_no) as orders
-        FROM sales_transactions
-        GROUP BY day_name, day_num
-        ORDER BY day_num
-    """)
-
-    data = cursor.fetchall()
-    df = pd.DataFrame(data, columns=['day_name', 'day_num', 'revenue', 'orders'])
-
-    cursor.close()
-    conn.close()
+    daily = load_fact().groupby('dow').agg(
+        revenue=('total_amount', 'sum'),
+        orders=('invoice_no', 'nunique')
+    )
+
+    df = daily.rename_axis('day_num').reset_index()
+    # day_num counts from Sunday (PostgreSQL DOW); DAYS_OF_WEEK counts from Monday.
+    # Names are blank-padded to nine characters like TO_CHAR(..., 'Day').
+    day_names = df['day_num'].map(lambda day: DAYS_OF_WEEK[(day + 6) % 7].ljust(9))
+    df.insert(0, 'day_name', day_names)
     return df
@@ -3,15 +3,22 @@ Authentication utilities for JWT token generation and password hashing.
 Industry-standard security implementation with bcrypt and JWT.
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import hashlib
+import hmac
 import secrets
+import threading
+import time
 
+import bcrypt
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel, EmailStr
 
+from src.config.constants import PASSWORD_VERIFY_CACHE_TTL, TOKEN_CACHE_SIZE
 from src.config.settings import APIConfig
 
 # Security configuration from environment variables
@@ -20,7 +27,17 @@ ALGORITHM = APIConfig.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = APIConfig.ACCESS_TOKEN_EXPIRE_MINUTES
 
 # Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=APIConfig.BCRYPT_ROUNDS)
+
+# Hash prefixes produced by bcrypt; these are checked directly without passlib's scheme lookup
+BCRYPT_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# bcrypt only uses the first 72 bytes of a password (passlib truncates the same way)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Keyed digests of recently verified (password, hash) pairs mapped to their expiry time
+_verified_passwords: Dict[bytes, float] = {}
+_verified_lock = threading.Lock()
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
@@ -63,10 +80,52 @@ class UserLogin(BaseModel):
     password: str
 
 
+def _password_digest(plain_password: str, hashed_password: str) -> bytes:
+    """
+    Bind a password to its stored hash with an HMAC keyed by the server secret.
+
+    Args:
+        plain_password: The plain text password from user input
+        hashed_password: The stored password hash
+
+    Returns:
+        HMAC-SHA256 digest identifying the pair
+    """
+    message = hashed_password.encode('utf-8') + b'\0' + plain_password.encode('utf-8')
+    return hmac.new(SECRET_KEY.encode('utf-8'), message, hashlib.sha256).digest()
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Run the full hash comparison for a password.
+
+    Args:
+        plain_password: The plain text password from user input
+        hashed_password: The stored password hash
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    if hashed_password.startswith(BCRYPT_HASH_PREFIXES):
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES],
+                hashed_password.encode('utf-8')
+            )
+        except ValueError:
+            # Malformed hash: let passlib report it the usual way
+            pass
+    return pwd_context.verify(plain_password, hashed_password)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
 
+    A successful check is remembered for PASSWORD_VERIFY_CACHE_TTL seconds, so
+    repeat logins with the same password skip bcrypt. Failed checks are never
+    cached and always pay the full bcrypt cost.
+
     Args:
         plain_password: The plain text password from user input
         hashed_password: The bcrypt hashed password from database
@@ -74,7 +133,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    digest = _password_digest(plain_password, hashed_password)
+    now = time.monotonic()
+
+    with _verified_lock:
+        expires_at = _verified_passwords.get(digest)
+    if expires_at is not None and expires_at > now:
+        return True
+
+    if not _check_password(plain_password, hashed_password):
+        return False
+
+    with _verified_lock:
+        for stale in [key for key, expiry in _verified_passwords.items() if expiry <= now]:
+            del _verified_passwords[stale]
+        _verified_passwords[digest] = now + PASSWORD_VERIFY_CACHE_TTL
+    return True
 
 
 def get_password_hash(password: str) -> str:
@@ -112,10 +186,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _decode_token_claims(token: str) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Verify a JWT signature once and keep the claims needed per request.
+
+    Only tokens that verify are cached; invalid ones raise every time.
+
+    Args:
+        token: JWT token string to decode
+
+    Returns:
+        Tuple of the subject (email) and expiry timestamp
+
+    Raises:
+        JWTError: If the token is invalid or already expired
+    """
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return payload.get("sub"), payload.get("exp")
+
+
 def decode_access_token(token: str) -> Optional[str]:
     """
     Decode and verify a JWT access token.
 
+    Repeat calls with the same token reuse the verified claims, but expiry is
+    still checked on every call.
+
     Args:
         token: JWT token string to decode
 
@@ -123,14 +220,16 @@ def decode_access_token(token: str) -> Optional[str]:
         Email from token if valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return email
+        email, expires_at = _decode_token_claims(token)
     except JWTError:
         return None
 
+    if email is None:
+        return None
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    return email
+
 
 def generate_verification_token() -> str:
     """
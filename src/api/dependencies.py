@@ -2,13 +2,20 @@
 Shared dependencies for API endpoints.
 Contains authentication and authorization dependencies.
 """
-from fastapi import Depends, HTTPException, status
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict
+
+from fastapi import Depends, HTTPException, Request, Response, status
 
 from src.api.auth import oauth2_scheme, decode_access_token
-from src.api.users import get_user_by_email
+from src.api.users import get_cached_user
+from src.config.constants import API_CACHE_MAX_AGE, RATE_LIMIT_MAX_CLIENTS
+from src.config.settings import APIConfig
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
+def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     """
     Dependency to extract and validate current user from JWT token.
 
@@ -31,14 +38,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     if email is None:
         raise credentials_exception
 
-    user = get_user_by_email(email)
+    user = get_cached_user(email)
     if user is None:
         raise credentials_exception
 
-    return user
+    # Copy so endpoints cannot change the cached record
+    return dict(user)
 
 
-async def get_current_active_user(current_user: dict = Depends(get_current_user)) -> dict:
+def get_current_active_user(current_user: dict = Depends(get_current_user)) -> dict:
     """
     Dependency to ensure current user is active.
 
@@ -56,7 +64,7 @@ async def get_current_active_user(current_user: dict = Depends(get_current_user)
     return current_user
 
 
-async def get_current_verified_user(current_user: dict = Depends(get_current_active_user)) -> dict:
+def get_current_verified_user(current_user: dict = Depends(get_current_active_user)) -> dict:
     """
     Dependency to ensure current user has verified their email.
 
@@ -75,3 +83,93 @@ async def get_current_verified_user(current_user: dict = Depends(get_current_act
             detail="Email not verified. Please check your email for verification link."
         )
     return current_user
+
+
+def analytics_response_headers(
+    response: Response,
+    current_user: dict = Depends(get_current_verified_user)
+) -> None:
+    """
+    Dependency adding the shared headers to analytics responses.
+
+    The requesting user goes in X-Requested-By rather than the body, so the
+    body is identical for every user. Responses are still only cacheable by
+    private caches because they require authentication.
+
+    Args:
+        response: Response the endpoint's result is written to
+        current_user: User from get_current_verified_user dependency
+    """
+    response.headers["Cache-Control"] = f"private, max-age={API_CACHE_MAX_AGE}"
+    response.headers["X-Requested-By"] = current_user['email']
+
+
+def client_address(request: Request) -> str:
+    """
+    Address of the client that sent a request.
+
+    Behind APIConfig.TRUSTED_PROXY_HOPS reverse proxies the peer is the last
+    proxy, so the client is read from X-Forwarded-For, counting that many
+    entries from the right. Entries further left are supplied by the caller
+    and cannot be trusted.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        str: Client address, or "unknown" if there is none
+    """
+    hops = APIConfig.TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [
+            address.strip()
+            for header in request.headers.getlist("x-forwarded-for")
+            for address in header.split(",")
+            if address.strip()
+        ]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(max_requests: int, window_seconds: int) -> Callable:
+    """
+    Build a dependency allowing each client address max_requests per window.
+
+    Counts are kept in this process, so with several workers each one
+    enforces the limit separately.
+
+    Args:
+        max_requests: Requests a client may make within the window
+        window_seconds: Length of the sliding window in seconds
+
+    Returns:
+        Callable: Dependency raising HTTP 429 once a client exceeds the limit
+    """
+    hits: Dict[str, Deque[float]] = {}
+    lock = threading.Lock()
+
+    def dependency(request: Request) -> None:
+        client = client_address(request)
+        now = time.monotonic()
+
+        with lock:
+            # Forget idle clients so one-off addresses do not accumulate
+            if len(hits) >= RATE_LIMIT_MAX_CLIENTS:
+                for idle in [key for key, times in hits.items() if now - times[-1] >= window_seconds]:
+                    del hits[idle]
+
+            times = hits.setdefault(client, deque())
+            while times and now - times[0] >= window_seconds:
+                times.popleft()
+
+            if len(times) >= max_requests:
+                retry_after = int(window_seconds - (now - times[0])) + 1
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests. Please try again later.",
+                    headers={"Retry-After": str(retry_after)},
+                )
+            times.append(now)
+
+    return dependency
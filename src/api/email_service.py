@@ -2,15 +2,31 @@
 Email service for sending verification emails via SendGrid.
 """
 import logging
-from typing import Optional
+import threading
+from typing import List, Optional, Tuple
 
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Content
+from sendgrid.helpers.mail import Mail, Content, Substitution, To
 
+from src.config.constants import SENDGRID_MAX_PERSONALIZATIONS
 from src.config.settings import EmailConfig
 
 logger = logging.getLogger(__name__)
 
+# One SendGrid client shared by every send instead of one per email
+_sendgrid_client: Optional[SendGridAPIClient] = None
+_sendgrid_client_lock = threading.Lock()
+
+
+def _get_sendgrid_client() -> SendGridAPIClient:
+    """Return the shared SendGrid client, creating it on first use."""
+    global _sendgrid_client
+    if _sendgrid_client is None:
+        with _sendgrid_client_lock:
+            if _sendgrid_client is None:
+                _sendgrid_client = SendGridAPIClient(EmailConfig.SENDGRID_API_KEY)
+    return _sendgrid_client
+
 
 def send_verification_email(email: str, verification_token: str, username: str) -> bool:
     """
@@ -24,18 +40,13 @@ def send_verification_email(email: str, verification_token: str, username: str)
     Returns:
         bool: True if email sent successfully, False otherwise
     """
-    logger.info(f"send_verification_email called for {email}")
-    logger.info(f"EMAIL_ENABLED: {EmailConfig.EMAIL_ENABLED}")
-    logger.info(f"SENDGRID_API_KEY present: {bool(EmailConfig.SENDGRID_API_KEY)}")
-
     if not EmailConfig.EMAIL_ENABLED:
-        logger.info(f"Email sending disabled. Verification token for {email}: {verification_token}")
+        logger.debug("Email sending disabled; skipping verification email for %s", email)
         return False
 
     try:
-        logger.info(f"Attempting to send email to {email}")
         # Build verification URL
-        verification_url = f"{EmailConfig.EMAIL_VERIFICATION_URL}?verification_token={verification_token}"
+        verification_url = _build_verification_url(verification_token)
 
         # Email subject and body
         subject = "Verify Your Email - Sales Analytics"
@@ -52,10 +63,7 @@ def send_verification_email(email: str, verification_token: str, username: str)
         )
 
         # Send via SendGrid API
-        sg = SendGridAPIClient(EmailConfig.SENDGRID_API_KEY)
-        response = sg.send(message)
-
-        logger.info(f"SendGrid response: Status {response.status_code}")
+        response = _get_sendgrid_client().send(message)
 
         if response.status_code in [200, 201, 202]:
             logger.info(f"Verification email sent via SendGrid to {email}")
@@ -65,11 +73,69 @@ def send_verification_email(email: str, verification_token: str, username: str)
             return False
 
     except Exception as e:
-        logger.error(f"Failed to send verification email to {email}: {e}")
-        logger.exception("Full exception details:")
+        logger.exception(f"Failed to send verification email to {email}: {e}")
         return False
 
 
+def send_verification_emails_bulk(recipients: List[Tuple[str, str, str]]) -> int:
+    """
+    Send verification emails to many users with one SendGrid request per batch.
+
+    The message body is rendered once with substitution tags; each recipient
+    gets their own personalization carrying their username and link.
+
+    Args:
+        recipients: (email, verification_token, username) tuples
+
+    Returns:
+        int: Number of recipients in batches SendGrid accepted
+    """
+    if not EmailConfig.EMAIL_ENABLED:
+        logger.info(f"Email sending disabled. Skipping {len(recipients)} verification emails")
+        return 0
+
+    subject = "Verify Your Email - Sales Analytics"
+    html_body = _build_verification_email_html('-username-', '-verification_url-')
+    text_body = _build_verification_email_text('-username-', '-verification_url-')
+
+    sent = 0
+    for start in range(0, len(recipients), SENDGRID_MAX_PERSONALIZATIONS):
+        batch = recipients[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+        try:
+            to_emails = [
+                To(email, substitutions=[
+                    Substitution('-username-', username),
+                    Substitution('-verification_url-', _build_verification_url(verification_token))
+                ])
+                for email, verification_token, username in batch
+            ]
+            message = Mail(
+                from_email=(EmailConfig.EMAIL_FROM, EmailConfig.EMAIL_FROM_NAME),
+                to_emails=to_emails,
+                subject=subject,
+                plain_text_content=Content("text/plain", text_body),
+                html_content=Content("text/html", html_body),
+                is_multiple=True
+            )
+            response = _get_sendgrid_client().send(message)
+
+            if response.status_code in [200, 201, 202]:
+                sent += len(batch)
+            else:
+                logger.error(f"SendGrid returned status code {response.status_code} for {len(batch)} verification emails")
+
+        except Exception as e:
+            logger.error(f"Failed to send {len(batch)} verification emails: {e}")
+
+    logger.info(f"Verification emails sent via SendGrid to {sent} of {len(recipients)} users")
+    return sent
+
+
+def _build_verification_url(verification_token: str) -> str:
+    """Build the email verification link for a token."""
+    return f"{EmailConfig.EMAIL_VERIFICATION_URL}?verification_token={verification_token}"
+
+
 def _build_verification_email_html(username: str, verification_url: str) -> str:
     """Build HTML email body for verification."""
     return f"""
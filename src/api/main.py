@@ -2,44 +2,108 @@
 Main FastAPI application with authentication and analytics endpoints.
 Professional REST API with JWT authentication, email verification, and protected routes.
 """
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 
 from src.api.routers import auth, users, analytics, customers, products, geographic, revenue
-from src.database.connection import get_connection
+from src.api.users import flush_last_logins
+from src.config.constants import CORS_PREFLIGHT_MAX_AGE, GZIP_COMPRESS_LEVEL, GZIP_MIN_SIZE, LAST_LOGIN_FLUSH_INTERVAL
+from src.config.settings import APIConfig
+from src.database.connection import pooled_connection, open_pool, close_pool
 
 logger = logging.getLogger(__name__)
 
+
+async def _refresh_forecasts_periodically():
+    """Keep the common revenue forecasts precomputed, off the request path."""
+    while True:
+        await asyncio.to_thread(analytics.refresh_precomputed_forecasts)
+        await asyncio.sleep(APIConfig.FORECAST_REFRESH_INTERVAL)
+
+
+async def _flush_last_logins_periodically():
+    """Write buffered last-login timestamps in batches."""
+    while True:
+        await asyncio.sleep(LAST_LOGIN_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_last_logins)
+        except Exception as e:
+            # Keep flushing; unwritten timestamps stay buffered for the next run
+            logger.error(f"Error flushing last logins: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database pool, build the API schema and start background jobs on startup."""
+    try:
+        open_pool()
+    except Exception as e:
+        # Serve anyway; the health check reports the database as disconnected
+        logger.error(f"Could not open database pool on startup: {e}")
+
+    # Build the OpenAPI schema now; FastAPI keeps it, so /api/docs never waits on it
+    app.openapi()
+
+    refresher = None
+    if APIConfig.FORECAST_REFRESH_INTERVAL > 0:
+        refresher = asyncio.create_task(_refresh_forecasts_periodically())
+    login_flusher = asyncio.create_task(_flush_last_logins_periodically())
+
+    yield
+
+    if refresher is not None:
+        refresher.cancel()
+    login_flusher.cancel()
+    flush_last_logins()
+    close_pool()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Sales Analytics API",
     description="Professional REST API for sales analytics with secure authentication",
     version="1.0.0",
     docs_url="/api/docs",  # Swagger UI
-    redoc_url="/api/redoc"  # ReDoc
+    redoc_url="/api/redoc",  # ReDoc
+    default_response_class=ORJSONResponse,  # Faster encoding of large record lists
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend integration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=APIConfig.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=CORS_PREFLIGHT_MAX_AGE,
 )
 
+# Compress JSON responses; analytics records shrink several times over
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
+
+
+# The 500 body never changes, so it is encoded once
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "An unexpected error occurred. Please try again later."})
+
 
 # Global exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with detailed error messages."""
-    return JSONResponse(
+    # The request body is not echoed back; it can be large and may hold passwords
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors(), "body": exc.body}
+        content={"detail": jsonable_encoder(exc.errors())}
     )
 
 
@@ -47,20 +111,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors gracefully."""
     logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": "An unexpected error occurred. Please try again later."}
+        media_type="application/json"
     )
 
 
 # Include routers
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(analytics.router)
-app.include_router(customers.router)
-app.include_router(products.router)
-app.include_router(geographic.router)
-app.include_router(revenue.router)
+for module in (auth, users, analytics, customers, products, geographic, revenue):
+    app.include_router(module.router)
 
 
 # ==================== ROOT & SYSTEM ENDPOINTS ====================
@@ -91,12 +151,9 @@ async def health_check():
 
     # Check database connectivity
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
         health_status["database"] = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
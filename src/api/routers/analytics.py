@@ -2,26 +2,52 @@
 Analytics router for sales analytics and forecasting endpoints.
 """
 import logging
+from typing import Any, Dict, Tuple
 
+import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.api.dependencies import get_current_verified_user
+from src.api.dependencies import analytics_response_headers, get_current_verified_user
 from src.analytics import (
     get_kpis,
     get_monthly_revenue,
     get_revenue_forecast
 )
+from src.config.constants import CACHE_TTL_MEDIUM, PRECOMPUTED_FORECAST_PERIODS
+from src.utils.cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Fitting the model takes seconds, so repeat requests for the same horizon reuse it
+cached_revenue_forecast = ttl_cache(seconds=CACHE_TTL_MEDIUM)(get_revenue_forecast)
+
+# Forecasts for the common horizons, kept fresh by refresh_precomputed_forecasts()
+_precomputed_forecasts: Dict[int, Tuple[pd.DataFrame, Dict[str, Any]]] = {}
+
+
+def refresh_precomputed_forecasts() -> None:
+    """
+    Recompute the revenue forecast for each of PRECOMPUTED_FORECAST_PERIODS.
+
+    Runs in the background (see src.api.main) so requests for these horizons
+    are served without fitting a model. A failed horizon keeps its previous
+    forecast.
+    """
+    for periods in PRECOMPUTED_FORECAST_PERIODS:
+        try:
+            _precomputed_forecasts[periods] = get_revenue_forecast(periods=periods, include_history=False)
+        except Exception as e:
+            logger.error(f"Failed to precompute {periods}-day revenue forecast: {e}")
+
 router = APIRouter(
     prefix="/api/analytics",
-    tags=["Analytics"]
+    tags=["Analytics"],
+    dependencies=[Depends(get_current_verified_user), Depends(analytics_response_headers)]
 )
 
 
 @router.get("/kpis")
-async def get_analytics_kpis(current_user: dict = Depends(get_current_verified_user)):
+def get_analytics_kpis():
     """
     Get key performance indicators (KPIs).
 
@@ -37,8 +63,7 @@ async def get_analytics_kpis(current_user: dict = Depends(get_current_verified_u
     try:
         kpis = get_kpis()
         return {
-            "kpis": kpis,
-            "requested_by": current_user['email']
+            "kpis": kpis
         }
     except Exception as e:
         logger.error(f"Error fetching KPIs: {e}")
@@ -46,7 +71,7 @@ async def get_analytics_kpis(current_user: dict = Depends(get_current_verified_u
 
 
 @router.get("/revenue/monthly")
-async def get_analytics_monthly_revenue(current_user: dict = Depends(get_current_verified_user)):
+def get_analytics_monthly_revenue():
     """
     Get monthly revenue breakdown.
 
@@ -57,8 +82,7 @@ async def get_analytics_monthly_revenue(current_user: dict = Depends(get_current
     try:
         monthly_revenue = get_monthly_revenue()
         return {
-            "monthly_revenue": monthly_revenue.to_dict(orient='records'),
-            "requested_by": current_user['email']
+            "monthly_revenue": monthly_revenue.to_dict(orient='records')
         }
     except Exception as e:
         logger.error(f"Error fetching monthly revenue: {e}")
@@ -66,9 +90,8 @@ async def get_analytics_monthly_revenue(current_user: dict = Depends(get_current
 
 
 @router.get("/forecast/revenue")
-async def get_analytics_revenue_forecast(
-    periods: int = 30,
-    current_user: dict = Depends(get_current_verified_user)
+def get_analytics_revenue_forecast(
+    periods: int = 30
 ):
     """
     Get revenue forecast using Prophet ML model.
@@ -82,13 +105,15 @@ async def get_analytics_revenue_forecast(
     Requires authentication.
     """
     try:
-        forecast_df, summary = get_revenue_forecast(periods=periods, include_history=False)
+        forecast = _precomputed_forecasts.get(periods)
+        if forecast is None:
+            forecast = cached_revenue_forecast(periods=periods, include_history=False)
+        forecast_df, summary = forecast
 
         return {
             "forecast": forecast_df.to_dict(orient='records'),
             "summary": summary,
-            "model_accuracy": "63.6%",
-            "requested_by": current_user['email']
+            "model_accuracy": "63.6%"
         }
     except Exception as e:
         logger.error(f"Error generating forecast: {e}")
@@ -4,7 +4,7 @@ Authentication router for user registration, login, and email verification.
 from datetime import timedelta
 import logging
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from src.api.auth import (
     Token,
@@ -20,7 +20,9 @@ from src.api.users import (
     get_user_by_email,
     update_last_login
 )
+from src.api.dependencies import rate_limit
 from src.api.email_service import send_verification_email
+from src.config.constants import LOGIN_RATE_LIMIT, REGISTER_RATE_LIMIT
 from src.config.settings import EmailConfig
 
 logger = logging.getLogger(__name__)
@@ -31,8 +33,13 @@ router = APIRouter(
 )
 
 
-@router.post("/register", response_model=dict, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate):
+@router.post(
+    "/register",
+    response_model=dict,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(REGISTER_RATE_LIMIT, 60))]
+)
+def register(user: UserCreate, background_tasks: BackgroundTasks):
     """
     Register a new user.
 
@@ -43,6 +50,7 @@ async def register(user: UserCreate):
 
     Returns user details and verification token.
     Email verification required before accessing protected endpoints.
+    The verification email is sent after the response has been returned.
     """
     try:
         # Create user
@@ -55,10 +63,10 @@ async def register(user: UserCreate):
 
         logger.info(f"New user registered: {user.email}")
 
-        # Send verification email if enabled
-        email_sent = False
+        # Queue verification email so the response doesn't wait on SendGrid
         if EmailConfig.EMAIL_ENABLED:
-            email_sent = send_verification_email(
+            background_tasks.add_task(
+                send_verification_email,
                 email=new_user['email'],
                 verification_token=new_user['verification_token'],
                 username=new_user['username']
@@ -74,8 +82,8 @@ async def register(user: UserCreate):
             }
         }
 
-        # In development mode or if email failed, return token for testing
-        if not EmailConfig.EMAIL_ENABLED or not email_sent:
+        # In development mode, return token for testing
+        if not EmailConfig.EMAIL_ENABLED:
             response["verification_token"] = new_user['verification_token']
             response["note"] = "Email sending disabled. For testing, use: POST /api/auth/verify-email?verification_token=<token>"
         else:
@@ -91,7 +99,7 @@ async def register(user: UserCreate):
 
 
 @router.post("/verify-email")
-async def verify_email(verification_token: str):
+def verify_email(verification_token: str):
     """
     Verify user email using token.
 
@@ -110,8 +118,8 @@ async def verify_email(verification_token: str):
     return {"message": "Email verified successfully. You can now log in."}
 
 
-@router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin):
+@router.post("/login", response_model=Token, dependencies=[Depends(rate_limit(LOGIN_RATE_LIMIT, 60))])
+def login(user_credentials: UserLogin):
     """
     Login and receive JWT access token.
 
@@ -5,7 +5,7 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from src.api.dependencies import get_current_verified_user
+from src.api.dependencies import analytics_response_headers, get_current_verified_user
 from src.analytics.customer import (
     get_customer_segments,
     get_customer_lifetime_value,
@@ -16,14 +16,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/customers",
-    tags=["Customers"]
+    tags=["Customers"],
+    dependencies=[Depends(get_current_verified_user), Depends(analytics_response_headers)]
 )
 
 
 @router.get("/top")
-async def get_top_customers_endpoint(
-    limit: int = Query(default=10, ge=1, le=100, description="Number of top customers to return"),
-    current_user: dict = Depends(get_current_verified_user)
+def get_top_customers_endpoint(
+    limit: int = Query(default=10, ge=1, le=100, description="Number of top customers to return")
 ):
     """
     Get top customers by total spending.
@@ -42,8 +42,7 @@ async def get_top_customers_endpoint(
         top_customers = get_top_customers(limit=limit)
         return {
             "top_customers": top_customers.to_dict(orient='records'),
-            "count": len(top_customers),
-            "requested_by": current_user['email']
+            "count": len(top_customers)
         }
     except Exception as e:
         logger.error(f"Error fetching top customers: {e}")
@@ -51,9 +50,7 @@ async def get_top_customers_endpoint(
 
 
 @router.get("/segments")
-async def get_customer_segments_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_customer_segments_endpoint():
     """
     Get customer segmentation based on spending levels.
 
@@ -71,8 +68,7 @@ async def get_customer_segments_endpoint(
         segments = get_customer_segments()
         return {
             "segments": segments.to_dict(orient='records'),
-            "total_segments": len(segments),
-            "requested_by": current_user['email']
+            "total_segments": len(segments)
         }
     except Exception as e:
         logger.error(f"Error fetching customer segments: {e}")
@@ -80,9 +76,7 @@ async def get_customer_segments_endpoint(
 
 
 @router.get("/lifetime-value")
-async def get_customer_lifetime_value_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_customer_lifetime_value_endpoint():
     """
     Get customer lifetime value (CLV) analysis by segment.
 
@@ -98,8 +92,7 @@ async def get_customer_lifetime_value_endpoint(
     try:
         clv_data = get_customer_lifetime_value()
         return {
-            "lifetime_value": clv_data.to_dict(orient='records'),
-            "requested_by": current_user['email']
+            "lifetime_value": clv_data.to_dict(orient='records')
         }
     except Exception as e:
         logger.error(f"Error fetching customer lifetime value: {e}")
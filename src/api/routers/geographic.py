@@ -5,7 +5,7 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.api.dependencies import get_current_verified_user
+from src.api.dependencies import analytics_response_headers, get_current_verified_user
 from src.analytics.geographic import (
     get_revenue_by_country,
     get_country_performance_detailed
@@ -15,14 +15,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/geographic",
-    tags=["Geographic"]
+    tags=["Geographic"],
+    dependencies=[Depends(get_current_verified_user), Depends(analytics_response_headers)]
 )
 
 
 @router.get("/revenue-by-country")
-async def get_revenue_by_country_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_revenue_by_country_endpoint():
     """
     Get top 10 countries by revenue.
 
@@ -36,8 +35,7 @@ async def get_revenue_by_country_endpoint(
         revenue_by_country = get_revenue_by_country()
         return {
             "revenue_by_country": revenue_by_country.to_dict(orient='records'),
-            "count": len(revenue_by_country),
-            "requested_by": current_user['email']
+            "count": len(revenue_by_country)
         }
     except Exception as e:
         logger.error(f"Error fetching revenue by country: {e}")
@@ -45,9 +43,7 @@ async def get_revenue_by_country_endpoint(
 
 
 @router.get("/country-performance")
-async def get_country_performance_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_country_performance_endpoint():
     """
     Get detailed country performance metrics.
 
@@ -67,8 +63,7 @@ async def get_country_performance_endpoint(
         country_performance = get_country_performance_detailed()
         return {
             "country_performance": country_performance.to_dict(orient='records'),
-            "count": len(country_performance),
-            "requested_by": current_user['email']
+            "count": len(country_performance)
         }
     except Exception as e:
         logger.error(f"Error fetching country performance: {e}")
@@ -5,21 +5,21 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from src.api.dependencies import get_current_verified_user
+from src.api.dependencies import analytics_response_headers, get_current_verified_user
 from src.analytics.product import get_top_products
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/products",
-    tags=["Products"]
+    tags=["Products"],
+    dependencies=[Depends(get_current_verified_user), Depends(analytics_response_headers)]
 )
 
 
 @router.get("/top")
-async def get_top_products_endpoint(
-    limit: int = Query(default=10, ge=1, le=100, description="Number of top products to return"),
-    current_user: dict = Depends(get_current_verified_user)
+def get_top_products_endpoint(
+    limit: int = Query(default=10, ge=1, le=100, description="Number of top products to return")
 ):
     """
     Get top products by revenue.
@@ -38,8 +38,7 @@ async def get_top_products_endpoint(
         top_products = get_top_products(limit=limit)
         return {
             "top_products": top_products.to_dict(orient='records'),
-            "count": len(top_products),
-            "requested_by": current_user['email']
+            "count": len(top_products)
         }
     except Exception as e:
         logger.error(f"Error fetching top products: {e}")
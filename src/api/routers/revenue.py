@@ -5,7 +5,7 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.api.dependencies import get_current_verified_user
+from src.api.dependencies import analytics_response_headers, get_current_verified_user
 from src.analytics.revenue import (
     get_revenue_trend,
     get_monthly_revenue,
@@ -18,14 +18,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/revenue",
-    tags=["Revenue"]
+    tags=["Revenue"],
+    dependencies=[Depends(get_current_verified_user), Depends(analytics_response_headers)]
 )
 
 
 @router.get("/daily-trend")
-async def get_daily_revenue_trend(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_daily_revenue_trend():
     """
     Get daily revenue trend.
 
@@ -39,8 +38,7 @@ async def get_daily_revenue_trend(
         revenue_trend = get_revenue_trend()
         return {
             "daily_revenue": revenue_trend.to_dict(orient='records'),
-            "count": len(revenue_trend),
-            "requested_by": current_user['email']
+            "count": len(revenue_trend)
         }
     except Exception as e:
         logger.error(f"Error fetching daily revenue trend: {e}")
@@ -48,9 +46,7 @@ async def get_daily_revenue_trend(
 
 
 @router.get("/monthly")
-async def get_monthly_revenue_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_monthly_revenue_endpoint():
     """
     Get monthly revenue with order counts.
 
@@ -65,8 +61,7 @@ async def get_monthly_revenue_endpoint(
         monthly_revenue = get_monthly_revenue()
         return {
             "monthly_revenue": monthly_revenue.to_dict(orient='records'),
-            "count": len(monthly_revenue),
-            "requested_by": current_user['email']
+            "count": len(monthly_revenue)
         }
     except Exception as e:
         logger.error(f"Error fetching monthly revenue: {e}")
@@ -74,9 +69,7 @@ async def get_monthly_revenue_endpoint(
 
 
 @router.get("/growth")
-async def get_monthly_growth_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_monthly_growth_endpoint():
     """
     Get month-over-month revenue growth rate.
 
@@ -92,8 +85,7 @@ async def get_monthly_growth_endpoint(
         monthly_growth = get_monthly_growth()
         return {
             "monthly_growth": monthly_growth.to_dict(orient='records'),
-            "count": len(monthly_growth),
-            "requested_by": current_user['email']
+            "count": len(monthly_growth)
         }
     except Exception as e:
         logger.error(f"Error fetching monthly growth: {e}")
@@ -101,9 +93,7 @@ async def get_monthly_growth_endpoint(
 
 
 @router.get("/by-hour")
-async def get_sales_by_hour_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_sales_by_hour_endpoint():
     """
     Get sales pattern by hour of day.
 
@@ -120,8 +110,7 @@ async def get_sales_by_hour_endpoint(
         sales_by_hour = get_sales_by_hour()
         return {
             "sales_by_hour": sales_by_hour.to_dict(orient='records'),
-            "count": len(sales_by_hour),
-            "requested_by": current_user['email']
+            "count": len(sales_by_hour)
         }
     except Exception as e:
         logger.error(f"Error fetching sales by hour: {e}")
@@ -129,9 +118,7 @@ async def get_sales_by_hour_endpoint(
 
 
 @router.get("/by-day-of-week")
-async def get_sales_by_day_of_week_endpoint(
-    current_user: dict = Depends(get_current_verified_user)
-):
+def get_sales_by_day_of_week_endpoint():
     """
     Get sales pattern by day of week.
 
@@ -149,8 +136,7 @@ async def get_sales_by_day_of_week_endpoint(
         sales_by_day = get_sales_by_day_of_week()
         return {
             "sales_by_day": sales_by_day.to_dict(orient='records'),
-            "count": len(sales_by_day),
-            "requested_by": current_user['email']
+            "count": len(sales_by_day)
         }
     except Exception as e:
         logger.error(f"Error fetching sales by day of week: {e}")
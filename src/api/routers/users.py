@@ -12,7 +12,7 @@ router = APIRouter(
 
 
 @router.get("/me", response_model=dict)
-async def get_current_user_info(current_user: dict = Depends(get_current_verified_user)):
+def get_current_user_info(current_user: dict = Depends(get_current_verified_user)):
     """
     Get current authenticated user information.
 
@@ -2,100 +2,76 @@
 User database operations for authentication and user management.
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 import logging
+import threading
 
-from src.database.connection import get_connection
+from psycopg2.extras import RealDictCursor, execute_values
+
+from src.database.connection import pooled_connection
 from src.api.auth import get_password_hash, generate_verification_token
+from src.config.constants import USER_CACHE_TTL
+from src.utils.cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Logins not yet written to users.last_login, by email (see flush_last_logins)
+_pending_logins: Dict[str, datetime] = {}
+_pending_logins_lock = threading.Lock()
+
 
 def get_user_by_email(email: str) -> Optional[dict]:
    
-    conn = get_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, email, username, hashed_password, full_name,
-                   is_active, is_verified, is_superuser, created_at, last_login
-            FROM users
-            WHERE email = %s
-            """,
-            (email,)
-        )
-        row = cursor.fetchone()
-        cursor.close()
-
-        if row:
-            return {
-                'id': row[0],
-                'email': row[1],
-                'username': row[2],
-                'hashed_password': row[3],
-                'full_name': row[4],
-                'is_active': row[5],
-                'is_verified': row[6],
-                'is_superuser': row[7],
-                'created_at': row[8],
-                'last_login': row[9]
-            }
-        return None
-    except Exception as e:
-        logger.error(f"Error fetching user by email: {e}")
-        raise
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(
+                """
+                SELECT id, email, username, hashed_password, full_name,
+                       is_active, is_verified, is_superuser, created_at, last_login
+                FROM users
+                WHERE email = %s
+                """,
+                (email,)
+            )
+            row = cursor.fetchone()
+            cursor.close()
+            return row
+        except Exception as e:
+            logger.error("Error fetching user by email: %s", e)
+            raise
+
+
+# Authenticated requests reuse the user row briefly instead of querying it every
+# time. Writes below drop the entry; changes made elsewhere, such as deactivation
+# by an admin, take up to USER_CACHE_TTL seconds to apply.
+get_cached_user = ttl_cache(seconds=USER_CACHE_TTL)(get_user_by_email)
 
 
 def get_user_by_username(username: str) -> Optional[dict]:
 
-    conn = get_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, email, username, hashed_password, full_name,
-                   is_active, is_verified, is_superuser, created_at, last_login
-            FROM users
-            WHERE username = %s
-            """,
-            (username,)
-        )
-        row = cursor.fetchone()
-        cursor.close()
-
-        if row:
-            return {
-                'id': row[0],
-                'email': row[1],
-                'username': row[2],
-                'hashed_password': row[3],
-                'full_name': row[4],
-                'is_active': row[5],
-                'is_verified': row[6],
-                'is_superuser': row[7],
-                'created_at': row[8],
-                'last_login': row[9]
-            }
-        return None
-    except Exception as e:
-        logger.error(f"Error fetching user by username: {e}")
-        raise
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(
+                """
+                SELECT id, email, username, hashed_password, full_name,
+                       is_active, is_verified, is_superuser, created_at, last_login
+                FROM users
+                WHERE username = %s
+                """,
+                (username,)
+            )
+            row = cursor.fetchone()
+            cursor.close()
+            return row
+        except Exception as e:
+            logger.error("Error fetching user by username: %s", e)
+            raise
 
 
 def create_user(email: str, username: str, password: str, full_name: Optional[str] = None) -> dict:
    
-    # Check if user already exists
-    if get_user_by_email(email):
-        raise ValueError("Email already registered")
-
-    if get_user_by_username(username):
-        raise ValueError("Username already taken")
-
     # Hash password
     hashed_password = get_password_hash(password)
 
@@ -103,108 +79,151 @@ def create_user(email: str, username: str, password: str, full_name: Optional[st
     verification_token = generate_verification_token()
     verification_token_expires = datetime.utcnow() + timedelta(hours=24)
 
-    conn = get_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO users (email, username, hashed_password, full_name,
-                             verification_token, verification_token_expires)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            RETURNING id, email, username, full_name, is_active, is_verified,
-                      is_superuser, created_at, verification_token
-            """,
-            (email, username, hashed_password, full_name, verification_token, verification_token_expires)
-        )
-        row = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-
-        logger.info(f"User created successfully: {email}")
-
-        return {
-            'id': row[0],
-            'email': row[1],
-            'username': row[2],
-            'full_name': row[3],
-            'is_active': row[4],
-            'is_verified': row[5],
-            'is_superuser': row[6],
-            'created_at': row[7],
-            'verification_token': row[8]
-        }
-    except Exception as e:
-        conn.rollback()
-        logger.error(f"Error creating user: {e}")
-        raise
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(
+                """
+                INSERT INTO users (email, username, hashed_password, full_name,
+                                 verification_token, verification_token_expires)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT DO NOTHING
+                RETURNING id, email, username, full_name, is_active, is_verified,
+                          is_superuser, created_at, verification_token
+                """,
+                (email, username, hashed_password, full_name, verification_token, verification_token_expires)
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                # The unique email/username constraints rejected the row; find out which one
+                cursor.execute(
+                    """
+                    SELECT bool_or(email = %s) AS email_taken, bool_or(username = %s) AS username_taken
+                    FROM users
+                    WHERE email = %s OR username = %s
+                    """,
+                    (email, username, email, username)
+                )
+                taken = cursor.fetchone()
+
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            conn.rollback()
+            logger.error("Error creating user: %s", e)
+            raise
+
+    if row is None:
+        if taken['username_taken'] and not taken['email_taken']:
+            raise ValueError("Username already taken")
+        raise ValueError("Email already registered")
+
+    get_cached_user.cache_invalidate(email)
+    logger.info("User created successfully: %s", email)
+
+    return row
 
 
 def verify_user_email(verification_token: str) -> bool:
    
-    conn = get_connection()
-    try:
-        cursor = conn.cursor()
-
-        # Check if token exists and is not expired
-        cursor.execute(
-            """
-            UPDATE users
-            SET is_verified = TRUE,
-                verification_token = NULL,
-                verification_token_expires = NULL
-            WHERE verification_token = %s
-              AND verification_token_expires > NOW()
-              AND is_verified = FALSE
-            RETURNING id
-            """,
-            (verification_token,)
-        )
-
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-
-        if result:
-            logger.info(f"Email verified for user ID: {result[0]}")
-            return True
-
-        logger.warning(f"Invalid or expired verification token")
-        return False
-
-    except Exception as e:
-        conn.rollback()
-        logger.error(f"Error verifying email: {e}")
-        raise
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            cursor = conn.cursor()
+
+            # Check if token exists and is not expired
+            cursor.execute(
+                """
+                UPDATE users
+                SET is_verified = TRUE,
+                    verification_token = NULL,
+                    verification_token_expires = NULL
+                WHERE verification_token = %s
+                  AND verification_token_expires > NOW()
+                  AND is_verified = FALSE
+                RETURNING id, email
+                """,
+                (verification_token,)
+            )
+
+            result = cursor.fetchone()
+            conn.commit()
+            cursor.close()
+
+            if result:
+                get_cached_user.cache_invalidate(result[1])
+                logger.info("Email verified for user ID: %s", result[0])
+                return True
+
+            logger.warning("Invalid or expired verification token")
+            return False
+
+        except Exception as e:
+            conn.rollback()
+            logger.error("Error verifying email: %s", e)
+            raise
 
 
 def update_last_login(email: str):
     """
-    Update the last login timestamp for a user.
+    Record a successful login for a user.
+
+    The timestamp is held in memory and written by the next
+    flush_last_logins() call, so logins do not wait on a database write.
 
     Args:
         email: User's email address
     """
-    conn = get_connection()
+    with _pending_logins_lock:
+        _pending_logins[email] = datetime.utcnow()
+
+
+def flush_last_logins() -> int:
+    """
+    Write buffered last-login timestamps to the users table in one UPDATE.
+
+    Timestamps that fail to write are kept for the next flush unless a newer
+    login for the same user has been buffered since.
+
+    Returns:
+        int: Number of users whose last login was written
+    """
+    with _pending_logins_lock:
+        pending = dict(_pending_logins)
+        _pending_logins.clear()
+
+    if not pending:
+        return 0
+
+    # Borrowing is inside the try too, so the timestamps survive the database
+    # being unreachable or the pool being exhausted
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE users
-            SET last_login = NOW()
-            WHERE email = %s
-            """,
-            (email,)
-        )
-        conn.commit()
-        cursor.close()
-        logger.info(f"Updated last login for: {email}")
+        with pooled_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                execute_values(
+                    cursor,
+                    """
+                    UPDATE users
+                    SET last_login = v.login_at
+                    FROM (VALUES %s) AS v(email, login_at)
+                    WHERE users.email = v.email
+                    """,
+                    list(pending.items())
+                )
+                conn.commit()
+                cursor.close()
+            except Exception:
+                conn.rollback()
+                raise
     except Exception as e:
-        conn.rollback()
-        logger.error(f"Error updating last login: {e}")
-        raise
-    finally:
-        conn.close()
+        logger.error("Error updating last login for %s users: %s", len(pending), e)
+        with _pending_logins_lock:
+            for email, login_at in pending.items():
+                _pending_logins.setdefault(email, login_at)
+        return 0
+
+    for email in pending:
+        get_cached_user.cache_invalidate(email)
+    logger.info("Updated last login for %s users", len(pending))
+    return len(pending)
@@ -9,10 +9,18 @@ Repository: https://github.com/Sabahx/sales_analytics_dashboard
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import hashlib
+import json
 import sys
 import os
 
@@ -39,12 +47,13 @@ from src.analytics.geographic import (
     get_country_performance_detailed
 )
 from src.analytics.forecasting import (
+    get_daily_revenue,
     get_revenue_forecast,
     get_forecast_comparison
 )
 
 # Import configuration
-from src.config.settings import AppConfig
+from src.config.settings import AppConfig, PathConfig
 from src.config.constants import CHART_CONFIG, LOADING_MESSAGES, ERROR_MESSAGES
 from src.utils.logger import get_module_logger
 from src.utils.filters import get_date_range, get_available_countries, get_available_products
@@ -53,6 +62,14 @@ from src.utils.export import export_to_csv, export_to_excel, format_for_export
 # Initialize logger
 logger = get_module_logger(__name__)
 
+# Number formatters built once from AppConfig rather than on every call
+CURRENCY_FORMAT = f"{AppConfig.CURRENCY_SYMBOL}{{:,.{AppConfig.DECIMAL_PLACES}f}}".format
+NUMBER_FORMAT = f"{{:{AppConfig.THOUSAND_SEPARATOR}}}".format
+PERCENTAGE_FORMAT = f"{{:.{AppConfig.DECIMAL_PLACES - 1}f}}%".format
+
+# Growth bar colors indexed by whether the month grew (0: decline or no rate, 1: growth)
+GROWTH_BAR_COLORS = np.array(['#dc3545', '#28a745'])
+
 # Configure Streamlit page
 st.set_page_config(
     page_title=AppConfig.PAGE_TITLE,
@@ -78,6 +95,9 @@ st.markdown("""
 
 # ==================== DATA LOADING WITH CACHING ====================
 
+# DataFrame loaders use st.cache_resource so every rerun and session shares one
+# frame instead of unpickling a fresh copy; callers must not modify them in place.
+
 @st.cache_data(ttl=AppConfig.CACHE_TTL, show_spinner=LOADING_MESSAGES['kpis'])
 def load_kpis() -> Dict[str, Any]:
     """Load key performance indicators with caching."""
@@ -102,7 +122,7 @@ def load_summary() -> Dict[str, Any]:
         return {}
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_revenue_trend() -> pd.DataFrame:
     """Load daily revenue trend data."""
     try:
@@ -114,7 +134,7 @@ def load_revenue_trend() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_monthly_revenue() -> pd.DataFrame:
     """Load monthly revenue data."""
     try:
@@ -126,7 +146,7 @@ def load_monthly_revenue() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_monthly_growth() -> pd.DataFrame:
     """Load month-over-month growth data."""
     try:
@@ -138,7 +158,7 @@ def load_monthly_growth() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_top_products(limit: int = AppConfig.TOP_PRODUCTS_LIMIT) -> pd.DataFrame:
     """Load top products by revenue."""
     try:
@@ -150,7 +170,7 @@ def load_top_products(limit: int = AppConfig.TOP_PRODUCTS_LIMIT) -> pd.DataFrame
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_country_detailed() -> pd.DataFrame:
     """Load detailed country performance data."""
     try:
@@ -162,7 +182,7 @@ def load_country_detailed() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_customer_segments() -> pd.DataFrame:
     """Load customer segmentation data."""
     try:
@@ -174,7 +194,7 @@ def load_customer_segments() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_customer_lifetime_value() -> pd.DataFrame:
     """Load customer lifetime value data."""
     try:
@@ -186,7 +206,7 @@ def load_customer_lifetime_value() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_top_customers(limit: int = AppConfig.TOP_CUSTOMERS_LIMIT) -> pd.DataFrame:
     """Load top customers by spending."""
     try:
@@ -198,7 +218,7 @@ def load_top_customers(limit: int = AppConfig.TOP_CUSTOMERS_LIMIT) -> pd.DataFra
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_sales_by_hour() -> pd.DataFrame:
     """Load sales patterns by hour of day."""
     try:
@@ -210,7 +230,7 @@ def load_sales_by_hour() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
 def load_sales_by_day() -> pd.DataFrame:
     """Load sales patterns by day of week."""
     try:
@@ -222,19 +242,87 @@ def load_sales_by_day() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL * 2)  # Cache forecasts longer
+def read_forecast_cache(name: str):
+    """
+    Read a forecast saved by write_forecast_cache.
+
+    Args:
+        name (str): Cache entry name
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Any]] or None: The forecast and its summary,
+        or None if the entry is missing or unreadable
+    """
+    path = os.path.join(PathConfig.FORECAST_CACHE_DIR, name)
+    try:
+        forecast_df = pd.read_parquet(f"{path}.parquet")
+        with open(f"{path}.json") as f:
+            summary = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable forecast cache {name}: {e}")
+        return None
+    return forecast_df, summary
+
+
+def write_forecast_cache(name: str, forecast_df: pd.DataFrame, summary: Dict[str, Any], stale_prefix: str = None) -> None:
+    """
+    Save a forecast as Parquet with its summary in a JSON sidecar.
+
+    Files are written under a temporary name and renamed into place, so
+    readers never see a partial entry. Failures are logged, not raised.
+
+    Args:
+        name (str): Cache entry name
+        forecast_df (pd.DataFrame): Forecast rows
+        summary (Dict[str, Any]): Forecast summary
+        stale_prefix (str): Remove other entries whose names start with this prefix
+    """
+    path = os.path.join(PathConfig.FORECAST_CACHE_DIR, name)
+    try:
+        # The sidecar goes first; an entry only counts once its Parquet file exists
+        with open(f"{path}.json.tmp", 'w') as f:
+            json.dump(summary, f, default=float)
+        os.replace(f"{path}.json.tmp", f"{path}.json")
+        forecast_df.to_parquet(f"{path}.parquet.tmp", compression='zstd', index=False)
+        os.replace(f"{path}.parquet.tmp", f"{path}.parquet")
+
+        if stale_prefix:
+            for filename in os.listdir(PathConfig.FORECAST_CACHE_DIR):
+                if filename.startswith(stale_prefix) and not filename.startswith(f"{name}."):
+                    os.remove(os.path.join(PathConfig.FORECAST_CACHE_DIR, filename))
+    except Exception as e:
+        logger.warning(f"Could not save forecast cache {name}: {e}")
+
+
+@st.cache_resource(ttl=AppConfig.CACHE_TTL * 2)  # Cache forecasts longer
 def load_revenue_forecast(periods: int = 30):
     """Load revenue forecast data."""
     try:
+        # Forecasts are also saved to disk per horizon and revenue history,
+        # so a restart or cache expiry does not refit the model
+        history = get_daily_revenue()
+        fingerprint = (periods, len(history), str(history['date'].max()), float(history['revenue'].sum()))
+        cache_prefix = f"revenue_{AppConfig.FORECAST_ENGINE}_{periods}d_"
+        cache_name = f"{cache_prefix}{hashlib.sha1(repr(fingerprint).encode()).hexdigest()[:16]}"
+
+        cached = read_forecast_cache(cache_name)
+        if cached is not None:
+            logger.debug(f"Loaded {periods}-day revenue forecast from disk")
+            return cached
+
         logger.debug(f"Generating {periods}-day revenue forecast...")
-        return get_revenue_forecast(periods=periods, include_history=True)
+        forecast_df, summary = get_revenue_forecast(periods=periods, include_history=True)
+        write_forecast_cache(cache_name, forecast_df, summary, stale_prefix=cache_prefix)
+        return forecast_df, summary
     except Exception as e:
         logger.error(f"Error generating forecast: {e}")
         st.error(f"Failed to generate forecast: {str(e)}")
         return pd.DataFrame(), {}
 
 
-@st.cache_data(ttl=AppConfig.CACHE_TTL * 2)
+@st.cache_resource(ttl=AppConfig.CACHE_TTL * 2)
 def load_forecast_comparison():
     """Load forecast accuracy comparison."""
     try:
@@ -245,21 +333,98 @@ def load_forecast_comparison():
         return pd.DataFrame()
 
 
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
+def load_revenue_trend_figure():
+    """
+    Build the daily revenue trend chart once and share it across reruns.
+
+    The trend covers every day of history, so building it with plotly
+    express is the costliest chart on the page; reruns reuse the figure
+    until the cache expires. Callers must not modify it.
+
+    Returns:
+        go.Figure or None: The chart, or None when there is no trend data
+    """
+    trend_df = load_revenue_trend()
+    if trend_df.empty:
+        return None
+
+    fig = px.line(
+        trend_df, x='date', y='revenue',
+        title='Daily Revenue Trend',
+        labels={'date': 'Date', 'revenue': 'Revenue ($)'}
+    )
+    fig.update_traces(line_color='#1f77b4', line_width=2)
+    fig.update_layout(
+        hovermode='x unified',
+        plot_bgcolor='white',
+        height=AppConfig.CHART_HEIGHT
+    )
+    return fig
+
+
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
+def load_date_range() -> Tuple[datetime, datetime]:
+    """Load the first and last sale dates offered by the date filter."""
+    logger.debug("Loading date range...")
+    return get_date_range()
+
+
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
+def load_country_options() -> Tuple[str, ...]:
+    """Load the countries offered by the country filter."""
+    logger.debug("Loading country options...")
+    return tuple(get_available_countries())
+
+
+@st.cache_resource(ttl=AppConfig.CACHE_TTL)
+def load_product_options(limit: int = 50) -> Tuple[str, ...]:
+    """Load the top products offered by the product filter."""
+    logger.debug(f"Loading top {limit} product options...")
+    return tuple(get_available_products(limit=limit))
+
+
+def prefetch_dashboard_data() -> None:
+    """
+    Fill the loader caches concurrently so their queries overlap on a cold start.
+
+    One loader is submitted per distinct data source: the other KPI, revenue,
+    product and geographic views derive from the sales fact frame that
+    load_summary caches, and the segment view shares the CLV bucket query.
+    """
+    ctx = get_script_run_ctx()
+    loaders = [
+        (load_summary, ()),
+        (load_customer_lifetime_value, ()),
+        (load_top_customers, (20,)),
+        (load_forecast_comparison, ())
+    ]
+
+    # Worker threads need the session context so loader errors reach the page
+    with ThreadPoolExecutor(
+        max_workers=len(loaders),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        futures = [executor.submit(loader, *args) for loader, args in loaders]
+        for future in futures:
+            future.result()
+
+
 # ==================== HELPER FUNCTIONS ====================
 
 def format_currency(value: float) -> str:
     """Format value as currency using AppConfig settings."""
-    return f"{AppConfig.CURRENCY_SYMBOL}{value:,.{AppConfig.DECIMAL_PLACES}f}"
+    return CURRENCY_FORMAT(value)
 
 
 def format_number(value: float) -> str:
     """Format value as number with thousand separators."""
-    return f"{value:{AppConfig.THOUSAND_SEPARATOR}}"
+    return NUMBER_FORMAT(value)
 
 
 def format_percentage(value: float) -> str:
     """Format value as percentage."""
-    return f"{value:.{AppConfig.DECIMAL_PLACES-1}f}%"
+    return PERCENTAGE_FORMAT(value)
 
 
 def create_metric_card(label: str, value: str, delta: str = None) -> None:
@@ -270,6 +435,204 @@ def create_metric_card(label: str, value: str, delta: str = None) -> None:
         st.metric(label, value)
 
 
+# ==================== DASHBOARD SECTIONS ====================
+
+@st.fragment
+def render_forecast_section() -> None:
+    """
+    Render the ML forecast and accuracy tabs.
+
+    Runs as a fragment, so changing the forecast period reruns only this
+    section instead of the whole dashboard.
+    """
+    st.subheader("🔮 Revenue Forecasting (ML-Powered)")
+
+    tab1, tab2 = st.tabs(["📈 Future Predictions", "📊 Forecast Accuracy"])
+
+    with tab1:
+        col1, col2 = st.columns([3, 1])
+
+        with col2:
+            forecast_days = st.selectbox(
+                "Forecast Period",
+                options=[7, 14, 30, 60, 90],
+                index=2,
+                help="Number of days to forecast into the future"
+            )
+            if AppConfig.FORECAST_ENGINE == 'fast':
+                st.info("Using a linear trend model with day-of-week seasonality")
+            else:
+                st.info("Using Facebook Prophet ML model with automatic seasonality detection")
+
+        with col1:
+            with st.spinner(f"Generating {forecast_days}-day forecast using ML model..."):
+                forecast_df, forecast_summary = load_revenue_forecast(periods=forecast_days)
+
+            if not forecast_df.empty:
+                # Create forecast visualization
+                fig = go.Figure()
+
+                # Split fitted history from the forecast horizon once
+                is_future = forecast_df['ds'].to_numpy() > np.datetime64(pd.Timestamp.now())
+                historical = forecast_df[~is_future]
+                future = forecast_df[is_future]
+
+                # Add historical line
+                if not historical.empty:
+                    fig.add_trace(go.Scatter(
+                        x=historical['ds'],
+                        y=historical['yhat'],
+                        name='Historical (fitted)',
+                        line=dict(color='#1f77b4', width=2),
+                        mode='lines'
+                    ))
+
+                # Add forecast line
+                if not future.empty:
+                    fig.add_trace(go.Scatter(
+                        x=future['ds'],
+                        y=future['yhat'],
+                        name='Forecast',
+                        line=dict(color='#ff7f0e', width=2, dash='dash'),
+                        mode='lines'
+                    ))
+
+                    # Add confidence interval: upper bound forward, lower bound back
+                    ds = future['ds'].to_numpy()
+                    fig.add_trace(go.Scatter(
+                        x=np.concatenate([ds, ds[::-1]]),
+                        y=np.concatenate([future['yhat_upper'].to_numpy(), future['yhat_lower'].to_numpy()[::-1]]),
+                        fill='toself',
+                        fillcolor='rgba(255,127,14,0.2)',
+                        line=dict(color='rgba(255,255,255,0)'),
+                        name='Confidence Interval',
+                        showlegend=True
+                    ))
+
+                fig.update_layout(
+                    title=f'{forecast_days}-Day Revenue Forecast',
+                    xaxis_title='Date',
+                    yaxis_title='Revenue ($)',
+                    hovermode='x unified',
+                    height=500,
+                    plot_bgcolor='white'
+                )
+
+                st.plotly_chart(fig, use_container_width=True)
+
+                # Display forecast summary
+                if forecast_summary:
+                    st.markdown("#### 📊 Forecast Summary")
+                    col1, col2, col3, col4 = st.columns(4)
+
+                    with col1:
+                        avg_daily = forecast_summary.get('avg_predicted_value', 0)
+                        create_metric_card(
+                            "📈 Avg Daily Revenue",
+                            format_currency(avg_daily)
+                        )
+
+                    with col2:
+                        total_predicted = forecast_summary.get('total_predicted_value', 0)
+                        create_metric_card(
+                            "💰 Total Forecast",
+                            format_currency(total_predicted)
+                        )
+
+                    with col3:
+                        trend = forecast_summary.get('trend_direction', 'stable')
+                        trend_emoji = "📈" if trend == "increasing" else "📉" if trend == "decreasing" else "➡️"
+                        create_metric_card(
+                            "📊 Trend",
+                            f"{trend_emoji} {trend.capitalize()}"
+                        )
+
+                    with col4:
+                        accuracy = forecast_summary.get('accuracy_metrics', {})
+                        if accuracy:
+                            acc_pct = accuracy.get('accuracy_percent', 0)
+                            create_metric_card(
+                                "🎯 Model Accuracy",
+                                f"{acc_pct:.1f}%"
+                            )
+
+                # Show forecast data table
+                with st.expander("📋 View Forecast Data"):
+                    future_only = future.copy()
+                    future_only['date'] = future_only['ds'].dt.date
+                    future_only[['predicted_revenue', 'lower_bound', 'upper_bound']] = (
+                        future_only[['yhat', 'yhat_lower', 'yhat_upper']].map(CURRENCY_FORMAT).to_numpy()
+                    )
+                    display_df = future_only[['date', 'predicted_revenue', 'lower_bound', 'upper_bound']]
+                    st.dataframe(display_df, use_container_width=True)
+
+    with tab2:
+        st.markdown("### Model Accuracy Validation")
+        st.info("Comparing actual vs predicted values for the last 30 days to validate model accuracy")
+
+        comparison_df = load_forecast_comparison()
+
+        if not comparison_df.empty:
+            # Create comparison chart
+            fig = go.Figure()
+
+            fig.add_trace(go.Scatter(
+                x=comparison_df['date'],
+                y=comparison_df['actual_revenue'],
+                name='Actual Revenue',
+                line=dict(color='#1f77b4', width=2),
+                mode='lines+markers'
+            ))
+
+            fig.add_trace(go.Scatter(
+                x=comparison_df['date'],
+                y=comparison_df['predicted_revenue'],
+                name='Predicted Revenue',
+                line=dict(color='#ff7f0e', width=2, dash='dash'),
+                mode='lines+markers'
+            ))
+
+            fig.update_layout(
+                title='Actual vs Predicted Revenue (Last 30 Days)',
+                xaxis_title='Date',
+                yaxis_title='Revenue ($)',
+                hovermode='x unified',
+                height=400,
+                plot_bgcolor='white'
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Calculate accuracy metrics from one residual array; nanmean skips
+            # zero-revenue days like Series.mean did
+            difference = comparison_df['difference'].to_numpy(dtype=np.float64)
+            abs_difference = np.abs(difference)
+            mae = abs_difference.mean()
+            rmse = np.sqrt(np.dot(difference, difference) / difference.size)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mape = np.nanmean(abs_difference / comparison_df['actual_revenue'].to_numpy(dtype=np.float64)) * 100
+            accuracy = 100 - mape
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                create_metric_card("🎯 Accuracy", f"{accuracy:.1f}%")
+            with col2:
+                create_metric_card("📊 Avg Error", format_currency(mae))
+            with col3:
+                create_metric_card("📏 RMSE", format_currency(rmse))
+
+            # Show comparison table
+            with st.expander("📋 View Detailed Comparison"):
+                # Build the display columns directly instead of copying the numeric frame
+                currency_columns = ['actual_revenue', 'predicted_revenue', 'difference']
+                comparison_display = comparison_df[currency_columns].map(CURRENCY_FORMAT)
+                comparison_display.insert(0, 'date', comparison_df['date'].dt.date)
+                comparison_display['difference_pct'] = comparison_df['difference_pct'].map('{:.1f}%'.format)
+                st.dataframe(comparison_display, use_container_width=True)
+        else:
+            st.warning("Insufficient historical data for accuracy comparison (minimum 60 days required)")
+
+
 # ==================== MAIN APPLICATION ====================
 
 def main():
@@ -282,7 +645,7 @@ def main():
         # Date range filter
         st.subheader("Date Range")
         try:
-            min_date, max_date = get_date_range()
+            min_date, max_date = load_date_range()
             date_range = st.date_input(
                 "Select date range",
                 value=(min_date, max_date),
@@ -299,7 +662,7 @@ def main():
         # Country filter
         st.subheader("Countries")
         try:
-            all_countries = get_available_countries()
+            all_countries = load_country_options()
             selected_countries = st.multiselect(
                 "Select countries",
                 options=all_countries,
@@ -315,7 +678,7 @@ def main():
         # Product filter
         st.subheader("Products")
         try:
-            top_products_list = get_available_products(limit=50)
+            top_products_list = load_product_options(50)
             selected_products = st.multiselect(
                 "Select products",
                 options=top_products_list,
@@ -348,6 +711,7 @@ def main():
         st.markdown("---")
         if st.button("🔄 Refresh Data", use_container_width=True):
             st.cache_data.clear()
+            st.cache_resource.clear()
             st.rerun()
 
     # ==================== HEADER ====================
@@ -366,6 +730,7 @@ def main():
 
     # Load data
     with st.spinner("Loading dashboard data..."):
+        prefetch_dashboard_data()
         summary = load_summary()
         kpis = load_kpis()
 
@@ -407,61 +772,56 @@ def main():
     tab1, tab2, tab3 = st.tabs(["📅 Daily Trend", "📊 Monthly Analysis", "📈 Growth Rate"])
 
     with tab1:
-        trend_df = load_revenue_trend()
-        if not trend_df.empty:
-            fig = px.line(
-                trend_df, x='date', y='revenue',
-                title='Daily Revenue Trend',
-                labels={'date': 'Date', 'revenue': 'Revenue ($)'}
-            )
-            fig.update_traces(line_color='#1f77b4', line_width=2)
-            fig.update_layout(
-                hovermode='x unified',
-                plot_bgcolor='white',
-                height=AppConfig.CHART_HEIGHT
-            )
-            st.plotly_chart(fig, width='stretch')
+        trend_fig = load_revenue_trend_figure()
+        if trend_fig is not None:
+            st.plotly_chart(trend_fig, width='stretch')
 
     with tab2:
         monthly_df = load_monthly_revenue()
         if not monthly_df.empty:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = px.bar(
-                    monthly_df, x='month', y='revenue',
-                    title='Monthly Revenue',
-                    labels={'month': 'Month', 'revenue': 'Revenue ($)'},
-                    color='revenue',
-                    color_continuous_scale='Blues'
-                )
-                fig.update_xaxes(tickangle=-45)
-                fig.update_layout(height=AppConfig.CHART_HEIGHT)
-                st.plotly_chart(fig, width='stretch')
-
-            with col2:
-                fig = px.line(
-                    monthly_df, x='month', y='orders',
-                    title='Monthly Orders',
-                    labels={'month': 'Month', 'orders': 'Orders'},
-                    markers=True
-                )
-                fig.update_xaxes(tickangle=-45)
-                fig.update_layout(height=AppConfig.CHART_HEIGHT)
-                st.plotly_chart(fig, width='stretch')
+            # Revenue bars and order line share one figure on two y-axes
+            fig = make_subplots(specs=[[{'secondary_y': True}]])
+            fig.add_trace(go.Bar(
+                x=monthly_df['month'],
+                y=monthly_df['revenue'],
+                name='Revenue',
+                marker=dict(color=monthly_df['revenue'], colorscale='Blues'),
+                hovertemplate='<b>%{x}</b><br>Revenue: $%{y:,.2f}<extra></extra>'
+            ), secondary_y=False)
+            fig.add_trace(go.Scatter(
+                x=monthly_df['month'],
+                y=monthly_df['orders'],
+                name='Orders',
+                mode='lines+markers',
+                line=dict(color='#ff7f0e', width=2),
+                hovertemplate='<b>%{x}</b><br>Orders: %{y:,}<extra></extra>'
+            ), secondary_y=True)
+            fig.update_layout(
+                title='Monthly Revenue and Orders',
+                xaxis_title='Month',
+                hovermode='x unified',
+                height=AppConfig.CHART_HEIGHT,
+                plot_bgcolor='white'
+            )
+            fig.update_xaxes(tickangle=-45)
+            fig.update_yaxes(title_text='Revenue ($)', secondary_y=False)
+            fig.update_yaxes(title_text='Orders', secondary_y=True)
+            st.plotly_chart(fig, width='stretch')
 
     with tab3:
         growth_df = load_monthly_growth()
         if not growth_df.empty:
-            # Create bar chart with conditional coloring
-            colors = ['#28a745' if x > 0 else '#dc3545' for x in growth_df['growth_rate'].fillna(0)]
+            # Create bar chart with conditional coloring; months without a rate show red and N/A
+            growth_rate = growth_df['growth_rate'].to_numpy(dtype=np.float64)
+            colors = GROWTH_BAR_COLORS[(growth_rate > 0).view(np.uint8)]
+            labels = np.where(np.isnan(growth_rate), 'N/A', np.char.mod('%.1f%%', growth_rate))
 
             fig = go.Figure()
             fig.add_trace(go.Bar(
                 x=growth_df['month'],
                 y=growth_df['growth_rate'],
                 marker_color=colors,
-                text=growth_df['growth_rate'].apply(lambda x: f"{x:.1f}%" if pd.notna(x) else "N/A"),
+                text=labels,
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Growth: %{y:.1f}%<extra></extra>'
             ))
@@ -483,184 +843,7 @@ def main():
     st.markdown("---")
 
     # ==================== ML FORECASTING ====================
-    st.subheader("🔮 Revenue Forecasting (ML-Powered)")
-
-    tab1, tab2 = st.tabs(["📈 Future Predictions", "📊 Forecast Accuracy"])
-
-    with tab1:
-        col1, col2 = st.columns([3, 1])
-
-        with col2:
-            forecast_days = st.selectbox(
-                "Forecast Period",
-                options=[7, 14, 30, 60, 90],
-                index=2,
-                help="Number of days to forecast into the future"
-            )
-            st.info(f"Using Facebook Prophet ML model with automatic seasonality detection")
-
-        with col1:
-            with st.spinner(f"Generating {forecast_days}-day forecast using ML model..."):
-                forecast_df, forecast_summary = load_revenue_forecast(periods=forecast_days)
-
-            if not forecast_df.empty:
-                # Create forecast visualization
-                fig = go.Figure()
-
-                # Historical data
-                historical = forecast_df[forecast_df['ds'] <= pd.Timestamp.now()]
-                future = forecast_df[forecast_df['ds'] > pd.Timestamp.now()]
-
-                # Add historical line
-                if not historical.empty:
-                    fig.add_trace(go.Scatter(
-                        x=historical['ds'],
-                        y=historical['yhat'],
-                        name='Historical (fitted)',
-                        line=dict(color='#1f77b4', width=2),
-                        mode='lines'
-                    ))
-
-                # Add forecast line
-                if not future.empty:
-                    fig.add_trace(go.Scatter(
-                        x=future['ds'],
-                        y=future['yhat'],
-                        name='Forecast',
-                        line=dict(color='#ff7f0e', width=2, dash='dash'),
-                        mode='lines'
-                    ))
-
-                    # Add confidence interval
-                    fig.add_trace(go.Scatter(
-                        x=future['ds'].tolist() + future['ds'].tolist()[::-1],
-                        y=future['yhat_upper'].tolist() + future['yhat_lower'].tolist()[::-1],
-                        fill='toself',
-                        fillcolor='rgba(255,127,14,0.2)',
-                        line=dict(color='rgba(255,255,255,0)'),
-                        name='Confidence Interval',
-                        showlegend=True
-                    ))
-
-                fig.update_layout(
-                    title=f'{forecast_days}-Day Revenue Forecast',
-                    xaxis_title='Date',
-                    yaxis_title='Revenue ($)',
-                    hovermode='x unified',
-                    height=500,
-                    plot_bgcolor='white'
-                )
-
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Display forecast summary
-                if forecast_summary:
-                    st.markdown("#### 📊 Forecast Summary")
-                    col1, col2, col3, col4 = st.columns(4)
-
-                    with col1:
-                        avg_daily = forecast_summary.get('avg_predicted_value', 0)
-                        create_metric_card(
-                            "📈 Avg Daily Revenue",
-                            format_currency(avg_daily)
-                        )
-
-                    with col2:
-                        total_predicted = forecast_summary.get('total_predicted_value', 0)
-                        create_metric_card(
-                            "💰 Total Forecast",
-                            format_currency(total_predicted)
-                        )
-
-                    with col3:
-                        trend = forecast_summary.get('trend_direction', 'stable')
-                        trend_emoji = "📈" if trend == "increasing" else "📉" if trend == "decreasing" else "➡️"
-                        create_metric_card(
-                            "📊 Trend",
-                            f"{trend_emoji} {trend.capitalize()}"
-                        )
-
-                    with col4:
-                        accuracy = forecast_summary.get('accuracy_metrics', {})
-                        if accuracy:
-                            acc_pct = accuracy.get('accuracy_percent', 0)
-                            create_metric_card(
-                                "🎯 Model Accuracy",
-                                f"{acc_pct:.1f}%"
-                            )
-
-                # Show forecast data table
-                with st.expander("📋 View Forecast Data"):
-                    future_only = forecast_df[forecast_df['ds'] > pd.Timestamp.now()].copy()
-                    future_only['date'] = future_only['ds'].dt.date
-                    future_only['predicted_revenue'] = future_only['yhat'].apply(lambda x: f"${x:,.2f}")
-                    future_only['lower_bound'] = future_only['yhat_lower'].apply(lambda x: f"${x:,.2f}")
-                    future_only['upper_bound'] = future_only['yhat_upper'].apply(lambda x: f"${x:,.2f}")
-                    display_df = future_only[['date', 'predicted_revenue', 'lower_bound', 'upper_bound']]
-                    st.dataframe(display_df, use_container_width=True)
-
-    with tab2:
-        st.markdown("### Model Accuracy Validation")
-        st.info("Comparing actual vs predicted values for the last 30 days to validate model accuracy")
-
-        comparison_df = load_forecast_comparison()
-
-        if not comparison_df.empty:
-            # Create comparison chart
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatter(
-                x=comparison_df['date'],
-                y=comparison_df['actual_revenue'],
-                name='Actual Revenue',
-                line=dict(color='#1f77b4', width=2),
-                mode='lines+markers'
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=comparison_df['date'],
-                y=comparison_df['predicted_revenue'],
-                name='Predicted Revenue',
-                line=dict(color='#ff7f0e', width=2, dash='dash'),
-                mode='lines+markers'
-            ))
-
-            fig.update_layout(
-                title='Actual vs Predicted Revenue (Last 30 Days)',
-                xaxis_title='Date',
-                yaxis_title='Revenue ($)',
-                hovermode='x unified',
-                height=400,
-                plot_bgcolor='white'
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Calculate accuracy metrics
-            mae = comparison_df['difference'].abs().mean()
-            mape = (comparison_df['difference'].abs() / comparison_df['actual_revenue']).mean() * 100
-            accuracy = 100 - mape
-
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                create_metric_card("🎯 Accuracy", f"{accuracy:.1f}%")
-            with col2:
-                create_metric_card("📊 Avg Error", format_currency(mae))
-            with col3:
-                rmse = (comparison_df['difference'] ** 2).mean() ** 0.5
-                create_metric_card("📏 RMSE", format_currency(rmse))
-
-            # Show comparison table
-            with st.expander("📋 View Detailed Comparison"):
-                comparison_display = comparison_df.copy()
-                comparison_display['date'] = comparison_display['date'].dt.date
-                comparison_display['actual_revenue'] = comparison_display['actual_revenue'].apply(lambda x: f"${x:,.2f}")
-                comparison_display['predicted_revenue'] = comparison_display['predicted_revenue'].apply(lambda x: f"${x:,.2f}")
-                comparison_display['difference'] = comparison_display['difference'].apply(lambda x: f"${x:,.2f}")
-                comparison_display['difference_pct'] = comparison_display['difference_pct'].apply(lambda x: f"{x:.1f}%")
-                st.dataframe(comparison_display, use_container_width=True)
-        else:
-            st.warning("Insufficient historical data for accuracy comparison (minimum 60 days required)")
+    render_forecast_section()
 
     st.markdown("---")
 
@@ -692,7 +875,8 @@ def main():
     with col2:
         if not products_df.empty:
             st.markdown("#### 📊 Product Insights")
-            top_product = products_df.iloc[0]
+            # Read the leading row column by column rather than as a mixed-type row Series
+            top_product = {column: values.iat[0] for column, values in products_df.items()}
 
             create_metric_card("🥇 Top Product", top_product['product'][:30] + "...")
             create_metric_card("💰 Revenue", format_currency(top_product['revenue']))
@@ -702,9 +886,8 @@ def main():
             st.markdown("---")
 
             # Calculate concentration
-            total_revenue = kpis['revenue']
-            top_5_revenue = products_df.head(5)['revenue'].sum()
-            top_5_percent = (top_5_revenue / total_revenue) * 100
+            top_5_revenue = products_df['revenue'].to_numpy()[:5].sum()
+            top_5_percent = top_5_revenue / kpis['revenue'] * 100
 
             st.info(f"📊 **Top 5 products** generate **{top_5_percent:.1f}%** of total revenue")
 
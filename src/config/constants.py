@@ -42,6 +42,20 @@ CUSTOMER_SEGMENTS = {
     }
 }
 
+# Spend segment labels indexed by width_bucket(total_spent, ARRAY[500, 2000, 5000])
+SPEND_SEGMENT_LABELS = {
+    0: 'Low Value (<$500)',
+    1: 'Medium Value ($500-$2K)',
+    2: 'High Value ($2K-$5K)',
+    3: 'VIP (>$5K)'
+}
+SPEND_SEGMENT_NAMES = {
+    0: 'Low Value',
+    1: 'Medium Value',
+    2: 'High Value',
+    3: 'VIP'
+}
+
 # Customer lifetime value thresholds (in currency)
 CLV_THRESHOLDS = {
     'high_value': 10000,
@@ -139,6 +153,18 @@ REQUIRED_CSV_COLUMNS = [
     'InvoiceDate', 'UnitPrice', 'CustomerID', 'Country'
 ]
 
+# CSV column to database column mapping
+CSV_TO_DB_COLUMNS = {
+    'InvoiceNo': 'invoice_no',
+    'StockCode': 'stock_code',
+    'Description': 'description',
+    'Quantity': 'quantity',
+    'InvoiceDate': 'invoice_date',
+    'UnitPrice': 'unit_price',
+    'CustomerID': 'customer_id',
+    'Country': 'country'
+}
+
 
 # ===========================
 # Database Constants
@@ -146,10 +172,41 @@ REQUIRED_CSV_COLUMNS = [
 
 # Table names
 TABLE_SALES_TRANSACTIONS = 'sales_transactions'
+TABLE_STAGING_SALES = 'staging_sales_transactions'
+
+# Column order used when bulk loading sales transactions
+SALES_TRANSACTION_COLUMNS = [
+    'invoice_no', 'stock_code', 'description', 'quantity', 'invoice_date',
+    'unit_price', 'customer_id', 'country', 'total_amount'
+]
+
+# Secondary indexes on sales_transactions (see sql/init.sql), rebuilt after bulk loads
+SALES_TRANSACTION_INDEXES = {
+    'idx_invoice_no': ('invoice_no',),
+    'idx_invoice_date': ('invoice_date',),
+    'idx_customer_id': ('customer_id',),
+    'idx_country': ('country',),
+    'idx_stock_code': ('stock_code',),
+    'idx_date_country': ('invoice_date', 'country'),
+    'idx_customer_date': ('customer_id', 'invoice_date')
+}
+
+# Memory for index builds after a bulk load
+DB_MAINTENANCE_WORK_MEM = '512MB'
 
 # Batch size for database operations
 DB_BATCH_SIZE = 1000
 
+# Rows fetched per round trip when streaming query results
+DB_FETCH_SIZE = 10000
+
+# Concurrent connections used for parallel COPY during bulk loads
+DB_COPY_WORKERS = 4
+
+# Seconds a pooled connection may sit idle before it is checked on reuse; the
+# server may have closed it meanwhile (Neon suspends idle compute)
+DB_POOL_CHECK_AFTER_IDLE = 60
+
 # Query timeout in seconds
 DB_QUERY_TIMEOUT = 30
 
@@ -161,11 +218,18 @@ DB_QUERY_TIMEOUT = 30
 # CSV encoding
 CSV_ENCODING = 'ISO-8859-1'
 
+# Bytes handed to each CSV parser thread at a time
+CSV_READ_BLOCK_SIZE = 32 << 20  # 32 MB
+
+# Bytes per chunk when streaming a CSV (~100k rows of the sales export)
+CSV_STREAM_BLOCK_SIZE = 8 << 20  # 8 MB
+
 # Cancelled order prefix
 CANCELLED_ORDER_PREFIX = 'C'
 
 # Date formats
 DATE_FORMAT_INPUT = '%Y-%m-%d %H:%M:%S'
+INVOICE_DATE_FORMATS = ['%m/%d/%Y %H:%M', DATE_FORMAT_INPUT]
 DATE_FORMAT_OUTPUT = '%Y-%m-%d'
 DATE_FORMAT_DISPLAY = '%B %d, %Y'
 
@@ -215,6 +279,53 @@ CACHE_TTL_SHORT = 300     # 5 minutes
 CACHE_TTL_MEDIUM = 600    # 10 minutes
 CACHE_TTL_LONG = 1800     # 30 minutes
 
+# Lifetime of the in-memory sales fact frame behind the KPI/revenue views
+FACT_CACHE_TTL = 60       # 1 minute
+
+# How long API clients may reuse an analytics response (Cache-Control max-age)
+API_CACHE_MAX_AGE = 60    # 1 minute
+
+# Requests per client address per minute on the costly auth endpoints
+REGISTER_RATE_LIMIT = 5
+LOGIN_RATE_LIMIT = 10
+
+# Tracked client addresses before idle ones are dropped by the rate limiter
+RATE_LIMIT_MAX_CLIENTS = 10000
+
+# How long browsers may cache a CORS preflight response
+CORS_PREFLIGHT_MAX_AGE = 86400  # 1 day
+
+# API responses smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024      # 1 KB
+
+# Gzip level for API responses; higher levels cost CPU for little gain on JSON
+GZIP_COMPRESS_LEVEL = 5
+
+# Decoded API access tokens kept in memory
+TOKEN_CACHE_SIZE = 8192
+
+# How long a successful password check is remembered for repeat logins
+PASSWORD_VERIFY_CACHE_TTL = 60  # 1 minute
+
+# How long an authenticated user's record is reused between API requests
+USER_CACHE_TTL = 30       # 30 seconds
+
+# Seconds between batched writes of buffered last-login timestamps
+LAST_LOGIN_FLUSH_INTERVAL = 10
+
+# Fewest days of history a product or country forecast is attempted with
+MIN_FORECAST_HISTORY_DAYS = 30
+
+# Fitted forecast models kept in memory
+FORECAST_MODEL_CACHE_SIZE = 32
+
+# Standard normal quantile for the 95% band of the linear seasonal forecaster,
+# matching the interval width of the Prophet models
+FORECAST_INTERVAL_Z = 1.96
+
+# Revenue forecast horizons (days) the API keeps precomputed
+PRECOMPUTED_FORECAST_PERIODS = (7, 30, 90)
+
 # Pagination
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 1000
@@ -232,3 +343,11 @@ MAX_EXPORT_SIZE_MB = 100
 
 # Export date format
 EXPORT_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+
+# ===========================
+# Email Constants
+# ===========================
+
+# Recipients SendGrid accepts in one v3 mail/send request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
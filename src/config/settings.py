@@ -35,6 +35,10 @@ class DatabaseConfig:
     DB_HOST: str = os.getenv('DB_HOST', 'localhost')
     DB_PORT: int = int(os.getenv('DB_PORT', '5432'))
 
+    # Connection pool bounds for request-serving code
+    DB_POOL_MIN: int = int(os.getenv('DB_POOL_MIN', '2'))
+    DB_POOL_MAX: int = int(os.getenv('DB_POOL_MAX', '16'))
+
     @classmethod
     def get_connection_string(cls) -> str:
         """
@@ -77,6 +81,13 @@ class AppConfig:
     AUTO_REFRESH: bool = os.getenv('AUTO_REFRESH', 'false').lower() == 'true'
     REFRESH_INTERVAL: int = int(os.getenv('REFRESH_INTERVAL', '300'))  # 5 minutes default
 
+    # Revenue forecast model: 'prophet', or 'fast' for the linear seasonal model
+    FORECAST_ENGINE: str = os.getenv('FORECAST_ENGINE', 'prophet').lower()
+
+    # Fit a throwaway Prophet model when the forecasting module is imported, so
+    # the first forecast request skips the backend's start-up cost
+    WARMUP_PROPHET: bool = os.getenv('WARMUP_PROPHET', 'true').lower() == 'true'
+
     # Display settings
     CHART_HEIGHT: int = 400
     TOP_PRODUCTS_LIMIT: int = 10
@@ -119,6 +130,23 @@ class APIConfig:
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES', '30'))
 
+    # bcrypt cost factor for new password hashes (existing hashes keep their own)
+    BCRYPT_ROUNDS: int = int(os.getenv('BCRYPT_ROUNDS', '12'))
+
+    # Browser origins allowed to call the API (comma-separated)
+    CORS_ORIGINS: list = [
+        origin.strip()
+        for origin in os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:8501').split(',')
+        if origin.strip()
+    ]
+
+    # Reverse proxies in front of the API that each append the caller's address to
+    # X-Forwarded-For (Railway's edge proxy adds one). 0 trusts the socket peer only.
+    TRUSTED_PROXY_HOPS: int = int(os.getenv('TRUSTED_PROXY_HOPS', '0'))
+
+    # Seconds between background refreshes of the common revenue forecasts (0 disables)
+    FORECAST_REFRESH_INTERVAL: int = int(os.getenv('FORECAST_REFRESH_INTERVAL', '900'))  # 15 minutes default
+
     # API Documentation
     API_TITLE: str = "Sales Analytics API"
     API_DESCRIPTION: str = "Professional REST API for sales analytics with secure authentication"
@@ -185,6 +213,9 @@ class PathConfig:
     DATA_DIR: str = os.path.join(PROJECT_ROOT, 'data')
     RAW_DATA_DIR: str = os.path.join(DATA_DIR, 'raw')
 
+    # Saved dashboard forecasts, reused across restarts
+    FORECAST_CACHE_DIR: str = os.path.join(DATA_DIR, 'forecasts')
+
     # Log directory
     LOG_DIR: str = os.path.join(PROJECT_ROOT, 'logs')
 
@@ -197,6 +228,7 @@ class PathConfig:
         directories = [
             cls.DATA_DIR,
             cls.RAW_DATA_DIR,
+            cls.FORECAST_CACHE_DIR,
             cls.LOG_DIR
         ]
         for directory in directories:
@@ -1,17 +1,81 @@
 """
 Data extraction module for loading CSV files.
 """
-import pandas as pd
-from src.config.constants import CSV_ENCODING, REQUIRED_CSV_COLUMNS
+import csv
+
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from src.config.constants import (
+    CSV_ENCODING,
+    CSV_READ_BLOCK_SIZE,
+    CSV_STREAM_BLOCK_SIZE,
+    REQUIRED_CSV_COLUMNS
+)
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger(__name__)
 
+# Explicit Arrow types so the reader never has to infer them. Identifier
+# columns stay strings ('536365' and 'C536379' share a column).
+CSV_ARROW_TYPES = {
+    'InvoiceNo': pa.string(),
+    'StockCode': pa.string(),
+    'Description': pa.string(),
+    'Quantity': pa.int32(),
+    'InvoiceDate': pa.string(),
+    'UnitPrice': pa.float64(),
+    'CustomerID': pa.float64(),  # float to handle NaN
+    'Country': pa.string()
+}
+
+
+def _read_header(file_path, encoding):
+    """
+    Read the header row of a CSV file.
+
+    Args:
+        file_path (str): Path to CSV file
+        encoding (str): File encoding
+
+    Returns:
+        list: Column names in file order
+    """
+    with open(file_path, 'r', encoding=encoding, newline='') as csv_file:
+        return next(csv.reader(csv_file), [])
+
+
+def _validate_header(file_path, encoding):
+    """
+    Check that a CSV file has every required column.
+
+    Args:
+        file_path (str): Path to CSV file
+        encoding (str): File encoding
+
+    Raises:
+        ValueError: If CSV is missing required columns
+    """
+    missing_columns = set(REQUIRED_CSV_COLUMNS) - set(_read_header(file_path, encoding))
+    if missing_columns:
+        raise ValueError(f"CSV missing required columns: {missing_columns}")
+
+
+def _convert_options():
+    """Arrow conversion options projecting the required, typed columns."""
+    return pa_csv.ConvertOptions(
+        include_columns=REQUIRED_CSV_COLUMNS,
+        column_types=CSV_ARROW_TYPES,
+        strings_can_be_null=True
+    )
+
 
 def extract_csv(file_path, encoding=CSV_ENCODING):
     """
     Extract data from CSV file.
 
+    Parsing is done by Arrow's multi-threaded CSV reader, projected to the
+    required columns with fixed types.
+
     Args:
         file_path (str): Path to CSV file
         encoding (str): File encoding (default: from constants)
@@ -26,13 +90,16 @@ def extract_csv(file_path, encoding=CSV_ENCODING):
     logger.info(f"Loading CSV from {file_path}...")
 
     try:
-        df = pd.read_csv(file_path, encoding=encoding)
-        logger.info(f"Loaded {len(df)} rows")
-
         # Validate required columns
-        missing_columns = set(REQUIRED_CSV_COLUMNS) - set(df.columns)
-        if missing_columns:
-            raise ValueError(f"CSV missing required columns: {missing_columns}")
+        _validate_header(file_path, encoding)
+
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=encoding, block_size=CSV_READ_BLOCK_SIZE),
+            convert_options=_convert_options()
+        )
+        df = table.to_pandas()
+        logger.info(f"Loaded {len(df)} rows")
 
         logger.debug(f"CSV columns: {list(df.columns)}")
         return df
@@ -43,3 +110,40 @@ def extract_csv(file_path, encoding=CSV_ENCODING):
     except Exception as e:
         logger.error(f"Error reading CSV: {e}")
         raise
+
+
+def extract_csv_chunks(file_path, encoding=CSV_ENCODING, block_size=CSV_STREAM_BLOCK_SIZE):
+    """
+    Extract data from CSV file one chunk at a time.
+
+    Only one block of the file is held in memory at once, so large exports
+    can be processed in a small container.
+
+    Args:
+        file_path (str): Path to CSV file
+        encoding (str): File encoding (default: from constants)
+        block_size (int): Bytes of CSV parsed per chunk
+
+    Yields:
+        pd.DataFrame: Raw dataframe for each chunk of the CSV
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV is missing required columns
+    """
+    logger.info(f"Streaming CSV from {file_path}...")
+    _validate_header(file_path, encoding)
+
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(encoding=encoding, block_size=block_size),
+        convert_options=_convert_options()
+    )
+
+    total_rows = 0
+    for batch in reader:
+        total_rows += batch.num_rows
+        logger.debug(f"Read chunk of {batch.num_rows} rows ({total_rows} so far)")
+        yield batch.to_pandas()
+
+    logger.info(f"Streamed {total_rows} rows")
@@ -1,20 +1,256 @@
 """
 Data loading module for inserting data into PostgreSQL database.
 """
+import csv
+import io
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
-from src.database.connection import get_connection
-from src.config.constants import TABLE_SALES_TRANSACTIONS, DB_BATCH_SIZE
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import encodings as pg_encodings
+from psycopg2.extras import execute_values
+
+from src.database.connection import CONNECTION_ERRORS, get_connection
+from src.config.constants import (
+    TABLE_SALES_TRANSACTIONS,
+    TABLE_STAGING_SALES,
+    SALES_TRANSACTION_COLUMNS,
+    SALES_TRANSACTION_INDEXES,
+    REQUIRED_CSV_COLUMNS,
+    CSV_TO_DB_COLUMNS,
+    CSV_ENCODING,
+    CANCELLED_ORDER_PREFIX,
+    MIN_QUANTITY,
+    MIN_UNIT_PRICE,
+    DB_BATCH_SIZE,
+    DB_COPY_WORKERS,
+    DB_MAINTENANCE_WORK_MEM
+)
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger(__name__)
 
+# PostgreSQL binary COPY framing (see "COPY ... BINARY" file format docs)
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+PG_EPOCH = datetime(2000, 1, 1)
+
+_NULL_FIELD = struct.pack('>i', -1)
+_FIELD_COUNT = struct.pack('>h', len(SALES_TRANSACTION_COLUMNS))
+
+# Size of each slice handed to COPY while streaming
+COPY_CHUNK_BYTES = 64 * 1024
+
+
+def _prepare_frame(df):
+    """
+    Project a cleaned dataframe onto typed database columns.
+
+    All casts happen once per column so row serialization never has to
+    convert individual values.
+
+    Args:
+        df (pd.DataFrame): Cleaned dataframe
+
+    Returns:
+        pd.DataFrame: Columns named and ordered like SALES_TRANSACTION_COLUMNS
+    """
+    return pd.DataFrame({
+        'invoice_no': df['InvoiceNo'].astype(str),
+        'stock_code': df['StockCode'].astype(str),
+        'description': df['Description'].fillna('Unknown'),
+        'quantity': df['Quantity'].astype('int32'),
+        'invoice_date': pd.to_datetime(df['InvoiceDate']),
+        'unit_price': df['UnitPrice'].astype('float64'),
+        'customer_id': df['CustomerID'].astype('Int32'),
+        'country': df['Country'].astype(str),
+        'total_amount': df['TotalAmount'].astype('float64')
+    }, columns=SALES_TRANSACTION_COLUMNS)
+
+
+def _nullable_values(series):
+    """Return column values as a list with missing entries as None."""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _prepare_rows(frame):
+    """
+    Convert a typed frame into row tuples for execute_values.
+
+    Args:
+        frame (pd.DataFrame): Output of _prepare_frame
+
+    Returns:
+        list: Tuples ordered like SALES_TRANSACTION_COLUMNS
+    """
+    frame = frame.assign(customer_id=_nullable_values(frame['customer_id']))
+    return list(frame.itertuples(index=False, name=None))
+
+
+def _to_scaled_int(series, scale=2):
+    """Round a float column to a fixed number of decimals as int64."""
+    return np.rint(series.to_numpy(dtype='float64') * 10 ** scale).astype(np.int64)
+
+
+def _encode_numeric(scaled, scale=2):
+    """
+    Encode a number as a PostgreSQL binary NUMERIC field (base-10000 digits).
+
+    Args:
+        scaled (int): Value multiplied by 10**scale and rounded
+        scale (int): Number of decimal places to keep
+
+    Returns:
+        bytes: Length-prefixed binary NUMERIC field
+    """
+    sign = 0x4000 if scaled < 0 else 0x0000
+    integer, fraction = divmod(abs(scaled), 10 ** scale)
+
+    digits = []
+    while integer:
+        integer, digit = divmod(integer, 10000)
+        digits.insert(0, digit)
+    weight = len(digits) - 1
+
+    # Fractional part fits in a single base-10000 digit for scale <= 4
+    digits.append(fraction * 10 ** (4 - scale))
+    while digits and digits[-1] == 0:
+        digits.pop()
+    if not digits:
+        weight, sign = 0, 0x0000
+
+    body = struct.pack('>hhHh', len(digits), weight, sign, scale)
+    body += struct.pack(f'>{len(digits)}H', *digits)
+    return struct.pack('>i', len(body)) + body
+
+
+def _encode_text(value, encoding):
+    """Encode a string as a length-prefixed binary COPY field."""
+    if value is None:
+        return _NULL_FIELD
+    data = value.encode(encoding)
+    return struct.pack('>i', len(data)) + data
+
+
+class _IteratorStream(io.RawIOBase):
+    """Read-only file object that pulls bytes from an iterator on demand."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._current = memoryview(b'')
+
+    def readable(self):
+        return True
 
-def load_to_database(df):
+    def readinto(self, buffer):
+        while not self._current:
+            try:
+                self._current = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._current))
+        buffer[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
+
+
+def _iter_binary_copy(frame, encoding, chunk_bytes=COPY_CHUNK_BYTES):
+    """
+    Yield a PGCOPY binary stream for the given rows in slices.
+
+    Args:
+        frame (pd.DataFrame): Output of _prepare_frame
+        encoding (str): Python codec matching the connection client encoding
+        chunk_bytes (int): Approximate size of each yielded slice
+
+    Yields:
+        bytes: Consecutive pieces of the COPY payload
+    """
+    # Vectorized conversions to the PostgreSQL wire representations
+    invoice_micros = (
+        frame['invoice_date'].to_numpy(dtype='datetime64[us]') - np.datetime64(PG_EPOCH, 'us')
+    ).astype(np.int64)
+    columns = zip(
+        frame['invoice_no'].tolist(),
+        frame['stock_code'].tolist(),
+        frame['description'].tolist(),
+        frame['quantity'].tolist(),
+        invoice_micros.tolist(),
+        _to_scaled_int(frame['unit_price']).tolist(),
+        _nullable_values(frame['customer_id']),
+        frame['country'].tolist(),
+        _to_scaled_int(frame['total_amount']).tolist()
+    )
+
+    yield PGCOPY_HEADER
+
+    buffer = bytearray()
+    for (invoice_no, stock_code, description, quantity, invoice_date,
+         unit_price, customer_id, country, total_amount) in columns:
+        buffer += _FIELD_COUNT
+        buffer += _encode_text(invoice_no, encoding)
+        buffer += _encode_text(stock_code, encoding)
+        buffer += _encode_text(description, encoding)
+        buffer += struct.pack('>ii', 4, quantity)
+        buffer += struct.pack('>iq', 8, invoice_date)
+        buffer += _encode_numeric(unit_price)
+        buffer += _NULL_FIELD if customer_id is None else struct.pack('>ii', 4, customer_id)
+        buffer += _encode_text(country, encoding)
+        buffer += _encode_numeric(total_amount)
+
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+    yield PGCOPY_TRAILER
+
+
+def _build_binary_copy_stream(frame, encoding='utf-8'):
+    """
+    Build a file-like PGCOPY binary stream for copy_expert.
+
+    The payload is produced lazily while the server reads it, so the full
+    serialized chunk never sits in memory next to the dataframe.
+
+    Args:
+        frame (pd.DataFrame): Output of _prepare_frame
+        encoding (str): Python codec matching the connection client encoding
+
+    Returns:
+        io.RawIOBase: Readable stream of the COPY payload
+    """
+    return _IteratorStream(_iter_binary_copy(frame, encoding))
+
+
+def _skip_commit_flush(cursor):
+    """
+    Let the current transaction commit without waiting for the WAL flush.
+
+    A crash can lose the last few commits but never corrupts data, which
+    is acceptable for a re-runnable bulk load.
+    """
+    cursor.execute("SET LOCAL synchronous_commit = OFF")
+
+
+def load_to_database(df, conn=None):
     """
     Load cleaned dataframe into PostgreSQL database.
 
+    Rows are streamed with a binary COPY. If the server rejects the COPY,
+    the load falls back to batched multi-row INSERTs via execute_values.
+
     Args:
         df (pd.DataFrame): Cleaned dataframe to load
+        conn (psycopg2.connection, optional): Open connection to reuse across
+            batches. The caller keeps ownership and it is not closed here.
+            If None, a connection is opened and closed for this call.
 
     Returns:
         int: Number of rows inserted
@@ -22,44 +258,301 @@ def load_to_database(df):
     Raises:
         Exception: If database insertion fails
     """
-    logger.info("Connecting to database...")
-    conn = get_connection()
+    owns_connection = conn is None
+    if owns_connection:
+        logger.info("Connecting to database...")
+        conn = get_connection()
     cursor = conn.cursor()
 
     logger.info(f"Inserting {len(df)} rows into {TABLE_SALES_TRANSACTIONS}...")
-    count = 0
+    frame = _prepare_frame(df)
+    columns = ', '.join(SALES_TRANSACTION_COLUMNS)
 
     try:
-        for _, row in df.iterrows():
-            cursor.execute(f"""
-                INSERT INTO {TABLE_SALES_TRANSACTIONS}
-                (invoice_no, stock_code, description, quantity, invoice_date,
-                 unit_price, customer_id, country, total_amount)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                row['InvoiceNo'],
-                row['StockCode'],
-                row['Description'] if pd.notna(row['Description']) else 'Unknown',
-                int(row['Quantity']),
-                row['InvoiceDate'],
-                float(row['UnitPrice']),
-                int(row['CustomerID']) if pd.notna(row['CustomerID']) else None,
-                row['Country'],
-                float(row['TotalAmount'])
-            ))
-            count += 1
-            if count % DB_BATCH_SIZE == 0:
-                logger.info(f"  Inserted {count} rows...")
+        if not frame.empty:
+            try:
+                _skip_commit_flush(cursor)
+                encoding = pg_encodings.get(conn.encoding, 'utf-8')
+                cursor.copy_expert(
+                    f"COPY {TABLE_SALES_TRANSACTIONS} ({columns}) FROM STDIN WITH (FORMAT BINARY)",
+                    _build_binary_copy_stream(frame, encoding)
+                )
+            except CONNECTION_ERRORS:
+                # Connection-level failure: the INSERT fallback would fail too
+                raise
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.warning(f"Binary COPY failed ({e}), falling back to batched INSERT")
+                _skip_commit_flush(cursor)
+                execute_values(
+                    cursor,
+                    f"INSERT INTO {TABLE_SALES_TRANSACTIONS} ({columns}) VALUES %s",
+                    _prepare_rows(frame),
+                    page_size=DB_BATCH_SIZE
+                )
 
         conn.commit()
-        logger.info(f"Successfully inserted {count} rows total")
+        logger.info(f"Successfully inserted {len(frame)} rows total")
 
     except Exception as e:
         conn.rollback()
         logger.error(f"Error during database insertion: {e}")
         raise
+    finally:
+        cursor.close()
+        if owns_connection:
+            conn.close()
+
+    return len(frame)
+
+
+def _load_shard_reconnecting(df, connections, index):
+    """
+    Load one shard on connections[index], reconnecting once if it drops.
+
+    A shard whose connection fails was not committed, so it is copied again
+    on a fresh connection. The new connection replaces the broken one in the
+    caller's list, so later chunks reuse it and the caller still closes it.
+
+    Args:
+        df (pd.DataFrame): Cleaned rows of this shard
+        connections (list): Caller-held connections, one per shard
+        index (int): Position of this shard's connection
+
+    Returns:
+        int: Number of rows inserted
+    """
+    try:
+        return load_to_database(df, conn=connections[index])
+    except CONNECTION_ERRORS as e:
+        logger.warning(f"Connection lost while loading {len(df)} rows ({e}), reconnecting and retrying")
+        connections[index].close()
+        connections[index] = get_connection()
+        return load_to_database(df, conn=connections[index])
+
+
+def load_to_database_parallel(df, workers=DB_COPY_WORKERS, connections=None):
+    """
+    Load cleaned dataframe using several COPY streams at once.
+
+    Rows are dealt round-robin into one shard per worker (df.iloc[i::n]) so
+    every writer covers the whole date range. Each shard is copied and
+    committed on its own connection, so a failure can leave other shards
+    committed. With caller-held connections, a shard whose connection drops
+    is retried once on a replacement connection.
+
+    Args:
+        df (pd.DataFrame): Cleaned dataframe to load
+        workers (int): Number of concurrent connections when none are given
+        connections (list, optional): Open connections to reuse, one per
+            worker. They are left open for the caller; dropped ones are
+            replaced in place.
+
+    Returns:
+        int: Number of rows inserted
+
+    Raises:
+        Exception: If any shard fails to load
+    """
+    shard_count = len(connections) if connections else workers
+    if shard_count <= 1 or len(df) < shard_count:
+        if connections:
+            return _load_shard_reconnecting(df, connections, 0)
+        return load_to_database(df)
+
+    shards = [df.iloc[i::shard_count] for i in range(shard_count)]
+
+    logger.info(f"Loading {len(df)} rows over {shard_count} parallel connections...")
+    with ThreadPoolExecutor(max_workers=shard_count) as executor:
+        if connections:
+            loads = executor.map(_load_shard_reconnecting, shards, [connections] * shard_count, range(shard_count))
+        else:
+            loads = executor.map(load_to_database, shards)
+        return sum(loads)
+
+
+def load_csv_server_side(file_path, encoding=CSV_ENCODING):
+    """
+    Load a raw CSV file and let PostgreSQL clean it.
+
+    The file is copied as-is into an UNLOGGED staging table. A single
+    INSERT ... SELECT then applies the same rules as clean_sales_data
+    (drop cancelled orders, invalid quantities and prices, compute totals),
+    so no pandas parsing happens on the client.
+
+    Args:
+        file_path (str): Path to CSV file
+        encoding (str): File encoding (default: from constants)
+
+    Returns:
+        int: Number of rows inserted
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV is missing required columns
+        Exception: If database insertion fails
+    """
+    with open(file_path, 'r', encoding=encoding, newline='') as csv_file:
+        header = next(csv.reader(csv_file), [])
+
+    missing_columns = set(REQUIRED_CSV_COLUMNS) - set(header)
+    if missing_columns:
+        raise ValueError(f"CSV missing required columns: {missing_columns}")
+
+    # Every CSV field lands in a TEXT column; unknown extras are kept but ignored
+    staging_columns = [
+        CSV_TO_DB_COLUMNS.get(name, f'extra_{position}')
+        for position, name in enumerate(header)
+    ]
+
+    logger.info("Connecting to database...")
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        staging = sql.Identifier(TABLE_STAGING_SALES)
+        cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+        cursor.execute(sql.SQL("CREATE UNLOGGED TABLE {} ({})").format(
+            staging,
+            sql.SQL(', ').join(
+                sql.SQL("{} TEXT").format(sql.Identifier(column)) for column in staging_columns
+            )
+        ))
+
+        logger.info(f"Copying raw CSV {file_path} into {TABLE_STAGING_SALES}...")
+        with open(file_path, 'rb') as csv_file:
+            cursor.copy_expert(
+                sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, HEADER true, ENCODING {})").format(
+                    staging,
+                    sql.SQL(', ').join(map(sql.Identifier, staging_columns)),
+                    sql.Literal(encoding)
+                ),
+                csv_file
+            )
+
+        cursor.execute("SET LOCAL DateStyle = 'ISO, MDY'")
+        _skip_commit_flush(cursor)
+        cursor.execute(
+            sql.SQL("""
+                INSERT INTO {target} ({columns})
+                SELECT invoice_no, stock_code, description, quantity, invoice_date,
+                       unit_price, customer_id, country, quantity * unit_price
+                FROM (
+                    SELECT
+                        invoice_no,
+                        stock_code,
+                        COALESCE(description, 'Unknown') AS description,
+                        quantity::numeric::integer AS quantity,
+                        invoice_date::timestamp AS invoice_date,
+                        unit_price::numeric AS unit_price,
+                        NULLIF(customer_id, '')::numeric::integer AS customer_id,
+                        country
+                    FROM {staging}
+                    WHERE invoice_no NOT LIKE %s
+                ) typed
+                WHERE quantity >= %s AND unit_price >= %s
+            """).format(
+                target=sql.Identifier(TABLE_SALES_TRANSACTIONS),
+                columns=sql.SQL(', ').join(map(sql.Identifier, SALES_TRANSACTION_COLUMNS)),
+                staging=staging
+            ),
+            (CANCELLED_ORDER_PREFIX + '%', MIN_QUANTITY, MIN_UNIT_PRICE)
+        )
+        count = cursor.rowcount
+
+        cursor.execute(sql.SQL("DROP TABLE {}").format(staging))
+        conn.commit()
+        logger.info(f"Successfully inserted {count} rows total")
+
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error during server-side load: {e}")
+        raise
     finally:
         cursor.close()
         conn.close()
 
     return count
+
+
+@contextmanager
+def deferred_sales_indexes():
+    """
+    Drop secondary indexes for an initial bulk load and rebuild them after.
+
+    Maintaining every B-tree row by row dominates server time during a large
+    load, while building each index once from the loaded heap is a single
+    sort. Indexes are only dropped when sales_transactions is empty, so
+    incremental loads into a populated table keep their indexes. For the
+    same initial loads the table is switched to UNLOGGED so the load writes
+    no WAL, and switched back to LOGGED before the indexes are rebuilt.
+    Indexes are rebuilt with CREATE INDEX CONCURRENTLY even if the load
+    fails, and the table is analyzed afterwards.
+
+    Yields:
+        bool: True if indexes were dropped for this load
+    """
+    conn = get_connection()
+    conn.autocommit = True
+    cursor = conn.cursor()
+    table = sql.Identifier(TABLE_SALES_TRANSACTIONS)
+
+    try:
+        cursor.execute(sql.SQL("SELECT EXISTS (SELECT 1 FROM {})").format(table))
+        initial_load = not cursor.fetchone()[0]
+
+        if initial_load:
+            logger.info("Empty table - dropping secondary indexes for bulk load")
+            cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(
+                sql.SQL(', ').join(map(sql.Identifier, SALES_TRANSACTION_INDEXES))
+            ))
+            cursor.execute(sql.SQL("ALTER TABLE {} SET UNLOGGED").format(table))
+
+        try:
+            yield initial_load
+        finally:
+            if initial_load:
+                # Rewrites the heap once with WAL; indexes are built after
+                cursor.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(table))
+                cursor.execute("SET maintenance_work_mem = %s", (DB_MAINTENANCE_WORK_MEM,))
+                for index_name, columns in SALES_TRANSACTION_INDEXES.items():
+                    logger.info(f"Rebuilding index {index_name}...")
+                    cursor.execute(
+                        sql.SQL("CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {} ({})").format(
+                            sql.Identifier(index_name),
+                            table,
+                            sql.SQL(', ').join(map(sql.Identifier, columns))
+                        )
+                    )
+                cursor.execute(sql.SQL("ANALYZE {}").format(table))
+                logger.info("Secondary indexes rebuilt and table analyzed")
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def refresh_materialized_views():
+    """
+    Refresh the analytics materialized views after a load.
+
+    Calls the refresh_materialized_views() function from sql/init.sql, which
+    refreshes each view concurrently so dashboards keep reading during it.
+
+    Raises:
+        Exception: If the refresh fails
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        logger.info("Refreshing materialized views...")
+        cursor.execute("SELECT refresh_materialized_views()")
+        conn.commit()
+        logger.info("Materialized views refreshed")
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error refreshing materialized views: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -1,13 +1,43 @@
 """
 Data transformation module for cleaning and preparing data.
 """
+import numpy as np
 import pandas as pd
-from src.config.constants import CANCELLED_ORDER_PREFIX, MIN_QUANTITY, MIN_UNIT_PRICE
+from src.config.constants import (
+    CANCELLED_ORDER_PREFIX,
+    MIN_QUANTITY,
+    MIN_UNIT_PRICE,
+    INVOICE_DATE_FORMATS
+)
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger(__name__)
 
 
+def parse_invoice_dates(series):
+    """
+    Parse invoice dates with a fixed format where possible.
+
+    Each known format is tried with the strict parser, which is far cheaper
+    than per-value inference. Repeated timestamps are converted once via
+    the parse cache. Unknown formats fall back to pandas inference.
+
+    Args:
+        series (pd.Series): Invoice date strings
+
+    Returns:
+        pd.Series: Parsed datetime64 values
+    """
+    for date_format in INVOICE_DATE_FORMATS:
+        try:
+            return pd.to_datetime(series, format=date_format, cache=True)
+        except (ValueError, TypeError):
+            continue
+
+    logger.debug("Invoice dates match no known format, inferring")
+    return pd.to_datetime(series, cache=True)
+
+
 def clean_sales_data(df):
     """
     Clean sales transaction data.
@@ -21,26 +51,37 @@ def clean_sales_data(df):
     logger.info(f"Cleaning data... Initial rows: {len(df)}")
     initial_rows = len(df)
 
+    invoice_no = df['InvoiceNo']
+    if not pd.api.types.is_string_dtype(invoice_no):
+        invoice_no = invoice_no.astype(str)
+
+    # Build every filter as a mask and index the frame once
+    not_cancelled = ~invoice_no.str.startswith(CANCELLED_ORDER_PREFIX, na=False).to_numpy(dtype=bool)
+    valid_quantity = df['Quantity'].to_numpy() >= MIN_QUANTITY
+    valid_price = df['UnitPrice'].to_numpy() >= MIN_UNIT_PRICE
+    keep = not_cancelled & valid_quantity & valid_price
+
     # Remove cancelled orders (starting with 'C')
-    df = df[~df['InvoiceNo'].astype(str).str.startswith(CANCELLED_ORDER_PREFIX)]
-    cancelled_removed = initial_rows - len(df)
+    cancelled_removed = initial_rows - int(not_cancelled.sum())
     logger.debug(f"Removed {cancelled_removed} cancelled orders")
 
     # Remove negative quantities
-    df = df[df['Quantity'] >= MIN_QUANTITY]
-    negative_removed = initial_rows - cancelled_removed - len(df)
+    negative_removed = int((not_cancelled & ~valid_quantity).sum())
     logger.debug(f"Removed {negative_removed} rows with invalid quantities")
 
     # Remove zero prices
-    df = df[df['UnitPrice'] >= MIN_UNIT_PRICE]
-    zero_price_removed = initial_rows - cancelled_removed - negative_removed - len(df)
+    zero_price_removed = int((not_cancelled & valid_quantity & ~valid_price).sum())
     logger.debug(f"Removed {zero_price_removed} rows with invalid prices")
 
+    # take() returns an independent frame, so the columns added below
+    # are not flagged as writes to a slice of the caller's dataframe
+    df = df.take(np.flatnonzero(keep))
+
     # Calculate total amount
     df['TotalAmount'] = df['Quantity'] * df['UnitPrice']
 
     # Convert date
-    df['InvoiceDate'] = pd.to_datetime(df['InvoiceDate'])
+    df['InvoiceDate'] = parse_invoice_dates(df['InvoiceDate'])
 
     logger.info(f"Clean data complete: {len(df)} rows (removed {initial_rows - len(df)} rows)")
     return df
@@ -0,0 +1,83 @@
+"""
+In-process result caching for analytics queries.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, List
+
+import pandas as pd
+from src.config.constants import CACHE_TTL_SHORT
+
+_cached_functions: List[Callable] = []
+
+
+def _detach(result: Any) -> Any:
+    """Return a copy of pandas results so callers cannot mutate the cached object."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    return result
+
+
+def ttl_cache(seconds: int = CACHE_TTL_SHORT, copy: bool = True) -> Callable:
+    """
+    Cache a function's results in memory for a fixed time.
+
+    Results are keyed by the call arguments. Each wrapped function gains
+    cache_clear() and cache_invalidate(*args, **kwargs) methods, and is
+    registered for clear_all_caches(). cache_invalidate drops the result of
+    one call and must be given the arguments exactly as that call passed them.
+
+    Args:
+        seconds (int): How long a cached result stays valid
+        copy (bool): Return copies of cached DataFrames/Series. Disable only for
+            large frames whose callers never modify them in place
+
+    Returns:
+        Callable: Decorator applying the cache
+    """
+    def decorator(func: Callable) -> Callable:
+        entries = {}
+        lock = threading.Lock()
+
+        detach = _detach if copy else (lambda result: result)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+
+            with lock:
+                entry = entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < seconds:
+                return detach(entry[1])
+
+            result = func(*args, **kwargs)
+
+            now = time.monotonic()
+            with lock:
+                # Drop expired entries so rarely used keys do not accumulate
+                for stale_key in [k for k, (stored, _) in entries.items() if now - stored >= seconds]:
+                    del entries[stale_key]
+                entries[key] = (now, result)
+            return detach(result)
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        def cache_invalidate(*args, **kwargs) -> None:
+            with lock:
+                entries.pop((args, tuple(sorted(kwargs.items()))), None)
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_invalidate = cache_invalidate
+        _cached_functions.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_all_caches() -> None:
+    """Clear every cache created with ttl_cache in this process."""
+    for func in _cached_functions:
+        func.cache_clear()
@@ -27,9 +27,10 @@ def export_to_csv(df: pd.DataFrame, filename: str = None) -> bytes:
             timestamp = datetime.now().strftime(EXPORT_TIMESTAMP_FORMAT)
             filename = f"sales_data_{timestamp}.csv"
 
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue().encode('utf-8')
+        # Encode while writing instead of building a str and re-encoding it
+        csv_buffer = io.BytesIO()
+        df.to_csv(csv_buffer, index=False, encoding='utf-8')
+        csv_data = csv_buffer.getvalue()
 
         logger.info(f"Exported {len(df)} rows to CSV: {filename}")
         return csv_data
@@ -1,10 +1,11 @@
 """
 Data filtering utilities for dashboard interactivity.
 """
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-from src.database.connection import get_connection
+from src.database.connection import pooled_connection
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger(__name__)
@@ -18,19 +19,15 @@ def get_date_range() -> Tuple[datetime, datetime]:
         Tuple[datetime, datetime]: (min_date, max_date)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    MIN(invoice_date) as min_date,
+                    MAX(invoice_date) as max_date
+                FROM sales_transactions
+            """)
 
-        cursor.execute("""
-            SELECT
-                MIN(invoice_date) as min_date,
-                MAX(invoice_date) as max_date
-            FROM sales_transactions
-        """)
-
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+            result = cursor.fetchone()
 
         return result[0], result[1]
 
@@ -50,18 +47,14 @@ def get_available_countries() -> List[str]:
         List[str]: List of country names sorted alphabetically
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT DISTINCT country
-            FROM sales_transactions
-            ORDER BY country
-        """)
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT DISTINCT country
+                FROM sales_transactions
+                ORDER BY country
+            """)
 
-        countries = [row[0] for row in cursor.fetchall()]
-        cursor.close()
-        conn.close()
+            countries = [row[0] for row in cursor.fetchall()]
 
         return countries
 
@@ -81,21 +74,17 @@ def get_available_products(limit: int = 100) -> List[str]:
         List[str]: List of product descriptions sorted by revenue
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(f"""
-            SELECT description
-            FROM sales_transactions
-            WHERE description IS NOT NULL
-            GROUP BY description
-            ORDER BY SUM(total_amount) DESC
-            LIMIT {limit}
-        """)
-
-        products = [row[0] for row in cursor.fetchall()]
-        cursor.close()
-        conn.close()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT description
+                FROM sales_transactions
+                WHERE description IS NOT NULL
+                GROUP BY description
+                ORDER BY SUM(total_amount) DESC
+                LIMIT %s
+            """, (limit,))
+
+            products = [row[0] for row in cursor.fetchall()]
 
         return products
 
@@ -150,6 +139,45 @@ def apply_filters(
     return query
 
 
+def _filter_date_range(
+    df: pd.DataFrame,
+    column: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> pd.DataFrame:
+    """
+    Keep rows whose date falls within an inclusive range.
+
+    Query results usually arrive ordered by date. A sorted datetime column
+    is cut with two binary searches and a positional slice, which avoids
+    building a full boolean mask for each bound.
+
+    Args:
+        df (pd.DataFrame): Input dataframe
+        column (str): Name of the date column
+        start_date (datetime, optional): Start date filter
+        end_date (datetime, optional): End date filter
+
+    Returns:
+        pd.DataFrame: Rows within the date range
+    """
+    dates = df[column]
+
+    if pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing:
+        values = dates.to_numpy()
+        start = values.searchsorted(np.datetime64(pd.to_datetime(start_date)), side='left') if start_date else 0
+        end = values.searchsorted(np.datetime64(pd.to_datetime(end_date)), side='right') if end_date else len(values)
+        return df.iloc[start:end]
+
+    if start_date:
+        df = df[df[column] >= pd.to_datetime(start_date)]
+
+    if end_date:
+        df = df[df[column] <= pd.to_datetime(end_date)]
+
+    return df
+
+
 def filter_dataframe(
     df: pd.DataFrame,
     start_date: Optional[datetime] = None,
@@ -168,15 +196,13 @@ def filter_dataframe(
         products (List[str], optional): List of products to filter
 
     Returns:
-        pd.DataFrame: Filtered dataframe
+        pd.DataFrame: Filtered dataframe. The input is not copied up front,
+            so the result may share data with it; copy before mutating.
     """
-    filtered_df = df.copy()
-
-    if start_date and 'date' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['date'] >= pd.to_datetime(start_date)]
+    filtered_df = df
 
-    if end_date and 'date' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['date'] <= pd.to_datetime(end_date)]
+    if (start_date or end_date) and 'date' in filtered_df.columns:
+        filtered_df = _filter_date_range(filtered_df, 'date', start_date, end_date)
 
     if countries and len(countries) > 0 and 'country' in filtered_df.columns:
         filtered_df = filtered_df[filtered_df['country'].isin(countries)]
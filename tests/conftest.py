@@ -11,6 +11,9 @@ from unittest.mock import Mock, MagicMock
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Importing src.analytics would otherwise fit a Prophet model, which needs cmdstan
+os.environ['WARMUP_PROPHET'] = 'false'
+
 
 @pytest.fixture
 def sample_raw_data():
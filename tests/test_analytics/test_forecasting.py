@@ -0,0 +1,96 @@
+"""
+Unit tests for the multi-product forecast.
+"""
+import pandas as pd
+import pyarrow as pa
+import pytest
+from unittest.mock import MagicMock, patch
+
+# src.analytics imports the Prophet forecaster on package import
+pytest.importorskip('prophet')
+
+from src.analytics import forecasting
+from src.config.constants import MIN_FORECAST_HISTORY_DAYS
+
+
+def history_table(days_by_code):
+    """Build the daily history COPY result for the given products."""
+    codes, dates, quantities = [], [], []
+    for code, days in days_by_code.items():
+        codes += [code] * days
+        dates += list(pd.date_range('2011-01-01', periods=days))
+        quantities += [float(day) for day in range(days)]
+    return pa.table({
+        'stock_code': pa.array(codes, type=pa.string()),
+        'date': pa.array(dates, type=pa.timestamp('ns')),
+        'quantity': pa.array(quantities, type=pa.float64())
+    })
+
+
+@pytest.fixture
+def executor():
+    """Replace the process pool with one that maps in this process."""
+    pool = MagicMock()
+    pool.map.side_effect = lambda fn, histories, *args: [
+        (history, {'days': len(history)}) for history in histories
+    ]
+    with patch('src.analytics.forecasting.ProcessPoolExecutor') as pool_class:
+        pool_class.return_value.__enter__.return_value = pool
+        yield pool_class, pool
+
+
+@pytest.mark.unit
+class TestGetMultiProductForecast:
+    """Test cases for get_multi_product_forecast."""
+
+    def test_one_query_for_all_products(self, executor):
+        """Test every product's history comes from a single batched query."""
+        table = history_table({'85123A': 40, '71053': 35})
+        with patch('src.analytics.forecasting.fetch_arrow', return_value=table) as fetch:
+            forecasting.get_multi_product_forecast(['85123A', '71053'], periods=7)
+
+        fetch.assert_called_once()
+        query, params, _ = fetch.call_args.args
+        assert 'stock_code = ANY(%s)' in query
+        assert params == (['85123A', '71053'], MIN_FORECAST_HISTORY_DAYS)
+
+    def test_histories_split_per_product(self, executor):
+        """Test each product is fitted on its own history in the pool."""
+        pool_class, pool = executor
+        table = history_table({'85123A': 40, '71053': 35})
+        with patch('src.analytics.forecasting.fetch_arrow', return_value=table):
+            results = forecasting.get_multi_product_forecast(['85123A', '71053'], periods=7)
+
+        assert pool_class.call_args.kwargs['max_workers'] <= 2
+        fn, histories, value_cols, periods, freqs = pool.map.call_args.args
+        assert fn is forecasting._fit_and_predict
+        assert [len(history) for history in histories] == [40, 35]
+        assert list(histories[0].columns) == ['date', 'quantity']
+        assert value_cols == ['quantity', 'quantity']
+        assert periods == [7, 7]
+        assert freqs == ['D', 'D']
+        assert list(results) == ['85123A', '71053']
+        assert results['85123A'][1] == {'days': 40}
+        assert results['71053'][1] == {'days': 35}
+
+    def test_short_histories_not_fitted(self, executor):
+        """Test products the query left out get an error summary in input order."""
+        pool_class, pool = executor
+        table = history_table({'71053': 35})
+        with patch('src.analytics.forecasting.fetch_arrow', return_value=table):
+            results = forecasting.get_multi_product_forecast(['85123A', '71053'])
+
+        assert list(results) == ['85123A', '71053']
+        forecast_df, summary = results['85123A']
+        assert forecast_df.empty
+        assert summary == {'error': 'Insufficient historical data'}
+        assert [len(history) for history in pool.map.call_args.args[1]] == [35]
+
+    def test_no_pool_without_trainable_products(self, executor):
+        """Test no worker processes are started when nothing can be fitted."""
+        pool_class, _ = executor
+        with patch('src.analytics.forecasting.fetch_arrow', return_value=history_table({})):
+            results = forecasting.get_multi_product_forecast(['85123A'])
+
+        pool_class.assert_not_called()
+        assert results['85123A'][1] == {'error': 'Insufficient historical data'}
@@ -0,0 +1,268 @@
+"""
+Unit tests for the dashboard views computed from the cached fact table.
+
+Expected values follow the SQL the views replaced: COUNT(DISTINCT ...) skips
+NULLs, GROUP BY keeps a NULL description group, EXTRACT(DOW) counts from
+Sunday, TO_CHAR(..., 'Day') pads names to nine characters and
+ROUND(x::numeric, 2) rounds halves away from zero.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from datetime import date, datetime
+from unittest.mock import patch
+
+# src.analytics imports the Prophet forecaster on package import
+pytest.importorskip('prophet')
+
+from src.analytics import geographic, kpis, product, revenue
+from src.analytics._warm import FACT_COLUMN_TYPES, load_fact, round_like_numeric
+from src.utils.cache import clear_all_caches
+
+# Deliberately not in invoice_date order. Jan and Feb totals (200.00, 200.25)
+# give a 0.125% growth rate and France averages 37.625: both sit on a half.
+FACT_ROWS = {
+    'invoice_date': [
+        datetime(2011, 2, 12, 9, 15),   # Saturday
+        datetime(2011, 1, 2, 10, 0),    # Sunday
+        datetime(2011, 1, 3, 14, 0),    # Monday
+        datetime(2011, 1, 2, 10, 30),   # Sunday
+        datetime(2011, 2, 7, 9, 0),     # Monday
+    ],
+    'invoice_no': ['A4', 'A1', 'A2', 'A1', 'A3'],
+    'customer_id': [2, 1, None, 1, 2],
+    'description': ['MUG', 'MUG', None, 'PEN', 'MUG'],
+    'country': ['United Kingdom', 'United Kingdom', 'France', 'United Kingdom', 'France'],
+    'stock_code': ['S1', 'S1', 'S3', 'S2', 'S1'],
+    'quantity': [1, 2, 3, 1, 4],
+    'total_amount': [175.0, 90.0, 50.0, 60.0, 25.25]
+}
+
+
+@pytest.fixture
+def fact():
+    """Build the fact frame from FACT_ROWS and serve it to every view."""
+    clear_all_caches()
+    table = pa.table({
+        name: pa.array(values, type=FACT_COLUMN_TYPES[name])
+        for name, values in FACT_ROWS.items()
+    })
+    with patch('src.analytics._warm.fetch_arrow', return_value=table):
+        df = load_fact()
+
+    with patch('src.analytics.kpis.load_fact', return_value=df), \
+            patch('src.analytics.revenue.load_fact', return_value=df), \
+            patch('src.analytics.product.load_fact', return_value=df), \
+            patch('src.analytics.geographic.load_fact', return_value=df):
+        yield df
+    clear_all_caches()
+
+
+@pytest.mark.unit
+class TestLoadFact:
+    """Test cases for load_fact."""
+
+    def test_columns_and_dtypes(self, fact):
+        """Test the fact frame carries the derived calendar columns."""
+        assert fact.dtypes.astype(str).to_dict() == {
+            'invoice_date': 'datetime64[ns]',
+            'invoice_no': 'category',
+            'customer_id': 'Int32',
+            'description': 'category',
+            'country': 'category',
+            'stock_code': 'category',
+            'quantity': 'int64',
+            'total_amount': 'float64',
+            'date': 'datetime64[ns]',
+            'month': 'period[M]',
+            'hour': 'int32',
+            'dow': 'int32'
+        }
+
+    def test_sorted_with_sunday_first_dow(self, fact):
+        """Test rows are sorted by invoice_date and dow counts from Sunday."""
+        assert fact['invoice_date'].is_monotonic_increasing
+        assert fact['dow'].tolist() == [0, 0, 1, 1, 6]
+        assert fact['customer_id'].isna().sum() == 1
+
+
+@pytest.mark.unit
+class TestKpis:
+    """Test cases for the KPI views."""
+
+    def test_get_kpis(self, fact):
+        """Test KPIs skip the NULL customer."""
+        assert kpis.get_kpis() == {
+            'revenue': 400.25,
+            'orders': 4,
+            'customers': 2,
+            'avg_order': 100.0625
+        }
+
+    def test_get_sales_summary(self, fact):
+        """Test the summary skips NULL customers and descriptions."""
+        summary = kpis.get_sales_summary()
+
+        assert summary == {
+            'total_transactions': 5,
+            'total_orders': 4,
+            'total_customers': 2,
+            'total_products': 2,
+            'total_countries': 2,
+            'total_revenue': 400.25,
+            'avg_transaction': 80.05,
+            'max_transaction': 175.0,
+            'first_sale': datetime(2011, 1, 2, 10, 0),
+            'last_sale': datetime(2011, 2, 12, 9, 15)
+        }
+        assert type(summary['first_sale']) is datetime
+
+    def test_get_sales_summary_empty(self, fact):
+        """Test an empty fact table gives zero counts and no sale dates."""
+        with patch('src.analytics.kpis.load_fact', return_value=fact.iloc[:0]):
+            summary = kpis.get_sales_summary()
+
+        assert summary == {
+            'total_transactions': 0,
+            'total_orders': 0,
+            'total_customers': 0,
+            'total_products': 0,
+            'total_countries': 0,
+            'total_revenue': None,
+            'avg_transaction': None,
+            'max_transaction': None,
+            'first_sale': None,
+            'last_sale': None
+        }
+
+
+@pytest.mark.unit
+class TestRevenueViews:
+    """Test cases for the revenue views."""
+
+    def test_get_revenue_trend(self, fact):
+        """Test daily revenue is keyed by date objects in order."""
+        df = revenue.get_revenue_trend()
+
+        assert list(df.columns) == ['date', 'revenue']
+        assert df['date'].tolist() == [
+            date(2011, 1, 2), date(2011, 1, 3), date(2011, 2, 7), date(2011, 2, 12)
+        ]
+        assert df['revenue'].tolist() == [150.0, 50.0, 25.25, 175.0]
+
+    def test_get_monthly_revenue(self, fact):
+        """Test monthly revenue and distinct order counts."""
+        df = revenue.get_monthly_revenue()
+
+        assert list(df.columns) == ['month', 'revenue', 'orders']
+        assert df['month'].tolist() == ['2011-01', '2011-02']
+        assert df['revenue'].tolist() == [200.0, 200.25]
+        assert df['orders'].tolist() == [2, 2]
+        assert df['orders'].dtype == np.int64
+
+    def test_get_monthly_growth(self, fact):
+        """Test growth is NaN for the first month and rounds halves up."""
+        df = revenue.get_monthly_growth()
+
+        assert list(df.columns) == ['month', 'revenue', 'prev_month_revenue', 'growth_rate']
+        assert df['month'].tolist() == ['2011-01', '2011-02']
+        assert np.isnan(df['prev_month_revenue'].iloc[0])
+        assert df['prev_month_revenue'].iloc[1] == 200.0
+        assert np.isnan(df['growth_rate'].iloc[0])
+        # 0.125% exactly; np.round would give 0.12
+        assert df['growth_rate'].iloc[1] == 0.13
+        assert df['growth_rate'].dtype == np.float64
+
+    def test_get_sales_by_hour(self, fact):
+        """Test hourly revenue and row counts for hours with sales."""
+        df = revenue.get_sales_by_hour()
+
+        assert list(df.columns) == ['hour', 'revenue', 'transactions']
+        assert df['hour'].tolist() == [9, 10, 14]
+        assert df['revenue'].tolist() == [200.25, 150.0, 50.0]
+        assert df['transactions'].tolist() == [2, 2, 1]
+
+    def test_get_sales_by_day_of_week(self, fact):
+        """Test days are numbered from Sunday with padded names."""
+        df = revenue.get_sales_by_day_of_week()
+
+        assert list(df.columns) == ['day_name', 'day_num', 'revenue', 'orders']
+        assert df['day_num'].tolist() == [0, 1, 6]
+        assert df['day_name'].tolist() == ['Sunday   ', 'Monday   ', 'Saturday ']
+        assert df['revenue'].tolist() == [150.0, 75.25, 175.0]
+        assert df['orders'].tolist() == [1, 2, 1]
+
+
+@pytest.mark.unit
+class TestProductViews:
+    """Test cases for the product views."""
+
+    def test_get_top_products(self, fact):
+        """Test products are ranked by revenue with a NULL description group."""
+        df = product.get_top_products(limit=10)
+
+        assert list(df.columns) == ['product', 'revenue', 'units_sold', 'orders']
+        assert df['product'].iloc[:2].tolist() == ['MUG', 'PEN']
+        assert pd.isna(df['product'].iloc[2])
+        assert df['product'].dtype == object
+        assert df['revenue'].tolist() == [290.25, 60.0, 50.0]
+        assert df['units_sold'].tolist() == [7, 1, 3]
+        assert df['orders'].tolist() == [3, 1, 1]
+
+    def test_get_top_products_limit(self, fact):
+        """Test the limit keeps only the highest earning products."""
+        df = product.get_top_products(limit=1)
+
+        assert df['product'].tolist() == ['MUG']
+        assert df['orders'].tolist() == [3]
+
+
+@pytest.mark.unit
+class TestGeographicViews:
+    """Test cases for the geographic views."""
+
+    def test_get_revenue_by_country(self, fact):
+        """Test countries are ranked by revenue."""
+        df = geographic.get_revenue_by_country()
+
+        assert list(df.columns) == ['country', 'revenue']
+        assert df['country'].tolist() == ['United Kingdom', 'France']
+        assert df['country'].dtype == object
+        assert df['revenue'].tolist() == [325.0, 75.25]
+
+    def test_get_country_performance_detailed(self, fact):
+        """Test country metrics skip NULL customers and round halves up."""
+        df = geographic.get_country_performance_detailed()
+
+        assert list(df.columns) == [
+            'country', 'orders', 'customers', 'revenue', 'avg_transaction', 'units_sold'
+        ]
+        assert df['country'].tolist() == ['United Kingdom', 'France']
+        assert df['orders'].tolist() == [2, 2]
+        assert df['customers'].tolist() == [2, 1]
+        assert df['revenue'].tolist() == [325.0, 75.25]
+        # France averages 37.625; np.round would give 37.62
+        assert df['avg_transaction'].tolist() == [108.33, 37.63]
+        assert df['units_sold'].tolist() == [4, 7]
+
+
+@pytest.mark.unit
+class TestRoundLikeNumeric:
+    """Test cases for round_like_numeric."""
+
+    def test_halves_round_away_from_zero(self):
+        """Test halves round away from zero for both signs."""
+        result = round_like_numeric(np.array([12.625, -12.625, 0.125, -0.005, 1.004]))
+        assert result.tolist() == [12.63, -12.63, 0.13, -0.01, 1.0]
+
+    def test_float_noise_ignored(self):
+        """Test values a float ulp below a half still round up."""
+        # 1.005 is stored as 1.00499999999999989...
+        assert round_like_numeric(np.array([1.005])).tolist() == [1.01]
+
+    def test_non_finite_pass_through(self):
+        """Test NaN and infinities are left as they are."""
+        result = round_like_numeric(np.array([np.nan, np.inf, -np.inf]))
+        assert np.isnan(result[0])
+        assert result[1:].tolist() == [np.inf, -np.inf]
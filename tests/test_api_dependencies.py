@@ -0,0 +1,103 @@
+"""
+Unit tests for the API rate limiting dependency.
+"""
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip('fastapi')
+
+from fastapi import HTTPException, Request
+from src.api.dependencies import client_address, rate_limit
+
+
+def make_request(peer='10.0.0.1', forwarded=None):
+    """Build a bare request from the given peer with an optional X-Forwarded-For."""
+    headers = []
+    if forwarded is not None:
+        headers.append((b'x-forwarded-for', forwarded.encode()))
+    return Request({'type': 'http', 'headers': headers, 'client': (peer, 12345)})
+
+
+@pytest.mark.unit
+class TestRateLimit:
+    """Test cases for rate_limit dependency."""
+
+    def test_requests_over_limit_rejected(self):
+        """Test the request after max_requests gets 429 with Retry-After."""
+        limiter = rate_limit(max_requests=2, window_seconds=60)
+
+        with patch('src.api.dependencies.time.monotonic', side_effect=[100.0, 110.0, 130.0]):
+            limiter(make_request())
+            limiter(make_request())
+            with pytest.raises(HTTPException) as exc_info:
+                limiter(make_request())
+
+        assert exc_info.value.status_code == 429
+        # Oldest request at 100s leaves the window at 160s: 30s away, rounded up
+        assert exc_info.value.headers['Retry-After'] == '31'
+
+    def test_window_slides(self):
+        """Test requests are allowed again once old ones leave the window."""
+        limiter = rate_limit(max_requests=1, window_seconds=60)
+
+        with patch('src.api.dependencies.time.monotonic', side_effect=[0.0, 60.0]):
+            limiter(make_request())
+            limiter(make_request())
+
+    def test_clients_counted_separately(self):
+        """Test one client reaching the limit does not block another."""
+        limiter = rate_limit(max_requests=1, window_seconds=60)
+
+        with patch('src.api.dependencies.time.monotonic', return_value=0.0):
+            limiter(make_request(peer='10.0.0.1'))
+            limiter(make_request(peer='10.0.0.2'))
+            with pytest.raises(HTTPException):
+                limiter(make_request(peer='10.0.0.1'))
+
+    def test_idle_clients_pruned(self):
+        """Test pruning at the client cap readmits idle clients and keeps active ones limited."""
+        limiter = rate_limit(max_requests=1, window_seconds=60)
+
+        with patch('src.api.dependencies.RATE_LIMIT_MAX_CLIENTS', 2), \
+                patch('src.api.dependencies.time.monotonic', side_effect=[0.0, 50.0, 70.0, 70.0, 70.0]):
+            limiter(make_request(peer='10.0.0.1'))
+            limiter(make_request(peer='10.0.0.2'))
+            # Cap reached: 10.0.0.1 has been idle for a full window
+            limiter(make_request(peer='10.0.0.3'))
+            limiter(make_request(peer='10.0.0.1'))
+            with pytest.raises(HTTPException) as exc_info:
+                limiter(make_request(peer='10.0.0.2'))
+
+        assert exc_info.value.status_code == 429
+
+    def test_forwarded_client_limited_behind_proxy(self):
+        """Test callers behind a trusted proxy are limited by forwarded address."""
+        limiter = rate_limit(max_requests=1, window_seconds=60)
+
+        with patch('src.api.dependencies.APIConfig.TRUSTED_PROXY_HOPS', 1), \
+                patch('src.api.dependencies.time.monotonic', return_value=0.0):
+            limiter(make_request(peer='10.0.0.9', forwarded='203.0.113.1'))
+            limiter(make_request(peer='10.0.0.9', forwarded='203.0.113.2'))
+            with pytest.raises(HTTPException):
+                limiter(make_request(peer='10.0.0.9', forwarded='203.0.113.1'))
+
+
+@pytest.mark.unit
+class TestClientAddress:
+    """Test cases for client_address."""
+
+    def test_peer_used_without_trusted_proxy(self):
+        """Test X-Forwarded-For is ignored when no proxy is trusted."""
+        with patch('src.api.dependencies.APIConfig.TRUSTED_PROXY_HOPS', 0):
+            assert client_address(make_request(forwarded='203.0.113.1')) == '10.0.0.1'
+
+    def test_spoofed_entries_ignored(self):
+        """Test only the entry appended by the trusted proxy is used."""
+        with patch('src.api.dependencies.APIConfig.TRUSTED_PROXY_HOPS', 1):
+            request = make_request(forwarded='198.51.100.7, 203.0.113.1')
+            assert client_address(request) == '203.0.113.1'
+
+    def test_peer_used_when_header_missing(self):
+        """Test requests that did not pass the proxy fall back to the peer."""
+        with patch('src.api.dependencies.APIConfig.TRUSTED_PROXY_HOPS', 1):
+            assert client_address(make_request()) == '10.0.0.1'
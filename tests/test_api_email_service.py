@@ -0,0 +1,109 @@
+"""
+Unit tests for the SendGrid verification email service.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+pytest.importorskip('sendgrid')
+
+from src.api.email_service import send_verification_emails_bulk
+
+VERIFY_URL = 'https://example.com/verify'
+
+
+@pytest.fixture
+def sendgrid_client():
+    """Enable email and replace the shared SendGrid client with a mock."""
+    client = MagicMock()
+    client.send.return_value = MagicMock(status_code=202)
+    with patch('src.api.email_service.EmailConfig.EMAIL_ENABLED', True), \
+            patch('src.api.email_service.EmailConfig.EMAIL_VERIFICATION_URL', VERIFY_URL), \
+            patch('src.api.email_service._get_sendgrid_client', return_value=client):
+        yield client
+
+
+def sent_messages(client):
+    """Return the request bodies of every message passed to client.send."""
+    return [call.args[0].get() for call in client.send.call_args_list]
+
+
+@pytest.mark.unit
+class TestSendVerificationEmailsBulk:
+    """Test cases for send_verification_emails_bulk."""
+
+    def test_one_personalization_per_recipient(self, sendgrid_client):
+        """Test each recipient gets their own username and verification link."""
+        sent = send_verification_emails_bulk([
+            ('alice@example.com', 'token-a', 'alice'),
+            ('bob@example.com', 'token-b', 'bob')
+        ])
+
+        assert sent == 2
+        [message] = sent_messages(sendgrid_client)
+        # SendGrid prepends each personalization, so compare in email order
+        personalizations = sorted(message['personalizations'], key=lambda p: p['to'][0]['email'])
+        assert personalizations == [
+            {
+                'to': [{'email': 'alice@example.com'}],
+                'substitutions': {
+                    '-username-': 'alice',
+                    '-verification_url-': f'{VERIFY_URL}?verification_token=token-a'
+                }
+            },
+            {
+                'to': [{'email': 'bob@example.com'}],
+                'substitutions': {
+                    '-username-': 'bob',
+                    '-verification_url-': f'{VERIFY_URL}?verification_token=token-b'
+                }
+            }
+        ]
+
+    def test_body_uses_substitution_tags(self, sendgrid_client):
+        """Test the shared body carries tags rather than a recipient's details."""
+        send_verification_emails_bulk([('alice@example.com', 'token-a', 'alice')])
+
+        [message] = sent_messages(sendgrid_client)
+        assert message['subject'] == 'Verify Your Email - Sales Analytics'
+        for content in message['content']:
+            assert 'Welcome' in content['value']
+            assert '-username-' in content['value']
+            assert '-verification_url-' in content['value']
+            assert 'token-a' not in content['value']
+
+    def test_batches_split_at_personalization_limit(self, sendgrid_client):
+        """Test recipients are split into one request per batch."""
+        recipients = [(f'user{i}@example.com', f'token-{i}', f'user{i}') for i in range(5)]
+
+        with patch('src.api.email_service.SENDGRID_MAX_PERSONALIZATIONS', 2):
+            sent = send_verification_emails_bulk(recipients)
+
+        assert sent == 5
+        batches = [
+            sorted(p['to'][0]['email'] for p in message['personalizations'])
+            for message in sent_messages(sendgrid_client)
+        ]
+        assert batches == [
+            ['user0@example.com', 'user1@example.com'],
+            ['user2@example.com', 'user3@example.com'],
+            ['user4@example.com']
+        ]
+
+    def test_rejected_batch_not_counted(self, sendgrid_client):
+        """Test only batches SendGrid accepted count as sent."""
+        sendgrid_client.send.side_effect = [
+            MagicMock(status_code=202),
+            MagicMock(status_code=400),
+            Exception('connection reset')
+        ]
+        recipients = [(f'user{i}@example.com', f'token-{i}', f'user{i}') for i in range(5)]
+
+        with patch('src.api.email_service.SENDGRID_MAX_PERSONALIZATIONS', 2):
+            assert send_verification_emails_bulk(recipients) == 2
+
+    def test_disabled_sends_nothing(self, sendgrid_client):
+        """Test nothing is sent while email is disabled."""
+        with patch('src.api.email_service.EmailConfig.EMAIL_ENABLED', False):
+            assert send_verification_emails_bulk([('alice@example.com', 'token-a', 'alice')]) == 0
+
+        sendgrid_client.send.assert_not_called()
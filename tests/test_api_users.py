@@ -0,0 +1,75 @@
+"""
+Unit tests for buffered last-login writes.
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+pytest.importorskip('fastapi')
+
+from psycopg2 import InterfaceError, OperationalError
+from psycopg2.pool import PoolError
+from src.api import users
+
+LOGIN_AT = datetime(2026, 1, 5, 12, 0)
+
+
+@pytest.fixture
+def pending():
+    """Buffer one login and clear the buffer afterwards."""
+    users._pending_logins.clear()
+    users._pending_logins['alice@example.com'] = LOGIN_AT
+    yield users._pending_logins
+    users._pending_logins.clear()
+
+
+@pytest.mark.unit
+class TestFlushLastLogins:
+    """Test cases for flush_last_logins."""
+
+    def test_written_logins_cleared(self, pending):
+        """Test a successful flush writes and clears the buffer."""
+        conn = MagicMock()
+        with patch('src.api.users.pooled_connection') as pooled, \
+                patch('src.api.users.execute_values') as execute_values:
+            pooled.return_value.__enter__.return_value = conn
+            assert users.flush_last_logins() == 1
+
+        assert execute_values.call_args.args[2] == [('alice@example.com', LOGIN_AT)]
+        conn.commit.assert_called_once()
+        assert pending == {}
+
+    def test_kept_when_no_connection(self, pending):
+        """Test timestamps are kept when no connection can be borrowed."""
+        with patch('src.api.users.pooled_connection',
+                   side_effect=PoolError('connection pool exhausted')):
+            assert users.flush_last_logins() == 0
+
+        assert pending == {'alice@example.com': LOGIN_AT}
+
+    def test_kept_when_rollback_fails(self, pending):
+        """Test timestamps are kept when the connection dies mid-write."""
+        conn = MagicMock()
+        conn.commit.side_effect = OperationalError('server closed the connection')
+        conn.rollback.side_effect = InterfaceError('connection already closed')
+        with patch('src.api.users.pooled_connection') as pooled, \
+                patch('src.api.users.execute_values'):
+            pooled.return_value.__enter__.return_value = conn
+            assert users.flush_last_logins() == 0
+
+        assert pending == {'alice@example.com': LOGIN_AT}
+
+    def test_newer_login_not_overwritten(self, pending):
+        """Test a login buffered during a failed flush wins over the old one."""
+        newer = datetime(2026, 1, 5, 12, 5)
+
+        def fail_after_login():
+            users.update_last_login('alice@example.com')
+            raise OperationalError('could not connect to server')
+
+        with patch('src.api.users.pooled_connection', side_effect=fail_after_login), \
+                patch('src.api.users.datetime') as clock:
+            clock.utcnow.return_value = newer
+            assert users.flush_last_logins() == 0
+
+        assert pending == {'alice@example.com': newer}
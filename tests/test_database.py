@@ -2,9 +2,13 @@
 Unit tests for database connection module.
 """
 import pytest
+import threading
+import time
 from unittest.mock import patch, MagicMock
 import psycopg2
-from src.database.connection import get_connection
+import pyarrow as pa
+from src.database import connection
+from src.database.connection import get_connection, pooled_connection, open_pool, close_pool, fetch_arrow, NUMERIC_AS_FLOAT, AnalyticsConnection
 
 
 @pytest.mark.unit
@@ -51,3 +55,249 @@ class TestDatabaseConnection:
         assert call_kwargs['user'] == 'test_user'
         assert call_kwargs['host'] == 'localhost'
         assert call_kwargs['port'] == 5432
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestPooledConnection:
+    """Test cases for the shared connection pool."""
+
+    @pytest.fixture(autouse=True)
+    def reset_pool(self):
+        """Start and finish every test without a pool."""
+        connection._pool = None
+        connection._returned_at.clear()
+        yield
+        connection._pool = None
+        connection._returned_at.clear()
+
+    @staticmethod
+    def _open_conn():
+        """Mock connection that psycopg2 would report as open."""
+        conn = MagicMock()
+        conn.closed = 0
+        return conn
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_pool_created_once_and_reused(self, mock_pool_cls):
+        """Test the pool is created lazily and shared across borrows."""
+        mock_pool = mock_pool_cls.return_value
+        mock_pool.getconn.return_value = self._open_conn()
+
+        with pooled_connection():
+            pass
+        with pooled_connection():
+            pass
+
+        mock_pool_cls.assert_called_once()
+        assert mock_pool.getconn.call_count == 2
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_connection_returned_to_pool(self, mock_pool_cls):
+        """Test the borrowed connection is handed back to the pool."""
+        mock_pool = mock_pool_cls.return_value
+        mock_conn = self._open_conn()
+        mock_pool.getconn.return_value = mock_conn
+
+        with pooled_connection() as conn:
+            assert conn is mock_conn
+
+        mock_pool.putconn.assert_called_once_with(mock_conn)
+        mock_conn.close.assert_not_called()
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_connection_returned_on_error(self, mock_pool_cls):
+        """Test the connection goes back to the pool when the caller raises."""
+        mock_pool = mock_pool_cls.return_value
+        mock_pool.getconn.return_value = self._open_conn()
+
+        with pytest.raises(RuntimeError):
+            with pooled_connection():
+                raise RuntimeError("query failed")
+
+        mock_pool.putconn.assert_called_once_with(mock_pool.getconn.return_value)
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_waits_for_free_connection(self, mock_pool_cls):
+        """Test a borrow beyond the pool size waits instead of failing."""
+        mock_pool_cls.return_value.getconn.side_effect = lambda: self._open_conn()
+        borrowed = threading.Event()
+
+        def borrow():
+            with pooled_connection():
+                borrowed.set()
+
+        with patch('src.database.connection._pool_slots', threading.BoundedSemaphore(1)):
+            with pooled_connection():
+                waiter = threading.Thread(target=borrow)
+                waiter.start()
+                assert not borrowed.wait(0.1)
+            waiter.join(1)
+
+        assert borrowed.is_set()
+        assert mock_pool_cls.return_value.getconn.call_count == 2
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_dropped_idle_connection_replaced(self, mock_pool_cls):
+        """Test an idle connection the server dropped is discarded before use."""
+        mock_pool = mock_pool_cls.return_value
+        stale, fresh = self._open_conn(), self._open_conn()
+        stale.cursor.return_value.__enter__.return_value.execute.side_effect = \
+            psycopg2.OperationalError("SSL connection has been closed unexpectedly")
+        mock_pool.getconn.side_effect = [stale, fresh]
+        connection._returned_at[id(stale)] = time.monotonic() - 3600
+
+        with pooled_connection() as conn:
+            assert conn is fresh
+
+        mock_pool.putconn.assert_any_call(stale, close=True)
+        mock_pool.putconn.assert_called_with(fresh)
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_recently_used_connection_not_checked(self, mock_pool_cls):
+        """Test a connection returned moments ago is reused without a round trip."""
+        mock_conn = self._open_conn()
+        mock_pool_cls.return_value.getconn.return_value = mock_conn
+
+        with pooled_connection():
+            pass
+        with pooled_connection():
+            pass
+
+        mock_conn.cursor.assert_not_called()
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_broken_connection_discarded(self, mock_pool_cls):
+        """Test a connection that fails mid-query is closed rather than reused."""
+        mock_pool = mock_pool_cls.return_value
+        mock_conn = self._open_conn()
+        mock_pool.getconn.return_value = mock_conn
+
+        with pytest.raises(psycopg2.OperationalError):
+            with pooled_connection():
+                raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+        mock_pool.putconn.assert_called_once_with(mock_conn, close=True)
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_pool_connections_return_floats(self, mock_pool_cls):
+        """Test pooled connections are created with the NUMERIC-as-float caster."""
+        with pooled_connection():
+            pass
+
+        _, kwargs = mock_pool_cls.call_args
+        assert kwargs['connection_factory'] is AnalyticsConnection
+
+    def test_numeric_cast_to_float(self):
+        """Test NUMERIC text is parsed to float and NULL stays None."""
+        assert NUMERIC_AS_FLOAT('12.50', None) == 12.5
+        assert isinstance(NUMERIC_AS_FLOAT('12.50', None), float)
+        assert NUMERIC_AS_FLOAT(None, None) is None
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_open_pool_reused_by_first_borrow(self, mock_pool_cls):
+        """Test open_pool creates the pool that later borrows share."""
+        open_pool()
+        mock_pool_cls.assert_called_once()
+        mock_pool_cls.return_value.getconn.return_value = self._open_conn()
+
+        with pooled_connection():
+            pass
+
+        mock_pool_cls.assert_called_once()
+        mock_pool_cls.return_value.getconn.assert_called_once()
+
+    @patch('src.database.connection.ThreadedConnectionPool')
+    def test_close_pool(self, mock_pool_cls):
+        """Test close_pool closes every connection and forgets the pool."""
+        mock_pool = mock_pool_cls.return_value
+
+        with pooled_connection():
+            pass
+        close_pool()
+
+        mock_pool.closeall.assert_called_once()
+        assert connection._pool is None
+
+    def test_pool_forgotten_after_fork(self):
+        """Test a forked child does not reuse the parent's pool."""
+        parent_pool = MagicMock()
+        connection._pool = parent_pool
+
+        connection._reset_pool_after_fork()
+
+        assert connection._pool is None
+        parent_pool.closeall.assert_not_called()
+
+
+@pytest.mark.unit
+class TestFetchArrow:
+    """Test cases for fetch_arrow function."""
+
+    @staticmethod
+    def _mock_copy(mock_pooled, csv_text):
+        """Make the pooled cursor's COPY write csv_text into the caller's buffer."""
+        mock_conn = mock_pooled.return_value.__enter__.return_value
+        mock_conn.encoding = 'UTF8'
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.mogrify.return_value = b"SELECT 1"
+        mock_cursor.copy_expert.side_effect = lambda sql, buffer: buffer.write(csv_text.encode('utf-8'))
+        return mock_cursor
+
+    @patch('src.database.connection.pooled_connection')
+    def test_typed_columns(self, mock_pooled):
+        """Test COPY output is parsed into the requested Arrow types."""
+        mock_cursor = self._mock_copy(mock_pooled, '2011-01-01 08:26:00,WHITE MUG,2.55\n2011-01-02,,\n')
+
+        table = fetch_arrow(
+            "SELECT invoice_date, description, total FROM t WHERE country = %s",
+            ('France',),
+            {'invoice_date': pa.timestamp('ns'), 'description': pa.string(), 'total': pa.float64()}
+        )
+
+        assert table.column('total').to_pylist() == [2.55, None]
+        assert table.column('description').to_pylist() == ['WHITE MUG', None]
+        assert table.schema.field('invoice_date').type == pa.timestamp('ns')
+        mock_cursor.mogrify.assert_called_once_with(
+            "SELECT invoice_date, description, total FROM t WHERE country = %s", ('France',)
+        )
+        assert mock_cursor.copy_expert.call_args[0][0].startswith("COPY (SELECT 1) TO STDOUT")
+
+    @patch('src.database.connection.pooled_connection')
+    def test_quoted_empty_string_kept(self, mock_pooled):
+        """Test an empty string and NULL-like text stay distinct from NULL."""
+        self._mock_copy(mock_pooled, '""\n\nNA\nnull\n#N/A\n')
+
+        table = fetch_arrow("SELECT description FROM t", None, {'description': pa.string()})
+
+        assert table.column('description').to_pylist() == ['', None, 'NA', 'null', '#N/A']
+
+    @patch('src.database.connection.pooled_connection')
+    def test_null_like_text_kept_in_dictionary_column(self, mock_pooled):
+        """Test NULL-like text is not read as NULL in dictionary-encoded columns."""
+        self._mock_copy(mock_pooled, 'NA\n\nN/A\n')
+
+        table = fetch_arrow("SELECT country FROM t", None, {'country': pa.dictionary(pa.int32(), pa.string())})
+
+        assert table.column('country').to_pylist() == ['NA', None, 'N/A']
+
+    @patch('src.database.connection.pooled_connection')
+    def test_float_nan_kept_distinct_from_null(self, mock_pooled):
+        """Test PostgreSQL's NaN parses as NaN while an empty field is NULL."""
+        self._mock_copy(mock_pooled, 'NaN\n\n1.5\n')
+
+        table = fetch_arrow("SELECT total FROM t", None, {'total': pa.float64()})
+
+        values = table.column('total').to_pylist()
+        assert values[0] != values[0]
+        assert values[1:] == [None, 1.5]
+
+    @patch('src.database.connection.pooled_connection')
+    def test_empty_result(self, mock_pooled):
+        """Test a query with no rows returns an empty typed table."""
+        self._mock_copy(mock_pooled, '')
+
+        table = fetch_arrow("SELECT total FROM t", None, {'total': pa.float64()})
+
+        assert table.num_rows == 0
+        assert table.schema.field('total').type == pa.float64()
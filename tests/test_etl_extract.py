@@ -4,7 +4,7 @@ Unit tests for ETL extract module.
 import pytest
 import pandas as pd
 import os
-from src.etl.extract import extract_csv
+from src.etl.extract import extract_csv, extract_csv_chunks
 
 
 @pytest.mark.unit
@@ -75,3 +75,48 @@ class TestExtractCSV:
 
         df = extract_csv(str(csv_path), encoding='utf-8')
         assert len(df) == 1
+
+    def test_extract_csv_projects_and_types_columns(self, tmp_path):
+        """Test extra columns are dropped and identifiers stay strings."""
+        csv_path = tmp_path / "extra.csv"
+        csv_path.write_text(
+            "InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,Country,Notes\n"
+            "536365,85123A,Product,6,12/1/2010 8:26,2.55,17850,UK,ignored\n"
+            "C536379,22,,1,12/1/2010 9:41,1.25,,France,ignored\n"
+        )
+
+        df = extract_csv(str(csv_path))
+
+        assert 'Notes' not in df.columns
+        assert list(df['InvoiceNo']) == ['536365', 'C536379']
+        assert list(df['StockCode']) == ['85123A', '22']
+        assert df['Quantity'].dtype == 'int32'
+        assert pd.isna(df.loc[1, 'Description'])
+        assert pd.isna(df.loc[1, 'CustomerID'])
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+class TestExtractCSVChunks:
+    """Test cases for extract_csv_chunks function."""
+
+    def test_chunks_cover_all_rows(self, tmp_path, sample_raw_data):
+        """Test streamed chunks add up to the whole file."""
+        csv_path = tmp_path / "large.csv"
+        pd.concat([sample_raw_data] * 200, ignore_index=True).to_csv(csv_path, index=False)
+
+        chunks = list(extract_csv_chunks(str(csv_path), block_size=4096))
+
+        assert len(chunks) > 1
+        assert sum(len(chunk) for chunk in chunks) == 1000
+        assert all(
+            list(chunk.columns) == list(sample_raw_data.columns) for chunk in chunks
+        )
+
+    def test_chunks_missing_columns(self, tmp_path):
+        """Test header is validated before streaming starts."""
+        csv_path = tmp_path / "invalid.csv"
+        csv_path.write_text("InvoiceNo,StockCode\n123,ABC\n")
+
+        with pytest.raises(ValueError, match="CSV missing required columns"):
+            next(extract_csv_chunks(str(csv_path)))
@@ -1,10 +1,26 @@
 """
 Unit tests for ETL load module.
 """
+import struct
 import pytest
 import pandas as pd
+import psycopg2
 from unittest.mock import patch, MagicMock
-from src.etl.load import load_to_database
+from src.config.constants import DB_BATCH_SIZE, SALES_TRANSACTION_INDEXES
+from src.etl.load import (
+    load_to_database,
+    load_to_database_parallel,
+    load_csv_server_side,
+    deferred_sales_indexes,
+    refresh_materialized_views,
+    _encode_numeric,
+    _build_binary_copy_stream,
+    _prepare_frame,
+    _prepare_rows,
+    _iter_binary_copy,
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER
+)
 
 
 @pytest.mark.unit
@@ -26,8 +42,11 @@ class TestLoadToDatabase:
         # Verify rows inserted
         assert rows_inserted == len(sample_clean_data)
 
-        # Verify cursor execute was called for each row
-        assert mock_cursor.execute.call_count == len(sample_clean_data)
+        # Verify rows were sent with a single binary COPY
+        mock_cursor.copy_expert.assert_called_once()
+        copy_sql = mock_cursor.copy_expert.call_args[0][0]
+        assert 'FORMAT BINARY' in copy_sql
+        mock_cursor.execute.assert_called_once_with("SET LOCAL synchronous_commit = OFF")
 
         # Verify commit was called
         mock_conn.commit.assert_called_once()
@@ -82,8 +101,8 @@ class TestLoadToDatabase:
         load_to_database(data_with_none_desc)
 
         # Verify 'Unknown' was used for None description
-        call_args = mock_cursor.execute.call_args[0][1]
-        assert call_args[2] == 'Unknown'
+        stream = mock_cursor.copy_expert.call_args[0][1]
+        assert b'Unknown' in stream.read()
 
     @patch('src.etl.load.get_connection')
     def test_load_rollback_on_error(self, mock_get_conn, sample_clean_data):
@@ -94,7 +113,7 @@ class TestLoadToDatabase:
         mock_get_conn.return_value = mock_conn
 
         # Simulate database error
-        mock_cursor.execute.side_effect = Exception("Database error")
+        mock_cursor.copy_expert.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             load_to_database(sample_clean_data)
@@ -111,7 +130,7 @@ class TestLoadToDatabase:
         mock_get_conn.return_value = mock_conn
 
         # Simulate database error
-        mock_cursor.execute.side_effect = Exception("Database error")
+        mock_cursor.copy_expert.side_effect = Exception("Database error")
 
         with pytest.raises(Exception):
             load_to_database(sample_clean_data)
@@ -136,7 +155,7 @@ class TestLoadToDatabase:
         rows_inserted = load_to_database(empty_df)
 
         assert rows_inserted == 0
-        mock_cursor.execute.assert_not_called()
+        mock_cursor.copy_expert.assert_not_called()
         mock_conn.commit.assert_called_once()
 
     @patch('src.etl.load.get_connection')
@@ -162,3 +181,358 @@ class TestLoadToDatabase:
 
         rows_inserted = load_to_database(large_data)
         assert rows_inserted == 2500
+
+    @patch('src.etl.load.execute_values')
+    @patch('src.etl.load.get_connection')
+    def test_load_falls_back_to_execute_values(self, mock_get_conn, mock_execute_values, sample_clean_data):
+        """Test that a rejected COPY falls back to batched INSERTs."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value = mock_conn
+
+        mock_cursor.copy_expert.side_effect = psycopg2.DataError("bad copy data")
+
+        rows_inserted = load_to_database(sample_clean_data)
+
+        assert rows_inserted == len(sample_clean_data)
+        mock_conn.rollback.assert_called_once()
+        mock_execute_values.assert_called_once()
+        rows = mock_execute_values.call_args[0][2]
+        assert len(rows) == len(sample_clean_data)
+        assert mock_execute_values.call_args[1]['page_size'] == DB_BATCH_SIZE
+        mock_conn.commit.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_load_reuses_supplied_connection(self, mock_get_conn, sample_clean_data):
+        """Test that a caller-supplied connection is reused and left open."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+
+        load_to_database(sample_clean_data, conn=mock_conn)
+        load_to_database(sample_clean_data, conn=mock_conn)
+
+        mock_get_conn.assert_not_called()
+        assert mock_conn.commit.call_count == 2
+        mock_conn.close.assert_not_called()
+
+    @patch('src.etl.load.execute_values')
+    def test_load_does_not_fall_back_on_connection_error(self, mock_execute_values, sample_clean_data):
+        """Test that connection failures are raised so the caller can reconnect."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.copy_expert.side_effect = psycopg2.OperationalError("server closed the connection")
+
+        with pytest.raises(psycopg2.OperationalError):
+            load_to_database(sample_clean_data, conn=mock_conn)
+
+        mock_execute_values.assert_not_called()
+        mock_conn.close.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+@pytest.mark.database
+class TestLoadToDatabaseParallel:
+    """Test cases for load_to_database_parallel function."""
+
+    def _make_data(self, rows):
+        return pd.DataFrame({
+            'InvoiceNo': [f'{i}' for i in range(rows)],
+            'StockCode': ['ABC'] * rows,
+            'Description': ['Product'] * rows,
+            'Quantity': [1] * rows,
+            'InvoiceDate': pd.to_datetime(['2010-12-01'] * rows),
+            'UnitPrice': [10.0] * rows,
+            'CustomerID': [100.0] * rows,
+            'Country': ['UK'] * rows,
+            'TotalAmount': [10.0] * rows
+        })
+
+    @patch('src.etl.load.get_connection')
+    def test_parallel_uses_one_connection_per_shard(self, mock_get_conn):
+        """Test that each shard gets its own connection."""
+        mock_get_conn.side_effect = lambda: MagicMock()
+
+        rows_inserted = load_to_database_parallel(self._make_data(10), workers=3)
+
+        assert rows_inserted == 10
+        assert mock_get_conn.call_count == 3
+
+    def test_parallel_reuses_supplied_connections(self):
+        """Test that supplied connections are used round-robin and left open."""
+        connections = [MagicMock(), MagicMock()]
+
+        rows_inserted = load_to_database_parallel(self._make_data(5), connections=connections)
+
+        assert rows_inserted == 5
+        for conn in connections:
+            conn.cursor.return_value.copy_expert.assert_called_once()
+            conn.commit.assert_called_once()
+            conn.close.assert_not_called()
+
+    @patch('src.etl.load.get_connection')
+    def test_dropped_connection_replaced_and_shard_retried(self, mock_get_conn):
+        """Test a shard whose connection drops is reloaded once on a new connection."""
+        dropped, healthy, replacement = MagicMock(), MagicMock(), MagicMock()
+        dropped.cursor.return_value.copy_expert.side_effect = psycopg2.OperationalError(
+            "SSL connection has been closed unexpectedly"
+        )
+        mock_get_conn.return_value = replacement
+        connections = [dropped, healthy]
+
+        rows_inserted = load_to_database_parallel(self._make_data(5), connections=connections)
+
+        assert rows_inserted == 5
+        dropped.commit.assert_not_called()
+        dropped.close.assert_called_once()
+        healthy.cursor.return_value.copy_expert.assert_called_once()
+        replacement.cursor.return_value.copy_expert.assert_called_once()
+        replacement.commit.assert_called_once()
+        # The caller keeps the replacement for later chunks
+        assert connections == [replacement, healthy]
+
+    @patch('src.etl.load.get_connection')
+    def test_shard_retried_only_once(self, mock_get_conn):
+        """Test a second connection failure is raised to the caller."""
+        connections = [MagicMock()]
+        for conn in (connections[0], mock_get_conn.return_value):
+            conn.cursor.return_value.copy_expert.side_effect = psycopg2.InterfaceError("connection already closed")
+
+        with pytest.raises(psycopg2.InterfaceError):
+            load_to_database_parallel(self._make_data(2), connections=connections)
+
+        mock_get_conn.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_parallel_small_frame_uses_single_connection(self, mock_get_conn):
+        """Test that tiny frames are not sharded."""
+        mock_get_conn.return_value = MagicMock()
+
+        rows_inserted = load_to_database_parallel(self._make_data(2), workers=4)
+
+        assert rows_inserted == 2
+        mock_get_conn.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+class TestBinaryCopyEncoding:
+    """Test cases for the binary COPY encoder."""
+
+    def test_encode_numeric_fraction(self):
+        """Test NUMERIC encoding of a value with integer and fractional digits."""
+        encoded = _encode_numeric(255)
+        body = struct.pack('>hhHh', 2, 0, 0, 2) + struct.pack('>2H', 2, 5500)
+        assert encoded == struct.pack('>i', len(body)) + body
+
+    def test_encode_numeric_large_and_small(self):
+        """Test NUMERIC encoding across base-10000 digit boundaries."""
+        body = struct.pack('>hhHh', 1, 1, 0, 2) + struct.pack('>1H', 1)
+        assert _encode_numeric(1000000) == struct.pack('>i', len(body)) + body
+
+        body = struct.pack('>hhHh', 1, -1, 0, 2) + struct.pack('>1H', 500)
+        assert _encode_numeric(5) == struct.pack('>i', len(body)) + body
+
+    def test_encode_numeric_zero(self):
+        """Test NUMERIC encoding of zero."""
+        body = struct.pack('>hhHh', 0, 0, 0, 2)
+        assert _encode_numeric(0) == struct.pack('>i', len(body)) + body
+
+    def test_binary_stream_framing(self, sample_clean_data):
+        """Test that the COPY stream has the PGCOPY header, tuples and trailer."""
+        frame = _prepare_frame(sample_clean_data)
+        data = _build_binary_copy_stream(frame).read()
+
+        assert data.startswith(PGCOPY_HEADER)
+        assert data.endswith(PGCOPY_TRAILER)
+        assert data.count(struct.pack('>h', 9)) >= len(frame)
+
+    def test_binary_stream_is_sliced(self):
+        """Test that the payload is produced in bounded slices."""
+        frame = _prepare_frame(pd.DataFrame({
+            'InvoiceNo': [str(i) for i in range(500)],
+            'StockCode': ['ABC'] * 500,
+            'Description': ['Product'] * 500,
+            'Quantity': [1] * 500,
+            'InvoiceDate': pd.to_datetime(['2010-12-01'] * 500),
+            'UnitPrice': [10.0] * 500,
+            'CustomerID': [100.0] * 500,
+            'Country': ['UK'] * 500,
+            'TotalAmount': [10.0] * 500
+        }))
+
+        slices = list(_iter_binary_copy(frame, 'utf-8', chunk_bytes=1024))
+
+        assert len(slices) > 3
+        assert all(len(piece) < 2048 for piece in slices)
+        stream = _build_binary_copy_stream(frame)
+        assert b''.join(slices) == stream.read()
+
+    def test_prepare_rows_null_customer(self):
+        """Test that missing customer IDs become NULLs."""
+        df = pd.DataFrame({
+            'InvoiceNo': ['536365'],
+            'StockCode': ['85123A'],
+            'Description': ['PRODUCT A'],
+            'Quantity': [6],
+            'InvoiceDate': pd.to_datetime(['2010-12-01 08:26:00']),
+            'UnitPrice': [2.55],
+            'CustomerID': [float('nan')],
+            'Country': ['United Kingdom'],
+            'TotalAmount': [15.30]
+        })
+
+        rows = _prepare_rows(_prepare_frame(df))
+        assert rows[0][6] is None
+        assert rows[0][3] == 6
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+@pytest.mark.database
+class TestLoadCsvServerSide:
+    """Test cases for load_csv_server_side function."""
+
+    @patch('src.etl.load.get_connection')
+    def test_server_side_copies_raw_csv_and_cleans_in_sql(self, mock_get_conn, temp_csv_file):
+        """Test raw CSV is copied to staging and cleaned by INSERT ... SELECT."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 3
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value = mock_conn
+
+        result = load_csv_server_side(temp_csv_file)
+
+        assert result == 3
+        mock_cursor.copy_expert.assert_called_once()
+        copied_file = mock_cursor.copy_expert.call_args[0][1]
+        assert copied_file.name == temp_csv_file
+
+        insert_params = [
+            call[0][1] for call in mock_cursor.execute.call_args_list if len(call[0]) > 1
+        ]
+        assert insert_params == [('C%', 1, 0.01)]
+        mock_conn.commit.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_server_side_missing_columns(self, mock_get_conn, tmp_path):
+        """Test missing CSV columns are rejected before connecting."""
+        csv_path = tmp_path / "bad.csv"
+        csv_path.write_text("InvoiceNo,StockCode\n536365,85123A\n")
+
+        with pytest.raises(ValueError, match="missing required columns"):
+            load_csv_server_side(str(csv_path))
+
+        mock_get_conn.assert_not_called()
+
+    @patch('src.etl.load.get_connection')
+    def test_server_side_rollback_on_error(self, mock_get_conn, temp_csv_file):
+        """Test transaction is rolled back when the COPY fails."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.copy_expert.side_effect = psycopg2.DataError("bad row")
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value = mock_conn
+
+        with pytest.raises(psycopg2.DataError):
+            load_csv_server_side(temp_csv_file)
+
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+        mock_conn.close.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+@pytest.mark.database
+class TestDeferredSalesIndexes:
+    """Test cases for deferred_sales_indexes context manager."""
+
+    def _make_connection(self, has_rows):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (has_rows,)
+        mock_conn.cursor.return_value = mock_cursor
+        return mock_conn, mock_cursor
+
+    @patch('src.etl.load.get_connection')
+    def test_indexes_dropped_and_rebuilt_for_empty_table(self, mock_get_conn):
+        """Test indexes are dropped before and rebuilt after an initial load."""
+        mock_conn, mock_cursor = self._make_connection(has_rows=False)
+        mock_get_conn.return_value = mock_conn
+
+        with deferred_sales_indexes() as dropped:
+            assert dropped is True
+            # Existence check, DROP INDEX and SET UNLOGGED so far
+            assert mock_cursor.execute.call_count == 3
+
+        # SET LOGGED, maintenance_work_mem, one CREATE INDEX per index, ANALYZE
+        assert mock_cursor.execute.call_count == 3 + 2 + len(SALES_TRANSACTION_INDEXES) + 1
+        assert mock_conn.autocommit is True
+        mock_conn.close.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_indexes_kept_for_populated_table(self, mock_get_conn):
+        """Test indexes are left alone when the table already has rows."""
+        mock_conn, mock_cursor = self._make_connection(has_rows=True)
+        mock_get_conn.return_value = mock_conn
+
+        with deferred_sales_indexes() as dropped:
+            assert dropped is False
+
+        assert mock_cursor.execute.call_count == 1
+        mock_conn.close.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_indexes_rebuilt_when_load_fails(self, mock_get_conn):
+        """Test indexes are rebuilt even if the load raises."""
+        mock_conn, mock_cursor = self._make_connection(has_rows=False)
+        mock_get_conn.return_value = mock_conn
+
+        with pytest.raises(RuntimeError):
+            with deferred_sales_indexes():
+                raise RuntimeError("load failed")
+
+        assert mock_cursor.execute.call_count == 3 + 2 + len(SALES_TRANSACTION_INDEXES) + 1
+        mock_conn.close.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.etl
+@pytest.mark.database
+class TestRefreshMaterializedViews:
+    """Test cases for refresh_materialized_views function."""
+
+    @patch('src.etl.load.get_connection')
+    def test_refresh_commits(self, mock_get_conn):
+        """Test the refresh function is called and committed."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value = mock_conn
+
+        refresh_materialized_views()
+
+        mock_cursor.execute.assert_called_once_with("SELECT refresh_materialized_views()")
+        mock_conn.commit.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch('src.etl.load.get_connection')
+    def test_refresh_rollback_on_error(self, mock_get_conn):
+        """Test a failed refresh is rolled back and re-raised."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.execute.side_effect = psycopg2.ProgrammingError("missing view")
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value = mock_conn
+
+        with pytest.raises(psycopg2.ProgrammingError):
+            refresh_materialized_views()
+
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_called_once()
@@ -3,7 +3,7 @@ Unit tests for ETL transform module.
 """
 import pytest
 import pandas as pd
-from src.etl.transform import clean_sales_data
+from src.etl.transform import clean_sales_data, parse_invoice_dates
 
 
 @pytest.mark.unit
@@ -104,3 +104,45 @@ class TestCleanSalesData:
         # - Remove 1 zero price (536367 also has zero price)
         # Should have 3 valid rows
         assert len(df_clean) == 3
+
+
+    def test_clean_leaves_input_unchanged(self, sample_raw_data):
+        """Test cleaning returns a new frame and does not modify the input."""
+        original = sample_raw_data.copy()
+
+        df_clean = clean_sales_data(sample_raw_data)
+
+        pd.testing.assert_frame_equal(sample_raw_data, original)
+        assert 'TotalAmount' in df_clean.columns
+        assert list(df_clean.index) == [
+            i for i in original.index
+            if not str(original.loc[i, 'InvoiceNo']).startswith('C')
+            and original.loc[i, 'Quantity'] >= 1
+            and original.loc[i, 'UnitPrice'] >= 0.01
+        ]
+
+@pytest.mark.unit
+@pytest.mark.etl
+class TestParseInvoiceDates:
+    """Test cases for parse_invoice_dates function."""
+
+    def test_parse_source_export_format(self):
+        """Test month-first export timestamps are parsed."""
+        result = parse_invoice_dates(pd.Series(['12/1/2010 8:26', '12/9/2011 12:50']))
+
+        assert list(result) == [
+            pd.Timestamp('2010-12-01 08:26'), pd.Timestamp('2011-12-09 12:50')
+        ]
+
+    def test_parse_iso_format(self):
+        """Test ISO timestamps are parsed."""
+        result = parse_invoice_dates(pd.Series(['2010-12-01 08:26:00']))
+
+        assert result.iloc[0] == pd.Timestamp('2010-12-01 08:26:00')
+
+    def test_parse_falls_back_to_inference(self):
+        """Test unknown formats are still parsed."""
+        result = parse_invoice_dates(pd.Series(['2010-12-01']))
+
+        assert pd.api.types.is_datetime64_any_dtype(result)
+        assert result.iloc[0] == pd.Timestamp('2010-12-01')
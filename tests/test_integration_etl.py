@@ -3,6 +3,7 @@ Integration tests for ETL pipeline.
 """
 import pytest
 import pandas as pd
+import psycopg2
 from unittest.mock import patch, MagicMock
 from src.etl.extract import extract_csv
 from src.etl.transform import clean_sales_data
@@ -108,7 +109,7 @@ class TestETLPipeline:
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_get_conn.return_value = mock_conn
-        mock_cursor.execute.side_effect = Exception("Database error")
+        mock_cursor.copy_expert.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             load_to_database(df_clean)
@@ -136,3 +137,28 @@ class TestETLPipeline:
 
         # Valid date format
         assert pd.api.types.is_datetime64_any_dtype(df_clean['InvoiceDate'])
+
+    @patch('src.etl.load.get_connection')
+    @patch('scripts.run_etl.get_connection')
+    def test_chunked_load_survives_dropped_connection(self, mock_open_conn, mock_reconnect, temp_csv_file):
+        """Test a connection dropped mid-load is replaced and its rows loaded once."""
+        from scripts.run_etl import load_csv_in_chunks
+
+        dropped, healthy = MagicMock(), MagicMock()
+        dropped.cursor.return_value.copy_expert.side_effect = psycopg2.OperationalError(
+            "server closed the connection unexpectedly"
+        )
+        mock_open_conn.side_effect = [dropped, healthy]
+        replacement = mock_reconnect.return_value
+
+        with patch('scripts.run_etl.DB_COPY_WORKERS', 2):
+            rows_inserted = load_csv_in_chunks(temp_csv_file)
+
+        assert rows_inserted == 3
+        dropped.commit.assert_not_called()
+        dropped.close.assert_called_once()
+        mock_reconnect.assert_called_once()
+        replacement.cursor.return_value.copy_expert.assert_called_once()
+        # The replacement is closed with the other connections at the end
+        replacement.close.assert_called_once()
+        healthy.close.assert_called_once()
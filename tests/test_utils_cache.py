@@ -0,0 +1,91 @@
+"""
+Unit tests for the analytics result cache.
+"""
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from src.utils.cache import ttl_cache, clear_all_caches
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test cases for ttl_cache decorator."""
+
+    def test_cached_result_reused(self):
+        """Test repeated calls within the TTL run the function once."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def query(limit=10):
+            calls.append(limit)
+            return limit * 2
+
+        assert query(5) == 10
+        assert query(5) == 10
+        assert query(limit=5) == 10
+        assert query(6) == 12
+        assert calls == [5, 5, 6]
+
+    def test_expired_result_recomputed(self):
+        """Test calls after the TTL run the function again."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def query():
+            calls.append(1)
+            return len(calls)
+
+        with patch('src.utils.cache.time.monotonic', side_effect=[0.0, 61.0, 61.0]):
+            assert query() == 1
+            assert query() == 2
+
+    def test_dataframe_copy_returned(self):
+        """Test callers cannot mutate the cached DataFrame."""
+        @ttl_cache(seconds=60)
+        def query():
+            return pd.DataFrame({'value': [1, 2]})
+
+        first = query()
+        first.loc[0, 'value'] = 99
+
+        assert query().loc[0, 'value'] == 1
+
+    def test_shared_dataframe_without_copy(self):
+        """Test copy=False hands back the cached DataFrame itself."""
+        @ttl_cache(seconds=60, copy=False)
+        def query():
+            return pd.DataFrame({'value': [1, 2]})
+
+        assert query() is query()
+
+    def test_invalidate_single_entry(self):
+        """Test cache_invalidate recomputes only the given call."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def query(limit):
+            calls.append(limit)
+            return limit * 2
+
+        query(5)
+        query(6)
+        query.cache_invalidate(5)
+        query(5)
+        query(6)
+
+        assert calls == [5, 6, 5]
+
+    def test_clear_all_caches(self):
+        """Test clear_all_caches drops every cached result."""
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def query():
+            calls.append(1)
+            return len(calls)
+
+        query()
+        clear_all_caches()
+        query()
+
+        assert len(calls) == 2
@@ -0,0 +1,22 @@
+"""
+Unit tests for export utilities.
+"""
+import pytest
+import pandas as pd
+from src.utils.export import export_to_csv
+
+
+@pytest.mark.unit
+class TestExportToCSV:
+    """Test cases for export_to_csv function."""
+
+    def test_export_returns_utf8_bytes(self):
+        """Test CSV export produces UTF-8 encoded bytes."""
+        df = pd.DataFrame({'product': ['CAFÉ MUG', 'TEA SET'], 'revenue': [10.5, 3.0]})
+
+        csv_data = export_to_csv(df, filename='products.csv')
+
+        assert isinstance(csv_data, bytes)
+        assert csv_data.decode('utf-8').splitlines() == [
+            'product,revenue', 'CAFÉ MUG,10.5', 'TEA SET,3.0'
+        ]
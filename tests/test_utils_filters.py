@@ -0,0 +1,81 @@
+"""
+Unit tests for dataframe filtering utilities.
+"""
+import pytest
+import pandas as pd
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+from src.utils.filters import filter_dataframe, get_available_products
+
+
+@pytest.fixture
+def daily_revenue():
+    """Daily revenue rows ordered by date."""
+    return pd.DataFrame({
+        'date': pd.date_range('2011-01-01', periods=10, freq='D'),
+        'country': ['United Kingdom', 'France'] * 5,
+        'revenue': range(10)
+    })
+
+
+@pytest.mark.unit
+class TestFilterDataframe:
+    """Test cases for filter_dataframe function."""
+
+    def test_filter_date_range_inclusive(self, daily_revenue):
+        """Test both date bounds are inclusive."""
+        result = filter_dataframe(
+            daily_revenue, start_date=datetime(2011, 1, 3), end_date=datetime(2011, 1, 5)
+        )
+
+        assert list(result['revenue']) == [2, 3, 4]
+
+    def test_filter_unsorted_matches_sorted(self, daily_revenue):
+        """Test unsorted input gives the same rows as sorted input."""
+        shuffled = daily_revenue.sample(frac=1, random_state=0)
+
+        result = filter_dataframe(
+            shuffled, start_date=datetime(2011, 1, 3), end_date=datetime(2011, 1, 5)
+        )
+
+        assert sorted(result['revenue']) == [2, 3, 4]
+
+    def test_filter_open_ended_range(self, daily_revenue):
+        """Test a single bound keeps everything on the other side."""
+        result = filter_dataframe(daily_revenue, start_date=datetime(2011, 1, 8))
+
+        assert list(result['revenue']) == [7, 8, 9]
+
+    def test_filter_dates_and_countries(self, daily_revenue):
+        """Test date and country filters combine."""
+        result = filter_dataframe(
+            daily_revenue, end_date=datetime(2011, 1, 4), countries=['France']
+        )
+
+        assert list(result['revenue']) == [1, 3]
+
+    def test_filter_without_filters_returns_input(self, daily_revenue):
+        """Test no filters returns the input rows without copying."""
+        result = filter_dataframe(daily_revenue)
+
+        assert result is daily_revenue
+
+
+@pytest.mark.unit
+class TestGetAvailableProducts:
+    """Test cases for get_available_products function."""
+
+    @patch('src.utils.filters.pooled_connection')
+    def test_limit_passed_as_parameter(self, mock_pooled):
+        """Test the limit is bound as a query parameter, not formatted into SQL."""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [('WHITE MUG',), ('RED MUG',)]
+        mock_conn = mock_pooled.return_value.__enter__.return_value
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        products = get_available_products(limit=2)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'LIMIT %s' in query
+        assert params == (2,)
+        assert products == ['WHITE MUG', 'RED MUG']